@@ -0,0 +1,82 @@
+# Data Acquisition Benchmark
+# Sequential versus concurrent mirror downloads from a local HTTP server
+# with a fixed per-response latency. Correctness (resume, If-Range,
+# checksums, retries, OHLCV appends) is covered by tests/test_acquire.py
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from data.acquire import acquire, mirror_sources
+
+LATENCY = 0.2  # Seconds per response, so concurrency shows up in wall time
+
+class Stub:
+    """Files served by the fake mirror, and how many requests overlap"""
+    files = {}  # name -> bytes
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with Stub.lock:
+            Stub.in_flight += 1
+            Stub.max_in_flight = max(Stub.max_in_flight, Stub.in_flight)
+        try:
+            time.sleep(LATENCY)
+            body = Stub.files.get(self.path.lstrip('/'))
+            self.send_response(200 if body is not None else 404)
+            self.send_header('Content-Length', str(len(body or b'')))
+            self.end_headers()
+            self.wfile.write(body or b'')
+        finally:
+            with Stub.lock:
+                Stub.in_flight -= 1
+
+def benchmark(base, directory, count, concurrency):
+    Stub.files = {f"bench{i}.csv": b"x" * 100_000 for i in range(count)}
+    print(f"{count} files, {LATENCY * 1000:.0f} ms latency each")
+    for limit in (1, concurrency):
+        target = directory / f"bench-{limit}"
+        Stub.max_in_flight = 0
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            acquire(mirror_sources(base, target, names=list(Stub.files), checksums=False),
+                    concurrency=limit)
+        seconds = time.perf_counter() - start
+        print(f"  concurrency {limit:>2}: {seconds:6.2f}s (max {Stub.max_in_flight} requests in flight)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sequential vs concurrent downloads from a local stub server")
+    parser.add_argument('--files', type=int, default=16)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print("="*80)
+    print("DATA ACQUISITION BENCHMARK")
+    print("="*80)
+    with tempfile.TemporaryDirectory() as directory:
+        benchmark(base, Path(directory), args.files, args.concurrency)
+    server.shutdown()
@@ -0,0 +1,87 @@
+# Model Artifact Warm-Start Benchmark
+# Time for a fresh interpreter to go from nothing to a prediction for the
+# latest bar: refitting the model versus loading its stored artifact
+# (memory-mapped scaler and weights; sklearn only for non-linear models).
+# That both predict alike is checked by tests/test_artifacts.py
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+REPEAT = 5
+
+def cold_start(mode, model):
+    """Run in a fresh interpreter: seconds until the first prediction"""
+    start = time.perf_counter()
+    import numpy as np
+    from features.feature_store import FeatureStore
+    from models.artifacts import latest_artifact
+    from models.baseline import FEATURE_STORE
+
+    artifact = latest_artifact(model=model)
+    features = artifact.features
+    if mode == 'artifact':
+        predict = artifact.predict
+    else:
+        # Refit the same candidate on the same rows, as before artifacts existed
+        from features.build_features import MODEL_FEATURES
+        from models.artifacts import cached_dataset
+        from models.train import build_estimator
+        X, y, _ = cached_dataset(artifact.spec['target'])
+        rows = artifact.manifest['rows']
+        columns = [MODEL_FEATURES.index(f) for f in features]
+        estimator = build_estimator(model, artifact.manifest['params'])
+        estimator.fit(X[:rows][:, columns], y[:rows])
+        predict = estimator.predict
+
+    # Latest bar straight from the typed feature store
+    store = FeatureStore(FEATURE_STORE)
+    row = np.array([[store.column(name)[-1] for name in features]])
+    prediction = int(predict(row)[0])
+    return {'seconds': time.perf_counter() - start, 'prediction': prediction,
+            'modules': len(sys.modules)}
+
+def measure(mode, model):
+    times = []
+    for _ in range(REPEAT):
+        output = subprocess.run([sys.executable, __file__, '--cold', mode, model],
+                                check=True, capture_output=True, text=True).stdout
+        times.append(json.loads(output))
+    return min(times, key=lambda r: r['seconds'])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold-start time: refit vs stored artifact")
+    parser.add_argument('--models', nargs='+', default=['lr', 'rf'])
+    parser.add_argument('--cold', nargs=2, metavar=('MODE', 'MODEL'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold:
+        print(json.dumps(cold_start(*args.cold)))
+        sys.exit(0)
+
+    from models.artifacts import latest_artifact
+
+    print("="*80)
+    print(f"MODEL WARM-START BENCHMARK (best of {REPEAT} fresh interpreters)")
+    print("="*80)
+    print(f"{'model':<7}{'refit s':>10}{'artifact s':>12}{'speedup':>9}{'modules':>16}")
+    print("-" * 60)
+    for model in args.models:
+        if latest_artifact(model=model) is None:
+            print(f"{model:<7} no fresh latest artifact - run: "
+                  f"python src/models/train.py --models {model} --feature-sets all")
+            continue
+        refit = measure('refit', model)
+        stored = measure('artifact', model)
+        print(f"{model:<7}{refit['seconds']:>10.3f}{stored['seconds']:>12.3f}"
+              f"{refit['seconds'] / stored['seconds']:>8.1f}x"
+              f"{refit['modules']:>8} -> {stored['modules']:<5}")
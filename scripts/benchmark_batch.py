@@ -0,0 +1,58 @@
+# Batch Feature Benchmark
+# Symbols per second of the batch engine for a synthetic universe at
+# 1, 2, 4, ... workers up to the core count
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_features import synthetic_prices
+from features.batch import build_universe, matrix_sources
+from features.feature_store import days_to_date
+
+def worker_counts(limit):
+    counts = [1]
+    while counts[-1] * 2 <= limit:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != limit:
+        counts.append(limit)
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch feature engine throughput")
+    parser.add_argument('--symbols', type=int, default=64)
+    parser.add_argument('--rows', type=int, default=10_000, help="longest series; others are ragged")
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    # Ragged universe: series end on the same day but start at different ones
+    dates = [days_to_date(d) for d in range(args.rows)]
+    matrix = []
+    for i in range(args.symbols):
+        length = args.rows - (i * args.rows) // (2 * args.symbols)
+        matrix.append([float('nan')] * (args.rows - length) + synthetic_prices(length, seed=i))
+    sources = matrix_sources([f"SYM{i:03d}" for i in range(args.symbols)], dates, matrix)
+    total_rows = sum(len(prices) for _, prices in sources.values())
+
+    print(f"Universe: {args.symbols} symbols, {total_rows:,} rows, {os.cpu_count()} cores")
+    print(f"{'workers':>8}{'seconds':>10}{'symbols/s':>12}{'rows/s':>14}{'speedup':>9}")
+    print("-" * 53)
+    base = None
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in worker_counts(args.max_workers):
+            start = time.perf_counter()
+            build_universe(sources, directory, workers=workers)
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            print(f"{workers:>8}{elapsed:>10.2f}{args.symbols / elapsed:>12.1f}"
+                  f"{total_rows / elapsed:>14,.0f}{base / elapsed:>8.2f}x")
@@ -0,0 +1,49 @@
+# Columnar Backend Benchmark
+# Times the NumPy feature backend against the pure-Python list indicators
+# (parity is checked by tests/test_columnar.py)
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.build_features import compute_features
+from features import columnar
+from benchmark_features import synthetic_prices
+
+SIZES = [10_000, 100_000, 1_000_000]
+def run_benchmark(sizes):
+    print("="*80)
+    print("COLUMNAR BACKEND BENCHMARK")
+    print("="*80)
+    print(f"{'rows':>12}{'list (s)':>12}{'numpy (s)':>12}{'speedup':>10}")
+    print("-" * 46)
+
+    for n in sizes:
+        prices = synthetic_prices(n)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            compute_features(prices)
+        list_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columnar.compute_features(prices)
+        array_time = time.perf_counter() - start
+
+        speedup = list_time / array_time if array_time else float('inf')
+        print(f"{n:>12,}{list_time:>12.3f}{array_time:>12.3f}{speedup:>9.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the NumPy feature backend")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    args = parser.parse_args()
+    run_benchmark(args.sizes)
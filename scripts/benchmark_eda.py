@@ -0,0 +1,109 @@
+# Streaming EDA Benchmark
+# Checks the one-pass EDA statistics against exact in-memory ones and
+# reports time and peak resident memory as the history grows
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_features import synthetic_prices
+from features.feature_store import days_to_date
+
+SIZES = [10_000, 100_000, 1_000_000, 5_000_000]
+
+def exact_report(prices):
+    """The statistics of the original in-memory eda_analysis.py"""
+    n = len(prices)
+    ordered = sorted(prices)
+    mean = sum(prices) / n
+    returns = [(prices[i] - prices[i-1]) / prices[i-1] * 100 for i in range(1, n)]
+    mean_return = sum(returns) / len(returns)
+    q1, q3 = ordered[n // 4], ordered[3 * n // 4]
+    iqr = q3 - q1
+    correct = sum(1 for i in range(1, n - 1)
+                  if (prices[i+1] > prices[i]) == (prices[i] > prices[i-1]))
+    return {
+        'mean': mean,
+        'median': ordered[n // 2],
+        'std': (sum((x - mean) ** 2 for x in prices) / n) ** 0.5,
+        'mean_return': mean_return,
+        'return_std': (sum((r - mean_return) ** 2 for r in returns) / len(returns)) ** 0.5,
+        'q1': q1,
+        'q3': q3,
+        'outliers': sum(1 for p in prices if p < q1 - 1.5 * iqr or p > q3 + 1.5 * iqr),
+        'persistence_accuracy': correct / (n - 2) * 100,
+    }
+
+# Runs in a fresh interpreter so its peak RSS is the streaming pass alone
+STREAM_RUN = """
+import json, resource, sys, time
+sys.path.insert(0, sys.argv[2])
+from data.stream_stats import analyze, stream_closes
+start = time.perf_counter()
+report = analyze(stream_closes(sys.argv[1]))
+report['seconds'] = time.perf_counter() - start
+try:
+    # VmHWM is this process's own peak; ru_maxrss can carry the parent's over fork
+    with open('/proc/self/status') as f:
+        peak = next(int(line.split()[1]) for line in f if line.startswith('VmHWM'))
+except OSError:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+report['peak_mb'] = peak / 1024
+print(json.dumps(report))
+"""
+
+def stream_report(path):
+    """Streaming report plus wall time and peak RSS of a separate process"""
+    output = subprocess.run([sys.executable, '-c', STREAM_RUN, str(path), str(SRC_DIR)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+def write_prices(path, prices):
+    """One price per minute, so large sizes stay within a realistic calendar"""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Date', 'Close'])
+        writer.writerows((f"{days_to_date(i // 1440)} {i // 60 % 24:02d}:{i % 60:02d}", price)
+                         for i, price in enumerate(prices))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming EDA parity and memory")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--reference-max', type=int, default=1_000_000,
+                        help="largest size also checked against the exact report")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}{'file MB':>9}{'seconds':>9}{'RSS MB':>9}  max relative error vs exact")
+    print("-" * 80)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "prices.csv"
+        for n in args.sizes:
+            # Same total variance as ten years of daily closes at any row count
+            prices = synthetic_prices(n, sigma=0.015 * (2520 / n) ** 0.5)
+            write_prices(path, prices)
+            exact = exact_report(prices) if n <= args.reference_max else None
+            del prices
+
+            report = stream_report(path)
+            if exact:
+                outliers = exact.pop('outliers')
+                errors = {k: abs(report[k] - v) / max(abs(v), 1e-12) for k, v in exact.items()}
+                worst = max(errors, key=errors.get)
+                check = (f"{errors[worst]:.2e} ({worst}), "
+                         f"outliers {report['outliers']} vs {outliers}")
+            else:
+                check = "-"
+            print(f"{n:>10,}{os.path.getsize(path) / 1e6:>9.1f}{report['seconds']:>9.2f}"
+                  f"{report['peak_mb']:>9.1f}  {check}")
@@ -0,0 +1,71 @@
+# Feature CSV Export Benchmark
+# Throughput of the block-formatted export against the original per-row
+# csv.DictWriter loop (byte equality is checked by tests/test_export.py).
+# Float repr dominates both, so the bulk path gains most from one worker
+# per CPU
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_regression import gbm_ohlcv
+from features import columnar
+from features.build_features import write_csv
+from features.feature_store import days_to_date
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+def reference_write_csv(dates, features, path):
+    """The original export: one 14-key dict and one writerow() per row"""
+    names = list(features)
+    columns = {name: features[name].tolist() if hasattr(features[name], 'tolist') else list(features[name])
+               for name in names}
+
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['date'] + names)
+        writer.writeheader()
+
+        for i in range(len(dates)):
+            row = {name: columns[name][i] for name in names}
+            row['date'] = dates[i]
+            writer.writerow(row)
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Feature CSV export throughput")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    args = parser.parse_args()
+
+    print("="*80)
+    print(f"FEATURE CSV EXPORT BENCHMARK ({os.cpu_count()} CPUs formatting blocks)")
+    print("="*80)
+    print(f"{'rows':>10}{'DictWriter s':>14}{'bulk s':>10}{'speedup':>9}{'gzip s':>9}{'gzip MB':>9}")
+    print("-" * 80)
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        for n in args.sizes:
+            bars = gbm_ohlcv(n)
+            dates = [days_to_date(d) for d in bars['days'].tolist()]
+            features = columnar.compute_features(bars['close'])
+
+            reference = timed(reference_write_csv, dates, features, directory / "reference.csv")
+            bulk = timed(write_csv, dates, features, directory / "bulk.csv")
+            gzipped = timed(write_csv, dates, features, directory / "bulk.csv.gz")
+            print(f"{n:>10,}{reference:>14.3f}{bulk:>10.3f}{reference / bulk:>8.1f}x{gzipped:>9.3f}"
+                  f"{os.path.getsize(directory / 'bulk.csv.gz') / 1e6:>9.1f}")
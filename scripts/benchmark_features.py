@@ -0,0 +1,105 @@
+# Feature Engine Benchmark
+# Times the rolling indicator functions from 10k to 10M rows against the
+# original window-recompute implementations (parity is checked by
+# tests/test_rolling.py)
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.build_features import (
+    calculate_sma, calculate_rsi, calculate_bollinger_bands, calculate_volatility
+)
+
+SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+def synthetic_prices(n, seed=42, start=15.0, sigma=0.015):
+    """Geometric random walk shaped like daily silver closes"""
+    rng = random.Random(seed)
+    prices = []
+    price = start
+    for _ in range(n):
+        price *= math.exp(rng.gauss(0, sigma))
+        prices.append(price)
+    return prices
+
+# Reference implementations: O(n*window), one window recomputed per row
+
+def reference_sma(prices, window):
+    return [0.0 if i < window - 1 else sum(prices[i-window+1:i+1]) / window
+            for i in range(len(prices))]
+
+def reference_rsi(prices, period=14):
+    rsi = []
+    for i in range(len(prices)):
+        if i < period:
+            rsi.append(50.0)
+            continue
+        changes = [prices[j] - prices[j-1] for j in range(i-period+1, i+1)]
+        avg_gain = sum(c for c in changes if c > 0) / period
+        avg_loss = sum(-c for c in changes if c <= 0) / period
+        rsi.append(100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss))
+    return rsi
+
+def reference_std(prices, window):
+    out = []
+    for i in range(len(prices)):
+        if i < window - 1:
+            out.append(0.0)
+            continue
+        w = prices[i-window+1:i+1]
+        mean = sum(w) / window
+        out.append((sum((p - mean) ** 2 for p in w) / window) ** 0.5)
+    return out
+
+def reference_bollinger(prices, window=20):
+    std = reference_std(prices, window)
+    sma = reference_sma(prices, window)
+    return [0.0 if i < window - 1 or std[i] == 0 else (prices[i] - sma[i]) / std[i]
+            for i in range(len(prices))]
+
+CASES = [
+    ('sma_50', lambda p: calculate_sma(p, 50), lambda p: reference_sma(p, 50)),
+    ('rsi_14', lambda p: calculate_rsi(p, 14), lambda p: reference_rsi(p, 14)),
+    ('bollinger_20', lambda p: calculate_bollinger_bands(p, 20), lambda p: reference_bollinger(p, 20)),
+    ('volatility_30', lambda p: calculate_volatility(p, 30), lambda p: reference_std(p, 30)),
+]
+
+def run_benchmark(sizes, reference_max):
+    print("="*80)
+    print("FEATURE ENGINE BENCHMARK")
+    print("="*80)
+    print(f"{'indicator':<15}{'rows':>12}{'rolling (s)':>14}{'rows/s':>14}{'reference (s)':>16}")
+    print("-" * 71)
+
+    for n in sizes:
+        prices = synthetic_prices(n)
+        for name, fast, reference in CASES:
+            start = time.perf_counter()
+            fast(prices)
+            elapsed = time.perf_counter() - start
+
+            ref_time = '-'
+            if n <= reference_max:
+                start = time.perf_counter()
+                reference(prices)
+                ref_time = f"{time.perf_counter() - start:.3f}"
+
+            print(f"{name:<15}{n:>12,}{elapsed:>14.3f}{n / elapsed:>14,.0f}{ref_time:>16}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the rolling feature engine")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--reference-max', type=int, default=100_000,
+                        help="largest size to also run the reference implementation on")
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.reference_max)
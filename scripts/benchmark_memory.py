@@ -0,0 +1,109 @@
+# Feature Table Memory Benchmark
+# Resident memory of the in-memory feature representations as rows grow:
+# the original CSV dict rows and FeatureStore.rows() dicts, the list
+# columns of the pure-Python engine, and the compact FeatureTable
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(Path(__file__).parent))
+
+SIZES = [100_000, 1_000_000]
+
+# Representation -> how it is loaded from a store directory
+KINDS = {
+    'csv_dict_rows': "list of csv.DictReader rows (original baseline.py)",
+    'store_dict_rows': "FeatureStore.rows(): one dict of typed values per row",
+    'list_columns': "dict of Python float lists (pure-Python engine output)",
+    'feature_table': "FeatureStore.table(): float32 indicators and int8 target copied,\n"
+                     "                    float64 price columns left memory-mapped until read",
+    'feature_table_read': "the same table after every column has been read once",
+}
+
+def rss_mb():
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith('VmRSS')) / 1024
+
+def load(kind, directory):
+    """Build one representation of the store in this process"""
+    import csv
+    from features.feature_store import FeatureStore
+    store = FeatureStore(directory)
+    if kind == 'csv_dict_rows':
+        with open(Path(directory) / "features.csv", 'r') as f:
+            return list(csv.DictReader(f))
+    if kind == 'store_dict_rows':
+        return store.rows()
+    if kind == 'list_columns':
+        return {name: column.tolist() for name, column in store.columns().items()}
+    if kind == 'feature_table':
+        return store.table()
+    if kind == 'feature_table_read':
+        table = store.table()
+        for column in table.columns.values():
+            sum(column[::512])  # Touch every page of the mapped columns
+        return table
+    raise ValueError(f"Unknown representation: {kind}")
+
+def measure(kind, directory):
+    """RSS added by holding one representation (run in a fresh interpreter)"""
+    import features.feature_store  # Import cost is not the representation's
+    gc.collect()
+    before = rss_mb()
+    data = load(kind, directory)
+    gc.collect()
+    return {'kind': kind, 'mb': rss_mb() - before}
+
+def build_store(directory, n):
+    """Synthetic features for n weekday bars, plus their CSV export"""
+    from benchmark_regression import gbm_ohlcv
+    from features import columnar
+    from features.feature_store import FeatureStore, days_to_date, save_features
+    bars = gbm_ohlcv(n)
+    features = columnar.compute_features(bars['close'])
+    save_features(directory, [days_to_date(d) for d in bars['days'].tolist()], features)
+    FeatureStore(directory).to_csv(Path(directory) / "features.csv")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RSS of the in-memory feature representations")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--kinds', nargs='+', default=list(KINDS), choices=list(KINDS))
+    parser.add_argument('--measure', nargs=2, metavar=('KIND', 'STORE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(*args.measure)))
+        sys.exit(0)
+
+    print("="*80)
+    print("FEATURE TABLE MEMORY BENCHMARK")
+    print("="*80)
+    for kind in args.kinds:
+        print(f"  {kind:<17} {KINDS[kind]}")
+    print(f"\n{'rows':>10}  {'representation':<17}{'RSS MB':>10}{'bytes/row':>11}{'vs CSV rows':>14}")
+    print("-" * 62)
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            build_store(directory, n)
+            reference = None
+            for kind in args.kinds:
+                output = subprocess.run([sys.executable, __file__, '--measure', kind, directory],
+                                        check=True, capture_output=True, text=True).stdout
+                result = json.loads(output)
+                if kind == 'csv_dict_rows':
+                    reference = result['mb']
+                ratio = "-"
+                if reference and result['mb'] > 0 and kind != 'csv_dict_rows':
+                    ratio = f"{reference / result['mb']:.1f}x less"
+                print(f"{n:>10,}  {kind:<17}{result['mb']:>10.1f}{result['mb'] * 1048576 / n:>11.0f}{ratio:>14}")
+        print("-" * 62)
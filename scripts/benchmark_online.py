@@ -0,0 +1,58 @@
+# Online Inference Latency Benchmark
+# Reports per-update latency of the streaming predictor against the
+# ModelCard's <1s real-time inference budget
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from models.online import StreamingPredictor
+from benchmark_features import synthetic_prices
+
+LATENCY_BUDGET_US = 1_000_000  # ModelCard: < 1 second
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def run_benchmark(history, updates):
+    prices = synthetic_prices(history + updates)
+    dates = [f"bar-{i}" for i in range(len(prices))]
+
+    start = time.perf_counter()
+    predictor = StreamingPredictor.from_history(dates[:history], prices[:history])
+    seed_ms = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    for date, price in zip(dates[history:], prices[history:]):
+        start = time.perf_counter_ns()
+        predictor.update(date, price)
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+    latencies.sort()
+
+    p50 = percentile(latencies, 50)
+    p99 = percentile(latencies, 99)
+    print("="*80)
+    print("ONLINE INFERENCE LATENCY")
+    print("="*80)
+    print(f"Seeded from {history:,} bars in {seed_ms:.2f} ms")
+    print(f"Updates timed: {updates:,}")
+    print(f"  p50: {p50:.1f} µs")
+    print(f"  p99: {p99:.1f} µs")
+    print(f"  max: {latencies[-1]:.1f} µs")
+    print(f"Budget (<1s): {'✅ MET' if p99 < LATENCY_BUDGET_US else '❌ EXCEEDED'}")
+    return p99 < LATENCY_BUDGET_US
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time single-bar streaming predictions")
+    parser.add_argument('--history', type=int, default=2_500)
+    parser.add_argument('--updates', type=int, default=100_000)
+    args = parser.parse_args()
+    sys.exit(0 if run_benchmark(args.history, args.updates) else 1)
@@ -0,0 +1,253 @@
+# Benchmark Regression Suite
+# Times every hot path on seeded synthetic OHLCV data (no downloads needed)
+# and saves the timings as a baseline; tests/test_benchmarks.py fails when
+# a later run is slower
+#
+#   python scripts/benchmark_regression.py --save      record the baseline
+#   python scripts/benchmark_regression.py             compare and report
+#   python -m pytest tests --benchmarks                 the regression check
+#
+# Cases: each feature function (pure-Python and NumPy backends), the CSV
+# parser and typed loader (cold and cached), the features CSV writer used
+# by engineer_features, and the baseline/rule evaluators. Each case is run
+# `--repeat` times with the garbage collector off and the fastest run is
+# kept. Timings are machine specific, so the baseline lives under data/
+# rather than in git.
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+BASELINE_FILE = BASE_DIR / "data" / "benchmarks" / "baseline.json"
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from data.loader import cache_dir, load_table, parse_csv
+from features import build_features, columnar
+from features.feature_store import days_to_date
+from models import evaluate
+from models.baseline import baseline_moving_average_crossover, baseline_naive_persistence
+
+SIZES = [1_000, 100_000, 1_000_000]
+THRESHOLD = 0.25       # Fail when a case is more than 25% slower...
+MIN_DELTA = 0.002      # ...and at least 2 ms slower (timer noise on tiny cases)
+LIST_MAX_ROWS = 1_000_000   # Largest size for the pure-Python paths
+CSV_MAX_ROWS = 2_000_000    # Weekday dates run past year 9999 beyond ~2.6M bars
+CYCLE_BARS = 2_520          # Ten years of trading days per GBM cycle
+CASE_BUDGET = 10.0          # Seconds of repeats per case before settling for fewer runs
+
+def gbm_closes(n, seed=42, start=15.0, mu=0.0, sigma=0.015, cycle=CYCLE_BARS):
+    """Seeded geometric Brownian motion closes (daily silver-like volatility).
+
+    A free GBM path over millions of bars under- or overflows float64, so
+    each full `cycle` of log returns is re-centred to sum to zero: the path
+    returns to `start` every cycle (a chain of Brownian bridges), and `mu`
+    only shapes the trailing partial cycle.
+    """
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(mu - sigma ** 2 / 2, sigma, n)
+    full = n // cycle * cycle
+    if full:
+        cycles = steps[:full].reshape(-1, cycle)
+        cycles -= cycles.mean(axis=1, keepdims=True)  # Log returns of each cycle sum to 0
+    log_path = np.cumsum(steps)
+    return start * np.exp(log_path)
+
+def gbm_ohlcv(n, seed=42, start=15.0, mu=0.0, sigma=0.015):
+    """Weekday bars: epoch-day dates plus open/high/low/close/volume arrays"""
+    close = gbm_closes(n, seed, start, mu, sigma)
+    rng = np.random.default_rng(seed + 1)
+    open_ = np.concatenate(([start], close[:-1]))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, sigma / 2, n)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, sigma / 2, n)))
+    volume = np.round(rng.lognormal(15, 0.5, n))
+    # Weekdays only, starting Monday 1970-01-05 (epoch day 4)
+    index = np.arange(n)
+    days = 4 + (index // 5) * 7 + index % 5
+    return {'days': days, 'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume}
+
+def write_ohlcv_csv(path, bars, block=100_000):
+    """Write bars in the raw Kaggle layout (Date,Price,Close,High,Low,Open,Volume)"""
+    with open(path, 'w') as f:
+        f.write("Date,Price,Close,High,Low,Open,Volume\n")
+        for lo in range(0, len(bars['days']), block):
+            hi = lo + block
+            rows = zip(bars['days'][lo:hi].tolist(), bars['close'][lo:hi].tolist(),
+                       bars['high'][lo:hi].tolist(), bars['low'][lo:hi].tolist(),
+                       bars['open'][lo:hi].tolist(), bars['volume'][lo:hi].tolist())
+            f.write("".join(f"{days_to_date(d)},{c!r},{c!r},{h!r},{l!r},{o!r},{v!r}\n"
+                            for d, c, h, l, o, v in rows))
+
+def best_time(function, repeat, budget=CASE_BUDGET):
+    """Fastest of up to `repeat` runs, in seconds.
+
+    As in timeit, the garbage collector is off while timing, so a
+    collection triggered by an earlier case's leftovers is not billed to
+    this one. A fast first run is discarded as warm-up (imports, first-touch
+    allocation, sidecar caches); slow cases stop repeating once they have
+    used `budget` seconds.
+    """
+    enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        function()
+        first = time.perf_counter() - start
+        best, spent, runs = (first, first, 1) if first > 1.0 else (float('inf'), 0.0, 0)
+        while runs < repeat and (runs == 0 or spent < budget):
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+            best, spent, runs = min(best, elapsed), spent + elapsed, runs + 1
+    finally:
+        if enabled:
+            gc.enable()
+    return best
+
+FEATURE_CASES = [
+    ('returns', 'calculate_returns', ()),
+    ('sma_20', 'calculate_sma', (20,)),
+    ('rsi_14', 'calculate_rsi', (14,)),
+    ('bb_distance_20', 'calculate_bollinger_bands', (20,)),
+    ('momentum_5', 'calculate_momentum', (5,)),
+    ('volatility_30', 'calculate_volatility', (30,)),
+    ('lag_7', 'calculate_lag', (7,)),
+    ('target', 'create_target', ()),
+]
+
+def cases(n, workdir, list_max=LIST_MAX_ROWS, csv_max=CSV_MAX_ROWS):
+    """(name, function) for every case that applies at size n"""
+    closes = gbm_closes(n)
+    prices = closes.tolist() if n <= list_max else None
+
+    for label, function, args in FEATURE_CASES:
+        fast = getattr(columnar, function)
+        yield f"numpy.{label}", lambda f=fast, a=args: f(closes, *a)
+        if prices is not None:
+            slow = getattr(build_features, function)
+            yield f"list.{label}", lambda f=slow, a=args: f(prices, *a)
+
+    if n > csv_max:
+        return  # Beyond this only the NumPy feature functions are timed
+
+    features = columnar.compute_features(closes)
+    target = features['target']
+    bounds = evaluate.split_bounds(n)
+    blocks = [evaluate.persistence_rule(target, bounds)]
+    blocks += evaluate.sma_crossover_rules({5: features['sma_5'], 20: features['sma_20']})
+    yield "evaluate.rules", lambda: evaluate.evaluate_rules(target, blocks, bounds)
+
+    if prices is not None:
+        rows = [{'target': t, 'sma_5': a, 'sma_20': b}
+                for t, a, b in zip(target.tolist(), features['sma_5'].tolist(), features['sma_20'].tolist())]
+        yield "baseline.naive_persistence", lambda: baseline_naive_persistence(rows)
+        yield "baseline.ma_crossover", lambda: baseline_moving_average_crossover(rows)
+        del rows
+
+    raw = workdir / f"ohlcv_{n}.csv"
+    bars = gbm_ohlcv(n)
+    write_ohlcv_csv(raw, bars)
+    dates = [days_to_date(d) for d in bars['days'].tolist()]
+    del bars
+
+    def load_cold():
+        shutil.rmtree(cache_dir(raw), ignore_errors=True)
+        return load_table(raw)
+
+    yield "load.parse_csv", lambda: parse_csv(raw)
+    yield "load.table_cold", load_cold
+    yield "load.table_cached", lambda: load_table(raw)
+    yield "load.load_prices", lambda: build_features.load_prices(raw)
+    yield "write.features_csv", lambda: build_features.write_csv(dates, features, workdir / "features.csv")
+
+def run_suite(sizes, repeat, only=(), list_max=LIST_MAX_ROWS, csv_max=CSV_MAX_ROWS):
+    """{"case@rows": seconds} for every case and size"""
+    timings = {}
+    print(f"{'case':<30}{'rows':>12}{'seconds':>12}{'rows/s':>16}")
+    print("-" * 70)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            for name, function in cases(n, Path(tmp), list_max, csv_max):
+                if only and not any(pattern in name for pattern in only):
+                    continue
+                with contextlib.redirect_stdout(io.StringIO()):
+                    seconds = best_time(function, repeat)
+                timings[f"{name}@{n}"] = seconds
+                print(f"{name:<30}{n:>12,}{seconds:>12.4f}{n / seconds:>16,.0f}")
+    return timings
+
+def compare(timings, baseline, threshold=THRESHOLD):
+    """Cases slower than the baseline by more than the threshold"""
+    print(f"\n{'case':<42}{'baseline':>11}{'now':>11}{'change':>10}")
+    print("-" * 74)
+    regressions = []
+    for key, seconds in timings.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        change = seconds / before - 1
+        slower = change > threshold and seconds - before > MIN_DELTA
+        if slower:
+            regressions.append(key)
+        print(f"{key:<42}{before:>11.4f}{seconds:>11.4f}{change * 100:>+9.0f}%{'  ❌' if slower else ''}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hot-path benchmark suite with a saved baseline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                        help="bar counts, e.g. 1000 100000 1000000 50000000")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per case (the fastest is kept)")
+    parser.add_argument('--only', nargs='+', default=[], metavar='PATTERN', help="cases containing these strings")
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE)
+    parser.add_argument('--save', action='store_true', help="record these timings as the baseline")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="allowed slowdown as a fraction (default 0.25 = 25%%)")
+    parser.add_argument('--list-max', type=int, default=LIST_MAX_ROWS,
+                        help="largest size for the pure-Python feature and baseline paths")
+    parser.add_argument('--csv-max', type=int, default=CSV_MAX_ROWS,
+                        help="largest size for the loader, writer and evaluator cases")
+    args = parser.parse_args()
+
+    print("="*80)
+    print("BENCHMARK REGRESSION SUITE")
+    print("="*80)
+    timings = run_suite(args.sizes, args.repeat, args.only, args.list_max, min(args.csv_max, CSV_MAX_ROWS))
+
+    if args.save:
+        saved = {}
+        if args.baseline.exists():
+            with open(args.baseline, 'r') as f:
+                saved = json.load(f).get('timings', {})
+        saved.update(timings)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                       'saved': time.strftime('%Y-%m-%dT%H:%M:%S'), 'timings': saved}, f, indent=1)
+        print(f"\n✅ Saved {len(timings)} timings to: {args.baseline}")
+        sys.exit(0)
+
+    if not args.baseline.exists():
+        print(f"\n⚠️ No baseline at {args.baseline} (run with --save first)")
+        sys.exit(0)
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)['timings']
+    regressions = compare(timings, baseline, args.threshold)
+    print("-" * 74)
+    if regressions:
+        print(f"⚠️ {len(regressions)} case(s) more than {args.threshold:.0%} slower: {', '.join(regressions)}")
+    else:
+        print(f"✅ No case more than {args.threshold:.0%} slower than the baseline")
@@ -0,0 +1,92 @@
+# Scoring Service Benchmark
+# Many concurrent clients against the scoring daemon (in-process, over
+# local HTTP and over a Unix socket), with and without micro-batching
+# (answers are checked against a direct predict() by tests/test_serve.py)
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.feature_store import days_to_date
+from models.serve import ScoringClient, ScoringService, make_server
+
+def run_clients(service, transport, clients, requests, address=None):
+    """Each client thread asks for `requests` stored dates; returns (seconds, answers)"""
+    dates = [days_to_date(day) for day in sorted(service.rows_by_day)]
+    answers = [[] for _ in range(clients)]
+    errors = []
+    barrier = threading.Barrier(clients + 1)
+
+    def client(index):
+        connection = ScoringClient(address) if transport != 'in-process' else None
+        barrier.wait()
+        try:
+            for k in range(requests):
+                request = {'date': dates[(index * requests + k) % len(dates)]}
+                result = service.score(request) if connection is None else connection.predict(request)
+                answers[index].append((request['date'], result['direction']))
+        except Exception as error:
+            errors.append(error)
+        finally:
+            if connection is not None:
+                connection.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return time.perf_counter() - start, [a for per_client in answers for a in per_client]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scoring daemon throughput and latency")
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=50, help="requests per client")
+    parser.add_argument('--transports', nargs='+', default=['in-process', 'tcp', 'unix'],
+                        choices=['in-process', 'tcp', 'unix'])
+    args = parser.parse_args()
+
+    print("="*80)
+    print(f"SCORING SERVICE BENCHMARK ({args.clients} clients x {args.requests} requests)")
+    print("="*80)
+    with tempfile.TemporaryDirectory() as directory:
+        for transport in args.transports:
+            for max_batch in (1, 64):
+                # No deadline here: unbatched runs are expected to queue far past 1s
+                service = ScoringService(max_batch=max_batch, timeout=None)
+                server, address = None, None
+                if transport != 'in-process':
+                    unix = str(Path(directory) / "scoring.sock") if transport == 'unix' else None
+                    server = make_server(service, port=0, unix_socket=unix)
+                    address = unix or f"127.0.0.1:{server.server_address[1]}"
+                    threading.Thread(target=server.serve_forever, daemon=True).start()
+                try:
+                    seconds, answers = run_clients(service, transport, args.clients, args.requests, address)
+                finally:
+                    if server is not None:
+                        server.shutdown()
+                        server.server_close()
+                    service.close()
+
+                metrics = service.metrics()
+                latency, batch = metrics['latency_ms'], metrics['batch_size']
+                print(f"{transport:<11} max_batch {max_batch:>3}: {len(answers) / seconds:>8,.0f} req/s  "
+                      f"queue->result p50 {latency['p50']}ms p99 {latency['p99']}ms  "
+                      f"mean batch {batch['mean']:.1f}")
+            print(f"{'':<11} batch sizes: {batch['buckets']}")
+            print(f"{'':<11} queue depth at batch start: p50 {metrics['queue_depth_at_batch']['p50']}, "
+                  f"p99 {metrics['queue_depth_at_batch']['p99']}")
+    print(f"Model: {service.model_name}")
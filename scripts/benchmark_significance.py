@@ -0,0 +1,94 @@
+# Resampling Significance Benchmark
+# 10k block-bootstrap + 10k block-permutation replicates of directional
+# accuracy over a decade of synthetic bars: a replicate-at-a-time loop
+# versus the vectorized index-matrix engine, single and multi-process.
+# Also reports how often no-skill signals get p < 0.05 (expect ~5%);
+# worker-count independence is checked by tests/test_significance.py
+
+import argparse
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from models.significance import default_block_length, resample_accuracy
+
+BARS = 2520  # Ten years of trading days
+
+def synthetic(rng, models, bars=BARS):
+    """Up/down labels of a random walk and crossover-like signals with no skill"""
+    actual = (rng.standard_normal(bars) > 0).astype(np.int8)
+    walks = np.cumsum(rng.standard_normal((models, bars + 20)), axis=1)
+    fast = np.stack([np.convolve(w, np.ones(5) / 5, 'valid')[15:] for w in walks])
+    slow = np.stack([np.convolve(w, np.ones(20) / 20, 'valid') for w in walks])
+    return (fast[:, :bars] > slow[:, :bars]).astype(np.int8), actual
+
+def loop_bootstrap(predictions, actual, replicates, block, seed=0):
+    """One replicate at a time: draw blocks, concatenate, score every model"""
+    rng = np.random.default_rng(seed)
+    n = len(actual)
+    hits = np.concatenate([predictions == actual, (predictions == actual)[:, :block]], axis=1)
+    out = np.empty((len(predictions), replicates))
+    for r in range(replicates):
+        rows = np.concatenate([np.arange(s, s + block) for s in rng.integers(0, n, math.ceil(n / block))])[:n]
+        out[:, r] = hits[:, rows].mean(axis=1) * 100
+    return out
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bootstrap/permutation engine throughput")
+    parser.add_argument('--models', type=int, default=6)
+    parser.add_argument('--replicates', type=int, default=10_000)
+    parser.add_argument('--loop-replicates', type=int, default=1_000,
+                        help="replicates timed for the loop (extrapolated)")
+    parser.add_argument('--calibration', type=int, default=200, help="no-skill series for the p-value check")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    predictions, actual = synthetic(rng, args.models)
+    block = default_block_length(BARS)
+    cores = os.cpu_count() or 1
+
+    print("="*80)
+    print(f"SIGNIFICANCE BENCHMARK ({args.models} models x {BARS} bars, blocks of {block}, "
+          f"{args.replicates:,} replicates)")
+    print("="*80)
+
+    seconds, _ = timed(loop_bootstrap, predictions, actual, args.loop_replicates, block)
+    loop = seconds * args.replicates / args.loop_replicates
+    print(f"{'loop (bootstrap only)':<30}{loop:>8.2f}s  (extrapolated from {args.loop_replicates:,})")
+
+    single, results = timed(resample_accuracy, predictions, actual, args.replicates, workers=1)
+    print(f"{'vectorized, 1 worker':<30}{single:>8.2f}s  {loop / single:>6.1f}x  (bootstrap + permutation)")
+    if cores > 1:
+        parallel, _ = timed(resample_accuracy, predictions, actual, args.replicates, workers=cores)
+        print(f"{f'vectorized, {cores} workers':<30}{parallel:>8.2f}s  {loop / parallel:>6.1f}x")
+
+    print("-" * 80)
+    for i, result in enumerate(results[:3]):
+        print(f"model {i}: {result['accuracy']:.2f}% [{result['ci_low']:.2f}, {result['ci_high']:.2f}] "
+              f"p = {result['p_value']:.4f}")
+
+    # No-skill signals: p < 0.05 should come up about 5% of the time
+    if args.calibration:
+        calibration_rng = np.random.default_rng(11)
+        rejected = 0
+        for _ in range(math.ceil(args.calibration / args.models)):
+            signals, labels = synthetic(calibration_rng, args.models)
+            rejected += sum(r['p_value'] < 0.05 for r in
+                            resample_accuracy(signals, labels, 1_000, workers=1))
+        runs = math.ceil(args.calibration / args.models) * args.models
+        print(f"No-skill signals with p < 0.05: {rejected}/{runs} ({rejected / runs:.1%}, expect ~5%)")
@@ -0,0 +1,82 @@
+# CLI Startup Benchmark
+# Fresh-interpreter startup of each `silverforecast <command> --help`
+# under `python -X importtime`: wall time, total import time and which
+# heavy libraries got imported, against the notebook-style eager import
+# of pandas/NumPy/sklearn at the top of every script
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+CLI = SRC_DIR / "silverforecast.py"
+
+REPEAT = 5
+HEAVY = ('numpy', 'pandas', 'sklearn', 'scipy', 'joblib', 'matplotlib', 'seaborn')
+
+def parse_importtime(stderr):
+    """(total import ms, heavy packages imported) from -X importtime output"""
+    total_us, heavy = 0, set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip().split(".")[0] in HEAVY:
+            heavy.add(name.strip().split(".")[0])
+        # Nested imports are indented; top-level cumulative times add up to the total
+        if len(name) - len(name.lstrip()) == 1:
+            total_us += int(cumulative)
+    return total_us / 1000, sorted(heavy)
+
+def measure(command):
+    """Best of REPEAT fresh interpreters: (wall ms, import ms, heavy packages)"""
+    runs = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime'] + command,
+                                capture_output=True, text=True, cwd=BASE_DIR)
+        wall = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(command)} failed:\n{result.stderr[-2000:]}")
+        runs.append((wall,) + parse_importtime(result.stderr))
+    return min(runs)
+
+def eager_imports():
+    """The import block the phase scripts used to start with, minus what's not installed"""
+    modules = []
+    for name in ('pandas', 'numpy', 'sklearn.linear_model', 'sklearn.ensemble',
+                 'matplotlib.pyplot', 'seaborn'):
+        probe = subprocess.run([sys.executable, '-c', f"import {name}"], capture_output=True)
+        if probe.returncode == 0:
+            modules.append(name)
+    return modules
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup time of each silverforecast command")
+    parser.add_argument('--commands', nargs='+',
+                        default=['inspect', 'eda', 'features', 'baseline', 'train', 'pipeline'])
+    args = parser.parse_args()
+
+    print("="*80)
+    print(f"CLI STARTUP BENCHMARK (--help, best of {REPEAT} fresh interpreters)")
+    print("="*80)
+    print(f"{'command':<22}{'wall ms':>9}{'import ms':>11}  heavy imports")
+    print("-" * 80)
+    bare = measure(['-c', 'pass'])
+    print(f"{'python (no-op)':<22}{bare[0]:>9.0f}{bare[1]:>11.0f}  -")
+    top = measure([str(CLI), '--help'])
+    print(f"{'silverforecast':<22}{top[0]:>9.0f}{top[1]:>11.0f}  {', '.join(top[2]) or '-'}")
+    for command in args.commands:
+        wall, imports, heavy = measure([str(CLI), command, '--help'])
+        print(f"{command:<22}{wall:>9.0f}{imports:>11.0f}  {', '.join(heavy) or '-'}")
+
+    modules = eager_imports()
+    if modules:
+        eager = measure(['-c', "; ".join(f"import {m}" for m in modules)])
+        print("-" * 80)
+        print(f"{'eager script imports':<22}{eager[0]:>9.0f}{eager[1]:>11.0f}  {', '.join(eager[2])}")
+        print(f"   ({', '.join(modules)})")
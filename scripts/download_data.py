@@ -1,37 +1,60 @@
 # Data Collection Script
-# Downloads silver price dataset from Kaggle
-
-import os
-import subprocess
-
-# Dataset details
-DATASET = "muhammadaammartufail/silver-prices-10-year-data-and-2026-forecast"
-OUTPUT_DIR = "../data/raw"
-
-def download_dataset():
-    """Download dataset using Kaggle API"""
-    
-    # Ensure output directory exists
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    # Download using kaggle CLI
-    cmd = f"kaggle datasets download -d {DATASET} -p {OUTPUT_DIR} --unzip"
-    
-    print(f"Downloading {DATASET}...")
-    print(f"Command: {cmd}")
-    print("\nNote: Requires Kaggle API credentials (~/.kaggle/kaggle.json)")
-    print("Get your API key from: https://www.kaggle.com/account")
-    
-    try:
-        subprocess.run(cmd, shell=True, check=True)
+# Downloads silver price dataset from Kaggle, or refreshes data/raw from a
+# mirror and daily OHLCV endpoints (see src/data/acquire.py)
+
+import argparse
+import sys
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "src"))
+
+from data.acquire import (KAGGLE_DATASET, RAW_DIR, YAHOO_URL, KaggleDataset, acquire,
+                          mirror_sources, ohlcv_sources)
+
+def download_dataset(mirror=None, symbols=(), ohlcv_url=YAHOO_URL, concurrency=4, retries=3,
+                     checksums=True, output=RAW_DIR):
+    """Fetch every requested source concurrently; True if all succeeded"""
+    output = Path(output)
+    sources = []
+    if mirror:
+        sources += mirror_sources(mirror, output, checksums=checksums)
+    if symbols:
+        sources += ohlcv_sources(symbols, output / "universe", url_template=ohlcv_url)
+    if not sources:
+        print(f"Downloading {KAGGLE_DATASET}...")
+        print("\nNote: Requires Kaggle API credentials (~/.kaggle/kaggle.json)")
+        print("Get your API key from: https://www.kaggle.com/account")
+        sources.append(KaggleDataset(directory=output))
+
+    results = acquire(sources, concurrency, retries)
+    if all(status == 'ok' for _, status, _, _ in results):
         print("\n✅ Download complete!")
-        print(f"Files saved to: {OUTPUT_DIR}/")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Download failed: {e}")
-        print("\nManual download instructions:")
-        print(f"1. Go to: https://www.kaggle.com/datasets/{DATASET}")
-        print("2. Click 'Download' button")
-        print(f"3. Extract ZIP to: {OUTPUT_DIR}/")
+        print(f"Files saved to: {output}/")
+        return True
+
+    print("\n❌ Download failed")
+    print("\nManual download instructions:")
+    print(f"1. Go to: https://www.kaggle.com/datasets/{KAGGLE_DATASET}")
+    print("2. Click 'Download' button")
+    print(f"3. Extract ZIP to: {RAW_DIR}/")
+    return False
 
 if __name__ == "__main__":
-    download_dataset()
+    parser = argparse.ArgumentParser(description="Download the raw silver price data")
+    parser.add_argument('--mirror', metavar='URL',
+                        help="base URL serving the raw CSVs with .sha256 sidecars (instead of Kaggle)")
+    parser.add_argument('--no-checksums', action='store_true', help="the mirror has no .sha256 sidecars")
+    parser.add_argument('--symbols', nargs='+', default=[],
+                        help="also append new daily bars for these tickers to data/raw/universe/")
+    parser.add_argument('--ohlcv-url', default=YAHOO_URL,
+                        help="OHLCV endpoint template with {symbol}, {period1}, {period2}")
+    parser.add_argument('--output', type=Path, default=RAW_DIR, help="raw data directory")
+    parser.add_argument('--concurrency', type=int, default=4, help="downloads in flight at once")
+    parser.add_argument('--retries', type=int, default=3, help="retries per source on transient errors")
+    args = parser.parse_args()
+
+    ok = download_dataset(args.mirror, args.symbols, args.ohlcv_url, args.concurrency, args.retries,
+                          not args.no_checksums, args.output)
+    sys.exit(0 if ok else 1)
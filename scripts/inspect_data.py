@@ -1,17 +1,29 @@
 # Data Inspection & Quality Assessment Script
 # Phase 1: Silver Price Dataset Analysis
 
-import pandas as pd
-import numpy as np
+import argparse
+import sys
 from pathlib import Path
 
 # File paths
-DATA_RAW = Path("../data/raw")
+BASE_DIR = Path(__file__).parent.parent
+DATA_RAW = BASE_DIR / "data" / "raw"
 HISTORICAL_FILE = DATA_RAW / "silver_prices_data.csv"
 FORECAST_FILE = DATA_RAW / "silver_price_forecast_2026.csv"
 
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from pipeline.trace import entry_point
+
+@entry_point('inspect')
 def inspect_data():
     """Load and inspect both CSV files"""
+    # Only this phase needs pandas (and the loader's NumPy); keeps `--help` fast
+    import pandas as pd
+    from data.loader import load_table
+    from data.validate import load_report, print_summary, report_path
     
     print("="*80)
     print("PHASE 1: DATA COLLECTION & QUALITY ASSESSMENT")
@@ -20,7 +32,10 @@ def inspect_data():
     # Load historical data
     print("\n1. HISTORICAL DATA (2016-2026)")
     print("-" * 80)
-    df_hist = pd.read_csv(HISTORICAL_FILE)
+    table = load_table(HISTORICAL_FILE)
+    df_hist = table.to_frame()
+    if table.skipped:
+        print(f"Rows skipped (unparseable date): {table.skipped}")
     print(f"Shape: {df_hist.shape}")
     print(f"\nColumns: {list(df_hist.columns)}")
     print(f"\nFirst 5 rows:\n{df_hist.head()}")
@@ -71,6 +86,12 @@ def inspect_data():
         outliers = ((df_hist['Close'] < (Q1 - 1.5 * IQR)) | (df_hist['Close'] > (Q3 + 1.5 * IQR))).sum()
         print(f"\nOutliers (Close price, IQR method): {outliers} ({outliers/len(df_hist)*100:.2f}%)")
     
+    # Row-level checks (dates, prices, spikes, calendar gaps)
+    print("\n\n5. ROW-LEVEL VALIDATION")
+    print("-" * 80)
+    print_summary(load_report(HISTORICAL_FILE))
+    print(f"Report: {report_path(HISTORICAL_FILE)}")
+    
     print("\n" + "="*80)
     print("✅ Data inspection complete!")
     print("="*80)
@@ -78,4 +99,5 @@ def inspect_data():
     return df_hist, df_forecast
 
 if __name__ == "__main__":
+    argparse.ArgumentParser(description="Phase 1: inspect the raw CSVs and report data quality").parse_args()
     df_historical, df_forecast = inspect_data()
@@ -0,0 +1,368 @@
+# Data Acquisition
+# Silver Price Forecasting - Concurrent, resumable downloads into data/raw
+#
+# Each source adapter brings one part of the raw store up to date:
+#   HttpFile        a whole file from an HTTP server or mirror, resumed with
+#                   Range requests after a dropped connection and verified
+#                   against a SHA-256 before it replaces the old copy
+#   OhlcvEndpoint   a Yahoo-style daily OHLCV CSV endpoint; only the dates
+#                   after the last stored bar are requested and appended
+#   KaggleDataset   the original Kaggle dataset, through the kaggle CLI
+# fetch_all() runs the adapters on one asyncio loop with a bound on
+# concurrent downloads; the blocking HTTP and file I/O of each adapter
+# runs in a worker thread. Transient failures (connection errors, 5xx/429,
+# truncated bodies, checksum mismatches) are retried with exponential
+# backoff; a partial download is kept and resumed on the next attempt.
+# The command-line entry point is scripts/download_data.py.
+
+import asyncio
+import csv
+import hashlib
+import http.client
+import io
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+RAW_DIR = BASE_DIR / "data" / "raw"
+UNIVERSE_DIR = RAW_DIR / "universe"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.feature_store import date_to_days, days_to_date
+
+KAGGLE_DATASET = "muhammadaammartufail/silver-prices-10-year-data-and-2026-forecast"
+RAW_FILES = ["silver_prices_data.csv", "silver_price_forecast_2026.csv"]
+RAW_HEADER = ['Date', 'Price', 'Close', 'High', 'Low', 'Open', 'Volume']
+YAHOO_URL = ("https://query1.finance.yahoo.com/v7/finance/download/{symbol}"
+             "?period1={period1}&period2={period2}&interval=1d&events=history")
+
+CHUNK_BYTES = 1 << 20
+TIMEOUT = 30  # Seconds per request
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+USER_AGENT = "SilverForecast/1.0"
+SECONDS_PER_DAY = 86400
+
+class ChecksumError(Exception):
+    """A completed download does not match its expected SHA-256"""
+
+class IncompleteDownload(Exception):
+    """The server closed the connection before the whole body arrived"""
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _request(url, headers=None):
+    request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT, **(headers or {})})
+    return urllib.request.urlopen(request, timeout=TIMEOUT)
+
+def _read_all(response):
+    """Whole body, or IncompleteDownload if it is shorter than Content-Length"""
+    try:
+        return response.read()
+    except http.client.IncompleteRead as error:
+        raise IncompleteDownload(f"got {len(error.partial)} bytes, {error.expected} missing") from None
+
+def is_retryable(error):
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in RETRYABLE_STATUS
+    return isinstance(error, (urllib.error.URLError, ConnectionError, TimeoutError,
+                              http.client.HTTPException, IncompleteDownload, ChecksumError,
+                              subprocess.CalledProcessError))
+
+def _retry_after(error):
+    """Seconds a 429/503 response asked us to wait, if any"""
+    value = getattr(error, 'headers', None) and error.headers.get('Retry-After')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+class HttpFile:
+    """One file from an HTTP server or mirror, resumable and checksummed.
+
+    The body is streamed to <path>.part; after a dropped connection the
+    next attempt asks for the remaining bytes with a Range request (a
+    server that ignores Range just sends the whole file again). The ETag
+    or Last-Modified of the response the .part came from is kept in
+    <path>.part.validator and sent as If-Range, so a file changed on the
+    server is sent whole instead of being spliced onto the old part. With
+    neither a validator nor a checksum the download starts over. The file
+    replaces `path` only once complete and, if a checksum is known (given,
+    or read from `checksum_url`), verified. Without a checksum, an existing
+    file is only re-downloaded if the server reports it modified.
+    """
+
+    def __init__(self, url, path, sha256=None, checksum_url=None):
+        self.url = url
+        self.path = Path(path)
+        self.sha256 = sha256
+        self.checksum_url = checksum_url
+        self.name = self.path.name
+
+    def expected_checksum(self):
+        if self.sha256 is None and self.checksum_url:
+            with _request(self.checksum_url) as response:
+                self.sha256 = _read_all(response).decode().split()[0].lower()
+        return self.sha256
+
+    def fetch(self):
+        expected = self.expected_checksum()
+        headers = {}
+        if self.path.exists():
+            if expected and sha256_file(self.path) == expected:
+                return "up to date (checksum)"
+            if not expected:
+                headers['If-Modified-Since'] = formatdate(self.path.stat().st_mtime, usegmt=True)
+
+        part = self.path.with_name(self.path.name + ".part")
+        validator = part.with_name(part.name + ".validator")
+        offset = part.stat().st_size if part.exists() else 0
+        if offset and validator.exists():
+            headers['If-Range'] = validator.read_text().strip()
+        elif offset and not expected:
+            offset = 0  # Nothing tells us the .part is from the current version
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+        try:
+            response = _request(self.url, headers)
+        except urllib.error.HTTPError as error:
+            if error.code == 304:
+                return "up to date (not modified)"
+            if error.code == 416 and offset:
+                return self._finish(part, expected, f"resumed at {offset:,} bytes")  # .part was complete
+            raise
+
+        with response:
+            resumed = response.status == 206
+            if resumed and not response.headers.get('Content-Range', '').startswith(f"bytes {offset}-"):
+                raise IncompleteDownload(f"unexpected Content-Range {response.headers.get('Content-Range')}")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if not resumed:
+                self._save_validator(validator, response.headers)
+            length = response.headers.get('Content-Length')
+            with open(part, 'ab' if resumed else 'wb') as f:
+                start = f.tell()
+                try:
+                    for block in iter(lambda: response.read(CHUNK_BYTES), b''):
+                        f.write(block)
+                except http.client.IncompleteRead as error:
+                    f.write(error.partial)
+                    length = length or -1
+                # Keep what arrived; the next attempt asks for the rest
+                if length is not None and f.tell() - start != int(length):
+                    raise IncompleteDownload(f"connection dropped after {f.tell():,} bytes")
+            modified = response.headers.get('Last-Modified')
+
+        result = self._finish(part, expected, f"resumed at {offset:,} bytes" if resumed else "downloaded")
+        if modified and not expected:
+            stamp = parsedate_to_datetime(modified).timestamp()
+            os.utime(self.path, (stamp, stamp))
+        return result
+
+    @staticmethod
+    def _save_validator(path, headers):
+        """Keep the strong ETag (else Last-Modified) of a full response for If-Range"""
+        etag = headers.get('ETag')
+        value = etag if etag and not etag.startswith('W/') else headers.get('Last-Modified')
+        if value:
+            path.write_text(value)
+        elif path.exists():
+            path.unlink()
+
+    def _finish(self, part, expected, how):
+        validator = part.with_name(part.name + ".validator")
+        if expected and sha256_file(part) != expected:
+            part.unlink()
+            validator.unlink(missing_ok=True)
+            raise ChecksumError(f"{self.name}: SHA-256 mismatch")
+        size = part.stat().st_size
+        os.replace(part, self.path)
+        validator.unlink(missing_ok=True)
+        return f"{how}, {size:,} bytes"
+
+def last_csv_date(path):
+    """Date of the last row of a CSV (None if it has no data rows)"""
+    with open(path, 'rb') as f:
+        end = f.seek(0, 2)
+        pos, data = end, b''
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+            lines = data.rstrip(b'\r\n').split(b'\n')
+            if len(lines) > 1 or pos == 0:
+                break
+    row = next(csv.reader([lines[-1].decode()]), None) if lines else None
+    try:
+        return days_to_date(date_to_days(row[0]))
+    except (TypeError, ValueError, IndexError):
+        return None  # Only a header
+
+class OhlcvEndpoint:
+    """Daily bars for one symbol from a Yahoo-style CSV endpoint.
+
+    Only bars after the last date already in `path` are requested, and
+    only rows with later dates are appended (in the file's own column
+    order), so the raw store grows append-only. The append is a single
+    write that is rolled back if it fails part-way.
+    """
+
+    def __init__(self, symbol, path, url_template=YAHOO_URL, start='2016-01-01'):
+        self.symbol = symbol
+        self.path = Path(path)
+        self.url_template = url_template
+        self.start = start
+        self.name = symbol
+
+    def fetch(self):
+        last = last_csv_date(self.path) if self.path.exists() else None
+        first_day = date_to_days(last) + 1 if last else date_to_days(self.start)
+        today = int(time.time()) // SECONDS_PER_DAY
+        if first_day > today:
+            return "up to date"
+        url = self.url_template.format(symbol=self.symbol, period1=first_day * SECONDS_PER_DAY,
+                                       period2=(today + 1) * SECONDS_PER_DAY)
+        with _request(url) as response:
+            body = _read_all(response).decode()
+
+        bars = {}
+        for row in csv.DictReader(io.StringIO(body)):
+            try:
+                day = date_to_days(row.get('Date') or '')
+                float(row['Close'])  # Yahoo sends "null" for days without a close
+            except (ValueError, TypeError, KeyError):
+                continue
+            if day >= first_day:
+                bars[day] = row
+        if not bars:
+            return "up to date"
+        return f"+{self._append(bars):,} bars to {last or 'new file'}"
+
+    def _append(self, bars):
+        exists = self.path.exists() and self.path.stat().st_size > 0
+        if exists:
+            with open(self.path, 'r', newline='') as f:
+                header = next(csv.reader(f))
+        else:
+            header = RAW_HEADER
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        if not exists:
+            writer.writerow(header)
+        for day in sorted(bars):
+            row = dict(bars[day], Date=days_to_date(day))
+            row.setdefault('Price', row['Close'])
+            writer.writerow([row.get(name, '') for name in header])
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a+b') as f:
+            size = f.seek(0, 2)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b'\n':
+                    buffer = io.StringIO("\n" + buffer.getvalue())  # Last row had no line ending
+            try:
+                f.write(buffer.getvalue().encode())
+                f.flush()
+                os.fsync(f.fileno())
+            except BaseException:
+                f.truncate(size)
+                raise
+        return len(bars)
+
+class KaggleDataset:
+    """The original dataset via the kaggle CLI (needs ~/.kaggle/kaggle.json)"""
+
+    def __init__(self, dataset=KAGGLE_DATASET, directory=RAW_DIR):
+        self.dataset = dataset
+        self.directory = Path(directory)
+        self.name = f"kaggle:{dataset.split('/')[-1]}"
+
+    def fetch(self):
+        kaggle = shutil.which('kaggle')
+        if kaggle is None:
+            raise FileNotFoundError("kaggle CLI not found (pip install kaggle)")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.directory) as tmp:
+            subprocess.run([kaggle, 'datasets', 'download', '-d', self.dataset, '-p', tmp],
+                           check=True, capture_output=True)
+            files = []
+            for archive in Path(tmp).glob("*.zip"):
+                with zipfile.ZipFile(archive) as bundle:
+                    if bundle.testzip() is not None:
+                        raise ChecksumError(f"{archive.name}: corrupt archive")
+                    bundle.extractall(tmp)
+                archive.unlink()
+            # Swap each file in whole so readers never see a partial CSV
+            for path in sorted(Path(tmp).iterdir()):
+                if path.is_file():
+                    os.replace(path, self.directory / path.name)
+                    files.append(path.name)
+        return f"{len(files)} files ({', '.join(files)})"
+
+async def _fetch_one(source, semaphore, executor, retries, backoff):
+    start = time.perf_counter()
+    for attempt in range(retries + 1):
+        try:
+            async with semaphore:
+                detail = await asyncio.get_running_loop().run_in_executor(executor, source.fetch)
+            return source.name, 'ok', detail, time.perf_counter() - start
+        except Exception as error:
+            if attempt == retries or not is_retryable(error):
+                return source.name, 'failed', f"{type(error).__name__}: {error}", time.perf_counter() - start
+            # Exponential backoff with jitter, or what the server asked for
+            delay = _retry_after(error) or backoff * 2 ** attempt * (1 + random.random())
+            print(f"🔁 {source.name}: {error} - retry {attempt + 1}/{retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+async def fetch_all(sources, concurrency=4, retries=3, backoff=0.5):
+    """Run every source, at most `concurrency` at a time.
+
+    Returns (name, 'ok'|'failed', detail, seconds) per source in input order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    # Own pool: the default one has only cpu_count + 4 threads
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return await asyncio.gather(*(_fetch_one(source, semaphore, executor, retries, backoff)
+                                      for source in sources))
+
+def acquire(sources, concurrency=4, retries=3, backoff=0.5):
+    """Blocking wrapper around fetch_all() that prints one line per source"""
+    results = asyncio.run(fetch_all(sources, concurrency, retries, backoff))
+    for name, status, detail, seconds in results:
+        print(f"{'✅' if status == 'ok' else '❌'} {name}: {detail} ({seconds:.2f}s)")
+    return results
+
+def mirror_sources(base_url, directory=RAW_DIR, names=RAW_FILES, checksums=True):
+    """HttpFile per raw file on a mirror; <name>.sha256 sidecars give checksums"""
+    base_url = base_url.rstrip('/')
+    return [HttpFile(f"{base_url}/{name}", Path(directory) / name,
+                     checksum_url=f"{base_url}/{name}.sha256" if checksums else None)
+            for name in names]
+
+def ohlcv_sources(symbols, directory=UNIVERSE_DIR, url_template=YAHOO_URL, start='2016-01-01'):
+    """OhlcvEndpoint per symbol, stored as <directory>/<SYMBOL>.csv"""
+    return [OhlcvEndpoint(symbol, Path(directory) / f"{symbol}.csv", url_template, start)
+            for symbol in symbols]
@@ -0,0 +1,205 @@
+# Typed Data Loader
+# Silver Price Forecasting - Parse each CSV once into typed columns
+#
+# The first load parses the CSV into int64 epoch-day dates and float64
+# columns and caches them in a sidecar directory next to the file
+# (<name>.csv.cache/). Later loads memory-map the cached columns and skip
+# CSV parsing entirely. The cache is invalidated when the source file's
+# mtime/size change and its content hash no longer matches.
+
+import csv
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+RAW_DATA = BASE_DIR / "data" / "raw" / "silver_prices_data.csv"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.feature_store import (
+    DATE_DTYPE, FLOAT_DTYPE, date_to_days, days_to_date, read_column, write_column
+)
+from pipeline.trace import traced
+
+LOADER_VERSION = 1
+META_FILE = "meta.json"
+NAN = float('nan')
+
+def cache_dir(path):
+    path = Path(path)
+    return path.with_name(path.name + ".cache")
+
+def file_hash(path):
+    """BLAKE2b digest of a file's contents"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _parse_float(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return NAN
+
+@traced(rows=lambda result, *args, **kwargs: len(result[0]))
+def parse_csv(path, date_column='Date'):
+    """Parse a CSV into (days, {column: floats}, skipped row count).
+
+    Rows whose date does not parse are skipped; unparseable or empty
+    numeric cells become NaN.
+    """
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        date_idx = header.index(date_column)
+        names = [name for name in header if name != date_column]
+        indexes = [header.index(name) for name in names]
+
+        days = []
+        columns = [[] for _ in names]
+        skipped = 0
+        for row in reader:
+            try:
+                day = date_to_days(row[date_idx])
+            except (ValueError, IndexError):
+                skipped += 1
+                continue
+            days.append(day)
+            for column, idx in zip(columns, indexes):
+                column.append(_parse_float(row[idx]) if idx < len(row) else NAN)
+
+    return days, dict(zip(names, columns)), skipped
+
+def as_list(values):
+    """Plain Python list of a column (NumPy array, memoryview or list)"""
+    return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+class Table:
+    """Typed columns of one CSV: epoch-day dates plus float64 columns"""
+
+    def __init__(self, days, columns, skipped=0, digest=None):
+        self.days = days
+        self.columns = columns
+        self.names = list(columns)
+        self.skipped = skipped
+        self.digest = digest  # Content hash of the source file
+
+    def __len__(self):
+        return len(self.days)
+
+    def column(self, name):
+        return self.columns[name]
+
+    def dates(self):
+        """Dates as 'YYYY-MM-DD' strings"""
+        return [days_to_date(d) for d in self.days]
+
+    def rows(self, date_name='date'):
+        """Rows as dicts of typed values"""
+        names = [date_name] + self.names
+        values = [self.dates()] + [as_list(self.columns[n]) for n in self.names]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    def to_frame(self, date_name='Date'):
+        """pandas DataFrame view (imports pandas on demand)"""
+        import pandas as pd
+        frame = pd.DataFrame({name: self.columns[name] for name in self.names})
+        frame.insert(0, date_name, pd.to_datetime(list(self.days), unit='D'))
+        return frame
+
+def _fingerprint(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def _read_cache(path, directory):
+    """Cached table for `path`, or None if missing or stale"""
+    try:
+        with open(directory / META_FILE, 'r') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get('version') != LOADER_VERSION or meta.get('date_column') is None:
+        return None
+
+    fingerprint = _fingerprint(path)
+    if fingerprint['size'] != meta['size']:
+        return None
+    if fingerprint['mtime_ns'] != meta['mtime_ns']:
+        # Touched but maybe not changed: trust the content hash
+        if file_hash(path) != meta['hash']:
+            return None
+        meta.update(fingerprint)
+        _write_meta(directory, meta)
+
+    try:
+        days = read_column(directory / "date.npy")
+        columns = {name: read_column(directory / f"{i}.npy")
+                   for i, name in enumerate(meta['columns'])}
+    except (OSError, ValueError):
+        return None
+    return Table(days, columns, meta['skipped'], meta['hash']), meta['date_column']
+
+def _write_meta(directory, meta):
+    tmp = directory / (META_FILE + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(meta, f)
+    tmp.replace(directory / META_FILE)
+
+def _write_cache(path, directory, date_column, days, columns, skipped, fingerprint, digest):
+    tmp = directory.with_name(f"{directory.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    # Column files are numbered so any header name is a safe file name
+    write_column(tmp / "date.npy", days, DATE_DTYPE)
+    for i, values in enumerate(columns.values()):
+        write_column(tmp / f"{i}.npy", values, FLOAT_DTYPE)
+    _write_meta(tmp, {
+        'version': LOADER_VERSION,
+        'source': Path(path).name,
+        'date_column': date_column,
+        'columns': list(columns),
+        'rows': len(days),
+        'skipped': skipped,
+        'hash': digest,
+        **fingerprint,
+    })
+
+    shutil.rmtree(directory, ignore_errors=True)
+    tmp.replace(directory)
+
+@traced(rows=lambda result, *args, **kwargs: len(result))
+def load_table(path, date_column='Date', use_cache=True):
+    """Typed columns of a CSV, parsed once and cached in a sidecar"""
+    directory = cache_dir(path)
+    if use_cache:
+        cached = _read_cache(path, directory)
+        if cached is not None and cached[1] == date_column:
+            return cached[0]
+
+    fingerprint = _fingerprint(path)
+    digest = file_hash(path)
+    days, columns, skipped = parse_csv(path, date_column)
+    if use_cache:
+        try:
+            _write_cache(path, directory, date_column, days, columns, skipped, fingerprint, digest)
+            cached = _read_cache(path, directory)
+            if cached is not None:
+                return cached[0]
+        except OSError:
+            pass  # Read-only location: still return the parsed table
+    return Table(days, columns, skipped, digest)
+
+def load_raw_prices(path=RAW_DATA):
+    """Typed OHLCV table of the raw price history"""
+    return load_table(path, 'Date')
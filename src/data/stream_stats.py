@@ -0,0 +1,226 @@
+# Streaming Statistics
+# Silver Price Forecasting - One-pass, bounded-memory EDA over a price history
+#
+# Every statistic of scripts/eda_analysis.py is updated per row and never
+# needs the full series: Welford mean/variance for prices and returns,
+# running counters for direction, changes and the persistence baseline,
+# fixed-size buffers for the first/last 100 days, and a quantile sketch
+# for the median, quartiles and IQR outlier count. Memory depends on the
+# price range and sketch accuracy, not on the number of rows.
+
+import math
+import sys
+from collections import deque
+from pathlib import Path
+
+# Make src/ importable when run as a script
+SRC_DIR = Path(__file__).parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.cross_asset import read_rows
+
+TREND_DAYS = 100
+
+class RunningStats:
+    """Welford count, mean and population variance plus min/max"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def variance(self):
+        return self.m2 / self.count if self.count else 0.0
+
+    def std(self):
+        return self.variance() ** 0.5
+
+class QuantileSketch:
+    """Log-bucketed histogram with relative-error quantiles.
+
+    Positive values fall into buckets (gamma^(k-1), gamma^k] with
+    gamma = (1+accuracy)/(1-accuracy), so any quantile is returned within
+    `accuracy` relative error of a true sample value. Counts below or above
+    a bound are exact except for the one bucket straddling it. Values <= 0
+    share one bucket represented by the minimum. When more than
+    `max_buckets` are in use, neighbouring buckets are merged pairwise
+    (squaring gamma), which halves the count and doubles the error bound.
+    """
+
+    def __init__(self, accuracy=1e-4, max_buckets=1 << 15):
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        self.nonpositive = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, value):
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value <= 0:
+            self.nonpositive += 1
+            return
+        key = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        """Merge buckets pairwise until at most max_buckets remain"""
+        while len(self.buckets) > self.max_buckets:
+            self.gamma *= self.gamma
+            self.log_gamma *= 2
+            merged = {}
+            for key, count in self.buckets.items():
+                key = -(-key // 2)  # ceil(key / 2)
+                merged[key] = merged.get(key, 0) + count
+            self.buckets = merged
+
+    def _value(self, key):
+        """Representative value of a bucket, clamped to the observed range"""
+        value = 2 * self.gamma ** key / (self.gamma + 1)
+        return min(max(value, self.min), self.max)
+
+    def _ordered(self):
+        """(value, count) per bucket in ascending order"""
+        if self.nonpositive:
+            yield self.min, self.nonpositive
+        for key in sorted(self.buckets):
+            yield self._value(key), self.buckets[key]
+
+    def quantile(self, p):
+        """Value at rank int(count * p) of the sorted sample (0-based)"""
+        if not self.count:
+            return math.nan
+        rank = min(int(self.count * p), self.count - 1)
+        seen = 0
+        for value, count in self._ordered():
+            seen += count
+            if seen > rank:
+                return value
+        return self.max
+
+    def outside(self, lower, upper):
+        """(count, lowest, highest) of values below `lower` or above `upper`"""
+        count = 0
+        lowest = math.inf
+        highest = -math.inf
+        for value, n in self._ordered():
+            if value < lower or value > upper:
+                count += n
+                lowest = min(lowest, value)
+                highest = max(highest, value)
+        return count, lowest, highest
+
+class StreamingEDA:
+    """One-pass accumulator for every number in the EDA report"""
+
+    def __init__(self, accuracy=1e-4):
+        self.prices = RunningStats()
+        self.returns = RunningStats()
+        self.changes = RunningStats()
+        self.sketch = QuantileSketch(accuracy)
+        self.positive_days = 0
+        self.negative_days = 0
+        self.first = []
+        self.last = deque(maxlen=TREND_DAYS)
+        self.first_date = None
+        self.last_date = None
+        self.previous = None
+        self.previous_up = None
+        self.persistence_correct = 0
+
+    def push(self, date, price):
+        """Add one (date, close) row"""
+        if self.first_date is None:
+            self.first_date = date
+        self.last_date = date
+        self.prices.push(price)
+        self.sketch.push(price)
+        if len(self.first) < TREND_DAYS:
+            self.first.append(price)
+        self.last.append(price)
+
+        if self.previous is not None:
+            self.returns.push((price - self.previous) / self.previous * 100)
+            self.changes.push(abs(price - self.previous))
+            if price > self.previous:
+                self.positive_days += 1
+            elif price < self.previous:
+                self.negative_days += 1
+
+            # Persistence: yesterday's direction predicts today's
+            up = price > self.previous
+            if self.previous_up is not None and up == self.previous_up:
+                self.persistence_correct += 1
+            self.previous_up = up
+        self.previous = price
+
+    def report(self):
+        """Every statistic of the report as a dict"""
+        q1 = self.sketch.quantile(0.25)
+        q3 = self.sketch.quantile(0.75)
+        iqr = q3 - q1
+        lower, upper = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        outliers, outlier_min, outlier_max = self.sketch.outside(lower, upper)
+        first_avg = sum(self.first) / len(self.first) if self.first else math.nan
+        last_avg = sum(self.last) / len(self.last) if self.last else math.nan
+
+        return {
+            'count': self.prices.count,
+            'first_date': self.first_date,
+            'last_date': self.last_date,
+            'min': self.prices.min,
+            'max': self.prices.max,
+            'mean': self.prices.mean,
+            'median': self.sketch.quantile(0.5),
+            'std': self.prices.std(),
+            'returns': self.returns.count,
+            'positive_days': self.positive_days,
+            'negative_days': self.negative_days,
+            'mean_return': self.returns.mean,
+            'return_std': self.returns.std(),
+            'first_avg': first_avg,
+            'last_avg': last_avg,
+            'trend_change': (last_avg - first_avg) / first_avg * 100,
+            'q1': q1,
+            'q3': q3,
+            'iqr': iqr,
+            'lower_bound': lower,
+            'upper_bound': upper,
+            'outliers': outliers,
+            'outlier_min': outlier_min,
+            'outlier_max': outlier_max,
+            'avg_change': self.changes.mean,
+            'max_change': self.changes.max,
+            'persistence_accuracy': self.persistence_correct / (self.prices.count - 2) * 100
+            if self.prices.count > 2 else math.nan,
+        }
+
+def stream_closes(path, time_column='Date', close_column='Close'):
+    """(date, close) rows of a price CSV, read in chunks; missing closes skipped"""
+    for timestamp, close in read_rows(path, [close_column], time_column):
+        if close == close:
+            yield timestamp[:10], close
+
+def analyze(rows, accuracy=1e-4):
+    """Report for an iterable of (date, close) rows in one pass"""
+    eda = StreamingEDA(accuracy)
+    for date, price in rows:
+        eda.push(date, price)
+    return eda.report()
@@ -0,0 +1,235 @@
+# Data Quality Validation
+# Silver Price Forecasting - Single-pass checks with a machine-readable report
+#
+# Streams a raw price CSV once, in blocks of lines, and checks every row:
+# unparseable dates, dates out of order, duplicate dates, NaN or
+# non-positive prices and return spikes, plus gaps against a weekday
+# trading calendar. The report is written next to the file as
+# <name>.csv.quality.json and lists the offending row indexes (0-based
+# data rows, header excluded), so downstream loaders can skip exactly the
+# bad rows. The file's content hash is taken in the same pass, and the
+# report is reused until the file changes.
+
+import argparse
+import csv
+import hashlib
+import json
+import math
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+RAW_DATA = BASE_DIR / "data" / "raw" / "silver_prices_data.csv"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.feature_store import EPOCH, date_to_days
+
+VALIDATOR_VERSION = 1
+CHUNK_BYTES = 1 << 20
+SPIKE_THRESHOLD = 0.25  # |return| above 25% in one bar is flagged
+
+# Rows with these problems are skipped downstream; spikes and gaps are warnings
+ERRORS = ['bad_date', 'out_of_order', 'duplicate', 'missing_price', 'nonpositive_price']
+
+def report_path(path):
+    path = Path(path)
+    return path.with_name(path.name + ".quality.json")
+
+def missing_weekdays(start, end):
+    """Weekdays strictly between two epoch days"""
+    days = end - start - 1
+    if days <= 0:
+        return 0
+    weeks, extra = divmod(days, 7)
+    first = date.fromordinal(start + 1 + EPOCH).weekday()
+    return weeks * 5 + sum(1 for k in range(extra) if (first + k) % 7 < 5)
+
+class RowValidator:
+    """Per-row quality checks; state is the last accepted date and price.
+
+    `check()` returns the row's error name (one of ERRORS) or None, and
+    records spikes and calendar gaps as warnings.
+    """
+
+    def __init__(self, spike_threshold=SPIKE_THRESHOLD, last_day=None, last_price=None):
+        self.spike_threshold = spike_threshold
+        self.last_day = last_day
+        self.last_price = last_price
+        self.issues = {name: [] for name in ERRORS + ['spike']}
+        self.gaps = []
+        self.spikes = []
+        self.missing_weekdays = 0
+        self.first_day = None
+
+    def check(self, index, date_value, price_value):
+        try:
+            day = date_to_days(date_value)
+        except (ValueError, TypeError):
+            return self._error('bad_date', index)
+        if self.last_day is not None and day < self.last_day:
+            return self._error('out_of_order', index)
+        if self.last_day is not None and day == self.last_day:
+            return self._error('duplicate', index)
+
+        try:
+            price = float(price_value)
+        except (ValueError, TypeError):
+            price = math.nan
+        if price != price:
+            return self._error('missing_price', index)
+        if price <= 0 or math.isinf(price):
+            return self._error('nonpositive_price', index)
+
+        if self.last_day is not None:
+            missing = missing_weekdays(self.last_day, day)
+            if missing:
+                self.missing_weekdays += missing
+                self.gaps.append({'row': index, 'after': _iso(self.last_day),
+                                  'before': _iso(day), 'missing_weekdays': missing})
+        if self.last_price is not None:
+            change = price / self.last_price - 1
+            if abs(change) > self.spike_threshold:
+                self.issues['spike'].append(index)
+                self.spikes.append({'row': index, 'date': _iso(day), 'return': change})
+
+        if self.first_day is None:
+            self.first_day = day
+        self.last_day = day
+        self.last_price = price
+        return None
+
+    def _error(self, name, index):
+        self.issues[name].append(index)
+        return name
+
+def _iso(day):
+    return date.fromordinal(day + EPOCH).isoformat()
+
+def validate(path, date_column='Date', price_column='Close', spike_threshold=SPIKE_THRESHOLD,
+             chunk_bytes=CHUNK_BYTES):
+    """Check every row of a price CSV in one pass; returns the report dict"""
+    digest = hashlib.blake2b(digest_size=16)
+    stat = os.stat(path)
+    validator = RowValidator(spike_threshold)
+    rows = 0
+
+    with open(path, 'rb') as f:
+        header_line = f.readline()
+        digest.update(header_line)
+        header = next(csv.reader([header_line.decode()]))
+        date_idx = header.index(date_column)
+        price_idx = header.index(price_column)
+
+        while True:
+            lines = f.readlines(chunk_bytes)
+            if not lines:
+                break
+            for line in lines:
+                digest.update(line)
+            for row in csv.reader(line.decode() for line in lines):
+                if not row:
+                    continue  # Blank line: not a data row for the loader either
+                date_value = row[date_idx] if date_idx < len(row) else None
+                price_value = row[price_idx] if price_idx < len(row) else None
+                validator.check(rows, date_value, price_value)
+                rows += 1
+
+    issues = validator.issues
+    skip = sorted(i for name in ERRORS for i in issues[name])
+    return {
+        'version': VALIDATOR_VERSION,
+        'source': Path(path).name,
+        'hash': digest.hexdigest(),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'settings': {'date_column': date_column, 'price_column': price_column,
+                     'spike_threshold': spike_threshold, 'calendar': 'weekdays'},
+        'rows': rows,
+        'valid_rows': rows - len(skip),
+        'first_date': _iso(validator.first_day) if validator.first_day is not None else None,
+        'last_date': _iso(validator.last_day) if validator.last_day is not None else None,
+        'counts': {name: len(indexes) for name, indexes in issues.items()},
+        'missing_weekdays': validator.missing_weekdays,
+        'issues': issues,
+        'skip': skip,
+        'gaps': validator.gaps,
+        'spikes': validator.spikes,
+    }
+
+def write_report(report, path):
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(report, f, indent=1)
+    tmp.replace(path)
+
+def load_report(path, **settings):
+    """Quality report for `path`, re-validating only if the file changed"""
+    out = report_path(path)
+    try:
+        with open(out, 'r') as f:
+            report = json.load(f)
+        stat = os.stat(path)
+        fresh = (report.get('version') == VALIDATOR_VERSION
+                 and report['size'] == stat.st_size and report['mtime_ns'] == stat.st_mtime_ns
+                 and all(report['settings'].get(k) == v for k, v in settings.items()))
+        if fresh:
+            return report
+    except (OSError, ValueError, KeyError):
+        pass
+
+    report = validate(path, **settings)
+    try:
+        write_report(report, out)
+    except OSError:
+        pass  # Read-only location: the report is still returned
+    return report
+
+def skipped_table_rows(report):
+    """Bad rows as positions in the loader's Table.
+
+    The loader already drops rows whose date does not parse, so the
+    remaining skip indexes are shifted down past those.
+    """
+    bad_dates = report['issues']['bad_date']
+    skip = []
+    shift = 0
+    for index in report['skip']:
+        while shift < len(bad_dates) and bad_dates[shift] < index:
+            shift += 1
+        if shift < len(bad_dates) and bad_dates[shift] == index:
+            continue
+        skip.append(index - shift)
+    return skip
+
+def print_summary(report):
+    print(f"Rows: {report['rows']:,} ({report['valid_rows']:,} valid), "
+          f"{report['first_date']} to {report['last_date']}")
+    for name, count in report['counts'].items():
+        marker = '✅' if not count else ('⚠️' if name == 'spike' else '❌')
+        print(f"  {marker} {name:<18} {count}")
+    print(f"  {'⚠️' if report['missing_weekdays'] else '✅'} {'missing_weekdays':<18} "
+          f"{report['missing_weekdays']} in {len(report['gaps'])} gaps")
+    longest = sorted(report['gaps'], key=lambda g: g['missing_weekdays'], reverse=True)[:3]
+    for gap in longest:
+        print(f"     {gap['after']} -> {gap['before']}: {gap['missing_weekdays']} weekdays")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate a raw price CSV and write a JSON report")
+    parser.add_argument('path', nargs='?', type=Path, default=RAW_DATA)
+    parser.add_argument('--spike-threshold', type=float, default=SPIKE_THRESHOLD)
+    args = parser.parse_args()
+
+    print("="*80)
+    print("DATA QUALITY VALIDATION")
+    print("="*80)
+    report = validate(args.path, spike_threshold=args.spike_threshold)
+    write_report(report, report_path(args.path))
+    print_summary(report)
+    print(f"\n✅ Report saved to: {report_path(args.path)}")
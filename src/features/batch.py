@@ -0,0 +1,136 @@
+# Batch Feature Engineering
+# Silver Price Forecasting - Features for a whole universe of tickers at once
+#
+# build_features.py handles the single silver series. This engine takes
+# many series - a directory of OHLCV CSVs (one per symbol, named
+# <SYMBOL>.csv) or in-memory ragged/padded price arrays - computes every
+# feature for each in a process pool, and writes one partitioned store:
+# <store>/symbol=<SYMBOL>/ is an ordinary feature store, and the
+# top-level manifest.json lists the symbols. Workers write their own
+# partitions, so only row counts travel back to the parent process.
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+UNIVERSE_DIR = BASE_DIR / "data" / "raw" / "universe"
+UNIVERSE_STORE = BASE_DIR / "data" / "processed" / "universe"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.build_features import FEATURE_NAMES, columnar, data_hash, feature_registry, load_prices
+from features.feature_store import (
+    PartitionedStore, partition_name, save_features, save_partitions_manifest
+)
+from features.registry import FeatureCache
+
+# Gold, platinum, copper and the silver miners next to silver (Yahoo tickers)
+DEFAULT_UNIVERSE = ['SI=F', 'GC=F', 'PL=F', 'HG=F', 'SIL', 'SILJ']
+
+def csv_sources(directory):
+    """{symbol: path} for every <SYMBOL>.csv in a directory"""
+    return {path.stem: path for path in sorted(Path(directory).glob("*.csv"))}
+
+def matrix_sources(symbols, dates, matrix):
+    """{symbol: (dates, prices)} from a padded (symbols x days) price matrix.
+
+    `dates` is the shared calendar; NaN cells (padding, or days a symbol
+    did not trade) are dropped, which turns the matrix into ragged series.
+    """
+    sources = {}
+    for symbol, row in zip(symbols, matrix):
+        keep = [i for i, price in enumerate(row) if price == price]
+        sources[symbol] = ([dates[i] for i in keep], [float(row[i]) for i in keep])
+    return sources
+
+def _build_partition(task):
+    """Compute and write one symbol's features (runs in a worker)"""
+    symbol, source, directory, names = task
+    start = time.perf_counter()
+
+    if isinstance(source, (str, Path)):
+        dates, prices = load_prices(source)
+        key, cache = data_hash(source), FeatureCache()
+    else:
+        dates, prices = source
+        key, cache = None, None  # Arrays have no content hash to key on
+    if columnar is not None:
+        prices = columnar.as_array(prices)
+
+    features = feature_registry().compute(names, prices, key, cache)
+    save_features(Path(directory) / partition_name(symbol), dates, features)
+    return symbol, len(dates), time.perf_counter() - start
+
+def build_universe(sources, directory=UNIVERSE_STORE, names=FEATURE_NAMES, workers=None):
+    """Build the partitioned store for {symbol: CSV path or (dates, prices)}.
+
+    Symbols already in the store's manifest and not rebuilt here (a
+    --symbols subset run) stay in it. Returns per-symbol (symbol, rows,
+    seconds) in input order.
+    """
+    for name in names:
+        feature_registry().parse(name)  # Fail on unknown names before forking
+    tasks = [(symbol, source, directory, list(names)) for symbol, source in sources.items()]
+    workers = min(workers or os.cpu_count() or 1, len(tasks)) or 1
+
+    if workers == 1:
+        results = [_build_partition(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(_build_partition, tasks))
+
+    rows = {}
+    if PartitionedStore.exists(directory):
+        rows = {symbol: entry['rows'] for symbol, entry in PartitionedStore(directory).manifest['symbols'].items()}
+    rows.update((symbol, count) for symbol, count, _ in results)
+    save_partitions_manifest(directory, rows)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch feature engineering for a universe of tickers")
+    parser.add_argument('--input', type=Path, default=UNIVERSE_DIR,
+                        help="directory of <SYMBOL>.csv files with Date and Close columns")
+    parser.add_argument('--output', type=Path, default=UNIVERSE_STORE)
+    parser.add_argument('--symbols', nargs='+', default=None,
+                        help="subset of symbols to build (default: every CSV)")
+    parser.add_argument('--features', nargs='+', default=[], metavar='NAME',
+                        help="extra features, e.g. sma_200 rsi_21")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    sources = csv_sources(args.input)
+    if args.symbols:
+        missing = [s for s in args.symbols if s not in sources]
+        if missing:
+            parser.error(f"no CSV for: {', '.join(missing)}")
+        sources = {s: sources[s] for s in args.symbols}
+    if not sources:
+        parser.error(f"no CSV files in {args.input} (expected e.g. {', '.join(DEFAULT_UNIVERSE)})")
+    names = FEATURE_NAMES + [n for n in args.features if n not in FEATURE_NAMES]
+
+    print("="*80)
+    print(f"PHASE 3: BATCH FEATURE ENGINEERING ({len(sources)} symbols)")
+    print("="*80)
+
+    start = time.perf_counter()
+    results = build_universe(sources, args.output, names, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'symbol':<10}{'rows':>10}{'seconds':>10}")
+    print("-" * 30)
+    for symbol, rows, seconds in results:
+        print(f"{symbol:<10}{rows:>10,}{seconds:>10.3f}")
+
+    total_rows = sum(rows for _, rows, _ in results)
+    print("-" * 30)
+    print(f"✅ Saved partitioned store to: {args.output}")
+    print(f"⚡ {len(results) / elapsed:.1f} symbols/s, {total_rows / elapsed:,.0f} rows/s "
+          f"({elapsed:.2f}s, {args.workers or os.cpu_count()} workers)")
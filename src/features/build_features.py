@@ -1,30 +1,75 @@
 # Phase 3: Feature Engineering
 # Silver Price Forecasting - Create Features for ML Models
 
+import argparse
+import contextlib
 import csv
+import importlib.util
+import io
+import json
+import os
+import sys
 from pathlib import Path
 
 # File paths
 BASE_DIR = Path(__file__).parent.parent.parent  # Go up from src/features to project root
 RAW_DATA = BASE_DIR / "data" / "raw" / "silver_prices_data.csv"
 PROCESSED_DATA = BASE_DIR / "data" / "processed" / "silver_features.csv"
+FEATURE_STORE = BASE_DIR / "data" / "processed" / "silver_features"
+STATE_FILE = BASE_DIR / "data" / "processed" / "silver_features_state.json"
 
-def load_prices():
-    """Load historical price data"""
-    prices = []
-    dates = []
-    
-    with open(RAW_DATA, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                prices.append(float(row['Close']))
-                dates.append(row['Date'])
-            except (ValueError, KeyError, TypeError):
-                pass
-    
-    return dates, prices
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.rolling import RollingWindow, RollingRSI, FeatureState
+from features.feature_store import (
+    TARGET_DTYPE, FeatureStore, FeatureTable, save_features, append_features, date_to_days,
+    COMPRESSION_SUFFIXES, export_csv
+)
+from features.registry import FeatureCache, FeatureRegistry
+from features.targets import HORIZONS, compute_targets, label_summary, stored_horizons, target_names
+from data.loader import load_raw_prices, as_list
+from data.validate import VALIDATOR_VERSION, RowValidator, load_report, skipped_table_rows
+from pipeline.trace import entry_point, traced
+
+try:
+    from features import columnar  # NumPy backend
+except ImportError:
+    columnar = None
 
+# Output columns of silver_features.csv
+FIELDNAMES = ['date', 'price', 'return', 'sma_5', 'sma_20', 'sma_50',
+              'rsi', 'bb_distance', 'momentum', 'volatility',
+              'lag_1', 'lag_7', 'lag_30', 'target']
+FEATURE_NAMES = FIELDNAMES[1:]
+
+# Model inputs (everything except date, raw price and target)
+MODEL_FEATURES = ['return', 'sma_5', 'sma_20', 'sma_50', 'rsi', 'bb_distance',
+                  'momentum', 'volatility', 'lag_1', 'lag_7', 'lag_30']
+
+@traced(rows=lambda result, *args, **kwargs: len(result[0]))
+def load_prices(path=RAW_DATA):
+    """Load historical price data, skipping rows the quality report flags"""
+    table = load_raw_prices(path)
+    closes = as_list(table.column('Close'))
+    dates = table.dates()
+    
+    # Bad dates, duplicates, out-of-order rows and NaN/non-positive closes
+    report = load_report(path)
+    skip = set(skipped_table_rows(report))
+    if not skip:
+        return dates, closes
+    print(f"⚠️ Skipping {len(skip)} bad rows (see {Path(path).name}.quality.json)")
+    keep = [i for i in range(len(dates)) if i not in skip]
+    return [dates[i] for i in keep], [closes[i] for i in keep]
+
+def data_hash(path=RAW_DATA):
+    """Cache key of the price series load_prices() returns for a file"""
+    return f"{load_raw_prices(path).digest}-v{VALIDATOR_VERSION}"
+
+@traced()
 def calculate_returns(prices):
     """Calculate daily returns"""
     returns = [0.0]  # First day has no return
@@ -33,76 +78,57 @@ def calculate_returns(prices):
         returns.append(ret)
     return returns
 
+@traced()
 def calculate_sma(prices, window):
     """Calculate Simple Moving Average"""
     sma = []
-    for i in range(len(prices)):
-        if i < window - 1:
-            sma.append(0.0)  # Not enough data
+    rolling = RollingWindow(window)
+    for price in prices:
+        rolling.push(price)
+        if rolling.is_full():
+            sma.append(rolling.mean())
         else:
-            avg = sum(prices[i-window+1:i+1]) / window
-            sma.append(avg)
+            sma.append(0.0)  # Not enough data
     return sma
 
+@traced()
 def calculate_rsi(prices, period=14):
     """Calculate Relative Strength Index"""
     rsi = []
+    rolling = RollingRSI(period)
     
-    for i in range(len(prices)):
-        if i < period:
+    for price in prices:
+        value = rolling.push(price)
+        if value is None:
             rsi.append(50.0)  # Neutral RSI
-            continue
-        
-        gains = []
-        losses = []
-        
-        for j in range(i-period+1, i+1):
-            change = prices[j] - prices[j-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-        
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
-        
-        if avg_loss == 0:
-            rsi.append(100.0)
         else:
-            rs = avg_gain / avg_loss
-            rsi_val = 100 - (100 / (1 + rs))
-            rsi.append(rsi_val)
+            rsi.append(value)
     
     return rsi
 
+@traced()
 def calculate_bollinger_bands(prices, window=20):
     """Calculate Bollinger Bands distance from middle"""
     bb_distance = []
+    rolling = RollingWindow(window)
     
-    for i in range(len(prices)):
-        if i < window - 1:
+    for price in prices:
+        rolling.push(price)
+        if not rolling.is_full():
             bb_distance.append(0.0)
             continue
         
-        # Calculate moving average
-        window_prices = prices[i-window+1:i+1]
-        sma = sum(window_prices) / window
-        
-        # Calculate standard deviation
-        variance = sum((p - sma) ** 2 for p in window_prices) / window
-        std_dev = variance ** 0.5
-        
         # Distance from middle band (in std devs)
+        std_dev = rolling.std()
         if std_dev == 0:
             bb_distance.append(0.0)
         else:
-            distance = (prices[i] - sma) / std_dev
+            distance = (price - rolling.mean()) / std_dev
             bb_distance.append(distance)
     
     return bb_distance
 
+@traced()
 def calculate_momentum(prices, window=5):
     """Calculate price momentum"""
     momentum = []
@@ -116,23 +142,22 @@ def calculate_momentum(prices, window=5):
     
     return momentum
 
+@traced()
 def calculate_volatility(prices, window=30):
     """Calculate rolling volatility"""
     volatility = []
+    rolling = RollingWindow(window)
     
-    for i in range(len(prices)):
-        if i < window - 1:
+    for price in prices:
+        rolling.push(price)
+        if rolling.is_full():
+            volatility.append(rolling.std())
+        else:
             volatility.append(0.0)
-            continue
-        
-        window_prices = prices[i-window+1:i+1]
-        mean = sum(window_prices) / window
-        variance = sum((p - mean) ** 2 for p in window_prices) / window
-        vol = variance ** 0.5
-        volatility.append(vol)
     
     return volatility
 
+@traced()
 def create_lag_features(prices, lags=[1, 7, 30]):
     """Create lag features"""
     lag_features = {f'lag_{lag}': [] for lag in lags}
@@ -146,6 +171,12 @@ def create_lag_features(prices, lags=[1, 7, 30]):
     
     return lag_features
 
+@traced()
+def calculate_lag(prices, lag):
+    """Price `lag` days earlier"""
+    return create_lag_features(prices, [lag])[f'lag_{lag}']
+
+@traced()
 def create_target(prices):
     """Create directional target (1=up, 0=down)"""
     target = []
@@ -157,21 +188,9 @@ def create_target(prices):
     target.append(-1)  # Last day has no target
     return target
 
-def engineer_features():
-    """Main feature engineering pipeline"""
-    
-    print("="*80)
-    print("PHASE 3: FEATURE ENGINEERING")
-    print("="*80)
-    
-    # Load data
-    print("\n📊 Loading data...")
-    dates, prices = load_prices()
-    print(f"✅ Loaded {len(prices)} price points")
-    
-    # Create features
-    print("\n🔧 Creating features...")
-    
+@traced()
+def compute_features(prices):
+    """Compute every feature column with the pure-Python indicators"""
     print("  - Daily returns")
     returns = calculate_returns(prices)
     
@@ -198,47 +217,113 @@ def engineer_features():
     print("  - Target variable (direction)")
     target = create_target(prices)
     
+    return {
+        'price': prices,
+        'return': returns,
+        'sma_5': sma_5,
+        'sma_20': sma_20,
+        'sma_50': sma_50,
+        'rsi': rsi,
+        'bb_distance': bb_dist,
+        'momentum': momentum,
+        'volatility': volatility,
+        'lag_1': lag_features['lag_1'],
+        'lag_7': lag_features['lag_7'],
+        'lag_30': lag_features['lag_30'],
+        'target': target
+    }
+
+def feature_registry():
+    """Every feature kind as a (function, params) spec, NumPy-backed if available"""
+    def pick(function):
+        return getattr(columnar, function.__name__) if columnar is not None else function
+    
+    registry = FeatureRegistry()
+    registry.register('price', lambda prices: prices, cache=False)
+    registry.register('return', pick(calculate_returns))
+    registry.register('sma', pick(calculate_sma), window=None)
+    registry.register('rsi', pick(calculate_rsi), period=14)
+    registry.register('bb_distance', pick(calculate_bollinger_bands), window=20)
+    registry.register('momentum', pick(calculate_momentum), window=5)
+    registry.register('volatility', pick(calculate_volatility), window=30)
+    registry.register('lag', pick(calculate_lag), lag=None)
+    registry.register('target', pick(create_target), dtype=TARGET_DTYPE)
+    return registry
+
+@traced()
+def write_csv(dates, features, path=PROCESSED_DATA, compression=None):
+    """Export features as silver_features.csv for humans (block-formatted, atomic)"""
+    names = list(features)
+    export_csv(path, ['date'] + names, [dates] + [features[name] for name in names], compression)
+
+@entry_point('features')
+def engineer_features(csv_export=False, extra_features=(), compression=None, horizons=()):
+    """Main feature engineering pipeline.
+    
+    `extra_features` adds registry features such as 'sma_200' or 'rsi_21'
+    to the standard columns. Columns already computed for the same raw
+    data are read back from the feature cache. With `compression` ('gzip'
+    or 'zstd') the CSV export is written as silver_features.csv.gz/.zst.
+    `horizons` adds target_{h}d / fwd_return_{h}d columns per horizon.
+    """
+    
+    print("="*80)
+    print("PHASE 3: FEATURE ENGINEERING")
+    print("="*80)
+    
+    # Load data
+    print("\n📊 Loading data...")
+    dates, prices = load_prices(RAW_DATA)
+    print(f"✅ Loaded {len(prices)} price points")
+    
+    # Create features
+    registry = feature_registry()
+    names = FEATURE_NAMES + [name for name in extra_features if name not in FEATURE_NAMES]
+    for name in names:
+        registry.parse(name)  # Fail on unknown names before computing anything
+    
+    backend = "NumPy columnar backend" if columnar is not None else "pure Python"
+    print(f"\n🔧 Creating features ({backend})...")
+    if columnar is not None:
+        prices = columnar.as_array(prices)
+    features = registry.compute(names, prices, data_hash(RAW_DATA), FeatureCache(),
+                                report=lambda name, spec, status: print(f"  - {name} ({status})"))
+    if horizons:
+        print(f"  - Multi-horizon targets ({', '.join(f'{h}d' for h in horizons)})")
+        features.update(compute_targets(prices, horizons))
+    # Packed columns (full float64 precision, int8 target) instead of lists of boxed floats
+    features = FeatureTable.compact(features, float32=()).columns
+    target = features['target']
+    
     # Save processed data
     print("\n💾 Saving processed features...")
-    PROCESSED_DATA.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(PROCESSED_DATA, 'w', newline='') as f:
-        fieldnames = ['date', 'price', 'return', 'sma_5', 'sma_20', 'sma_50', 
-                     'rsi', 'bb_distance', 'momentum', 'volatility',
-                     'lag_1', 'lag_7', 'lag_30', 'target']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for i in range(len(prices)):
-            writer.writerow({
-                'date': dates[i],
-                'price': prices[i],
-                'return': returns[i],
-                'sma_5': sma_5[i],
-                'sma_20': sma_20[i],
-                'sma_50': sma_50[i],
-                'rsi': rsi[i],
-                'bb_distance': bb_dist[i],
-                'momentum': momentum[i],
-                'volatility': volatility[i],
-                'lag_1': lag_features['lag_1'][i],
-                'lag_7': lag_features['lag_7'][i],
-                'lag_30': lag_features['lag_30'][i],
-                'target': target[i]
-            })
-    
-    print(f"✅ Saved to: {PROCESSED_DATA}")
+    save_features(FEATURE_STORE, dates, features)
+    print(f"✅ Saved feature store to: {FEATURE_STORE}")
+    
+    if csv_export:
+        csv_path = PROCESSED_DATA.with_name(PROCESSED_DATA.name + COMPRESSION_SUFFIXES.get(compression, ''))
+        write_csv(dates, features, csv_path, compression)
+        print(f"✅ Exported CSV to: {csv_path}")
+    
+    # Save rolling state so the next run can be incremental
+    save_state(FeatureState.seeded(dates, prices))
+    print(f"✅ Saved rolling state to: {STATE_FILE}")
     
     # Summary
     print("\n📊 FEATURE SUMMARY")
     print("-" * 80)
-    print(f"Total features created: 13")
+    print(f"Total features created: {len(names)}")
     print(f"  - Price-based: 1 (close price)")
     print(f"  - Derived: 2 (returns, momentum)")
     print(f"  - Technical indicators: 4 (SMA-5, 20, 50, RSI)")
     print(f"  - Volatility: 2 (Bollinger, rolling vol)")
     print(f"  - Lag features: 3 (1, 7, 30 days)")
     print(f"  - Target: 1 (direction: 1=up, 0=down)")
+    if len(names) > len(FEATURE_NAMES):
+        print(f"  - Extra: {len(names) - len(FEATURE_NAMES)} ({', '.join(names[len(FEATURE_NAMES):])})")
+    if horizons:
+        print(f"  - Horizon targets: {2 * len(horizons)} (direction + forward return for "
+              f"{', '.join(f'{h}d' for h in horizons)})")
     
     # Check target distribution
     up_days = sum(1 for t in target if t == 1)
@@ -250,11 +335,253 @@ def engineer_features():
     print(f"Up days (1): {up_days} ({up_days/total_valid*100:.1f}%)")
     print(f"Down days (0): {down_days} ({down_days/total_valid*100:.1f}%)")
     print(f"Class balance: {'✅ Good' if abs(up_days - down_days) < total_valid * 0.1 else '⚠️ Imbalanced'}")
+    for horizon, up, down, unknown in label_summary(features, horizons):
+        print(f"  {horizon:>2}-day: {up/(up + down)*100:.1f}% up of {up + down} labeled ({unknown} pending)")
     
     print("\n" + "="*80)
     print("✅ Feature Engineering Complete!")
     print("="*80)
     print(f"\n📝 Next: Phase 4 - Train baseline model")
 
+def _line_before(f, end):
+    """Find the line ending at byte offset `end` of a binary file"""
+    pos = end
+    data = b''
+    while pos > 0:
+        step = min(4096, pos)
+        pos -= step
+        f.seek(pos)
+        data = f.read(step) + data
+        idx = data.rstrip(b'\r\n').rfind(b'\n')
+        if idx >= 0:
+            return pos + idx + 1, data[idx+1:]
+    return 0, data
+
+def save_state(state, raw_offset=None):
+    """Save the rolling feature state and how far the raw file was read"""
+    with open(RAW_DATA, 'rb') as f:
+        header = f.readline()
+        if raw_offset is None:
+            f.seek(0, 2)
+            raw_offset = f.tell()
+        _, raw_last_line = _line_before(f, raw_offset)
+    
+    payload = {
+        'raw_header': header.decode().strip(),
+        'raw_offset': raw_offset,
+        'raw_last_line': raw_last_line.decode(),
+        'features': state.state(),
+    }
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_FILE.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(payload, f)
+    tmp.replace(STATE_FILE)
+
+def load_state():
+    """Load the saved rolling state, or None if there is none"""
+    try:
+        with open(STATE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def read_new_rows(saved):
+    """Read raw bars appended after the saved offset.
+
+    Returns None if the raw file was rewritten rather than appended to.
+    Only complete lines are consumed, so a download still in progress is
+    picked up on the next run. New rows get the same quality checks as
+    the full load, continuing from the last saved bar.
+    """
+    with open(RAW_DATA, 'rb') as f:
+        header = f.readline().decode().strip()
+        f.seek(0, 2)
+        offset = saved['raw_offset']
+        if header != saved['raw_header'] or f.tell() < offset:
+            return None
+        _, line = _line_before(f, offset)
+        if line.decode() != saved['raw_last_line']:
+            return None
+        
+        f.seek(offset)
+        chunk = f.read()
+    
+    end = chunk.rfind(b'\n') + 1
+    fieldnames = next(csv.reader([header]))
+    features = saved['features']
+    validator = RowValidator(last_day=date_to_days(features['last_date']),
+                             last_price=features['history'][-1])
+    dates = []
+    prices = []
+    rows = csv.DictReader(chunk[:end].decode().splitlines(), fieldnames=fieldnames)
+    for i, row in enumerate(rows):
+        if validator.check(i, row.get('Date'), row.get('Close')) is None:
+            dates.append(row['Date'][:10])
+            prices.append(float(row['Close']))
+    
+    for name, indexes in validator.issues.items():
+        if indexes and name == 'spike':
+            print(f"⚠️ {len(indexes)} new row(s) with a return spike (kept)")
+        elif indexes:
+            print(f"⚠️ Skipped {len(indexes)} new row(s): {name.replace('_', ' ')}")
+    
+    return dates, prices, offset + end
+
+def append_csv(dates, features, backfill_target, last_date):
+    """Append rows to silver_features.csv; False if it is out of sync.
+
+    The rows before the backfilled one are copied to a temp file that
+    replaces the CSV once complete, so readers never see a half-written
+    file.
+    """
+    tmp = PROCESSED_DATA.with_name(f".{PROCESSED_DATA.name}.{os.getpid()}.tmp")
+    try:
+        with open(PROCESSED_DATA, 'rb') as f:
+            f.seek(0, 2)
+            start, line = _line_before(f, f.tell())
+            last_row = next(csv.reader([line.decode()]), None)
+            if not last_row or last_row[0] != last_date:
+                return False
+            
+            # Backfill the previous last row's target (written as -1)
+            last_row[-1] = backfill_target
+            
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(last_row)
+            writer.writerows(zip(dates, *(features[name] for name in FEATURE_NAMES)))
+            
+            f.seek(0)
+            with open(tmp, 'wb') as out:
+                remaining = start
+                while remaining:
+                    chunk = f.read(min(remaining, 1 << 20))
+                    out.write(chunk)
+                    remaining -= len(chunk)
+                out.write(buffer.getvalue().encode())
+        os.replace(tmp, PROCESSED_DATA)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+    return True
+
+def compressed_exports():
+    """Existing .gz/.zst copies of the CSV export"""
+    paths = [PROCESSED_DATA.with_name(PROCESSED_DATA.name + suffix) for suffix in COMPRESSION_SUFFIXES.values()]
+    return [path for path in paths if path.exists()]
+
+def refresh_compressed_exports(paths):
+    """Re-export compressed CSVs from the store (they cannot be appended to)"""
+    for path in paths:
+        FeatureStore(FEATURE_STORE).to_csv(path)
+        print(f"✅ Updated CSV export: {path}")
+
+@entry_point('features_incremental')
+def update_features():
+    """Append features for bars added to the raw file since the last run.
+
+    Updates the store, the plain CSV export (appended) and any compressed
+    exports (rewritten from the store).
+    """
+    
+    print("="*80)
+    print("PHASE 3: FEATURE ENGINEERING (INCREMENTAL)")
+    print("="*80)
+    
+    saved = load_state()
+    exists = FeatureStore.exists(FEATURE_STORE)
+    stored = FeatureStore(FEATURE_STORE).names[1:] if exists else []
+    horizons = stored_horizons(stored)
+    extra = [name for name in stored if name not in FEATURE_NAMES + target_names(horizons)]
+    new_rows = read_new_rows(saved) if saved and exists and not extra else None
+    if new_rows is not None:
+        store = FeatureStore(FEATURE_STORE)
+        last_date = saved['features']['last_date']
+        if not len(store) or store.column('date')[-1] != date_to_days(last_date):
+            new_rows = None
+    if new_rows is None:
+        # The rolling state only covers the standard columns; extra
+        # columns are recomputed (or read from the cache) by a rebuild
+        reason = "store has extra features" if extra else "no usable rolling state"
+        print(f"\n⚠️ {reason.capitalize()} - running full rebuild\n")
+        exports = compressed_exports()
+        engineer_features(csv_export=PROCESSED_DATA.exists(), extra_features=extra,
+                          horizons=horizons)
+        refresh_compressed_exports(exports)
+        return
+    
+    dates, prices, raw_offset = new_rows
+    print(f"\n📊 New price points since {last_date}: {len(prices)}")
+    if not prices:
+        print("✅ Features already up to date")
+        return
+    
+    # Features for the new bars; each target is known once the next bar is
+    state = FeatureState.from_state(saved['features'])
+    backfill_target = 1 if prices[0] > state.history[-1] else 0
+    features = {name: [] for name in FEATURE_NAMES}
+    for date, price in zip(dates, prices):
+        for name, value in state.update(date, price).items():
+            features[name].append(value)
+    for i in range(len(prices) - 1):
+        features['target'][i] = 1 if prices[i+1] > prices[i] else 0
+    
+    # Horizon labels of the last max(h) stored rows may now be known too
+    backfill = None
+    if horizons:
+        known = list(store.column('price')[-max(horizons):])
+        targets = compute_targets(known + list(prices), horizons)
+        backfill = {name: values[:len(known)] for name, values in targets.items()}
+        features.update({name: values[len(known):] for name, values in targets.items()})
+    
+    append_features(FEATURE_STORE, dates, features, backfill_target, backfill)
+    print(f"✅ Appended {len(prices)} rows to: {FEATURE_STORE}")
+    
+    if PROCESSED_DATA.exists():
+        # append_csv only backfills the next-day target; horizon labels need a re-export
+        if horizons or not append_csv(dates, features, backfill_target, last_date):
+            FeatureStore(FEATURE_STORE).to_csv(PROCESSED_DATA)
+        print(f"✅ Updated CSV export: {PROCESSED_DATA}")
+    refresh_compressed_exports(compressed_exports())
+    
+    save_state(state, raw_offset)
+    
+    print(f"   Last date: {state.last_date}")
+    print("\n" + "="*80)
+    print("✅ Incremental Feature Update Complete!")
+    print("="*80)
+
 if __name__ == "__main__":
-    engineer_features()
+    parser = argparse.ArgumentParser(description="Phase 3: build the processed feature store")
+    parser.add_argument('--incremental', action='store_true',
+                        help="append only bars added to the raw file since the last run "
+                             "(refreshes existing CSV exports, compressed ones included)")
+    parser.add_argument('--csv', action='store_true',
+                        help="also export silver_features.csv for humans")
+    parser.add_argument('--compress', choices=['gzip', 'zstd'], default=None,
+                        help="compress the CSV export (implies --csv; zstd needs zstandard)")
+    parser.add_argument('--features', nargs='+', default=[], metavar='NAME',
+                        help="extra features, e.g. sma_200 rsi_21 lag_60")
+    parser.add_argument('--horizons', nargs='*', type=int, default=None, metavar='DAYS',
+                        help="add direction/forward-return targets per horizon "
+                             f"(default with no values: {' '.join(map(str, HORIZONS))})")
+    args = parser.parse_args()
+    horizons = () if args.horizons is None else tuple(sorted(set(args.horizons or HORIZONS)))
+    if any(h < 1 for h in horizons):
+        parser.error("--horizons must be positive trading-day counts")
+    if args.compress == 'zstd' and importlib.util.find_spec('zstandard') is None:
+        parser.error("--compress zstd needs the zstandard package (pip install zstandard)")
+    for name in args.features:
+        try:
+            feature_registry().parse(name)
+        except ValueError as error:
+            parser.error(str(error))
+    
+    if args.incremental:
+        update_features()
+    else:
+        engineer_features(csv_export=args.csv or args.compress is not None,
+                          extra_features=args.features, compression=args.compress,
+                          horizons=horizons)
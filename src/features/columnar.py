@@ -0,0 +1,160 @@
+# Columnar Feature Backend
+# Silver Price Forecasting - NumPy-vectorized versions of the indicators
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from features.rolling import ZERO_VARIANCE_TOL
+from pipeline.trace import traced
+
+# Rows per block when a window reduction needs a temporary (rows x window) array
+CHUNK_ROWS = 1 << 16
+# Windows per prefix-sum segment in _window_sums
+SEGMENT_WINDOWS = 4
+
+def as_array(prices):
+    """Load closes into a contiguous float64 array"""
+    return np.ascontiguousarray(prices, dtype=np.float64)
+
+@traced()
+def calculate_returns(prices):
+    """Calculate daily returns"""
+    returns = np.zeros(len(prices))
+    returns[1:] = (prices[1:] - prices[:-1]) / prices[:-1] * 100
+    return returns
+
+def _window_sums(values, window):
+    """Sum of every full window; entry k covers values[k:k+window].
+
+    Prefix-sum differences, O(n) for any window. The prefix sums restart
+    every SEGMENT_WINDOWS * window rows so rounding stays at the level of
+    summing a few windows directly, and an all-zero window sums to exactly
+    0.0.
+    """
+    count = len(values) - window + 1
+    if count <= 0:
+        return np.zeros(0)
+    step = SEGMENT_WINDOWS * window  # Windows per segment
+    segments = -(-count // step)
+    padded = np.zeros(segments * step + window - 1)
+    padded[:len(values)] = values
+    # Overlapping segments: each holds its windows' rows plus the window-1 before
+    view = sliding_window_view(padded, step + window - 1)[::step]
+    prefix = np.zeros((segments, step + window))
+    np.cumsum(view, axis=1, out=prefix[:, 1:])
+    return (prefix[:, window:] - prefix[:, :-window]).reshape(-1)[:count]
+
+def _window_std(values, window):
+    """Population std of every full window, computed two-pass per block.
+
+    Variances within ZERO_VARIANCE_TOL of the window's mean square are
+    float noise and come out as 0.0, as in RollingWindow.variance().
+    """
+    windows = sliding_window_view(values, window)
+    std = np.empty(len(windows))
+    for start in range(0, len(windows), CHUNK_ROWS):
+        block = windows[start:start + CHUNK_ROWS]
+        mean = block.mean(axis=1)
+        variance = ((block - mean[:, None]) ** 2).mean(axis=1)
+        variance[variance <= ZERO_VARIANCE_TOL * (variance + mean * mean)] = 0.0
+        std[start:start + CHUNK_ROWS] = np.sqrt(variance)
+    return std
+
+@traced()
+def calculate_sma(prices, window):
+    """Calculate Simple Moving Average"""
+    sma = np.zeros(len(prices))  # Not enough data -> 0.0
+    if len(prices) >= window:
+        sma[window-1:] = _window_sums(prices, window) / window
+    return sma
+
+@traced()
+def calculate_rsi(prices, period=14):
+    """Calculate Relative Strength Index"""
+    rsi = np.full(len(prices), 50.0)  # Neutral RSI
+    if len(prices) <= period:
+        return rsi
+
+    changes = np.diff(prices)
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes > 0, 0.0, -changes)
+
+    avg_gain = _window_sums(gains, period) / period
+    avg_loss = _window_sums(losses, period) / period
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = 100 - 100 / (1 + avg_gain / avg_loss)
+    rsi[period:] = np.where(avg_loss == 0, 100.0, values)
+    return rsi
+
+@traced()
+def calculate_bollinger_bands(prices, window=20):
+    """Calculate Bollinger Bands distance from middle"""
+    bb_distance = np.zeros(len(prices))
+    if len(prices) < window:
+        return bb_distance
+
+    sma = _window_sums(prices, window) / window
+    std = _window_std(prices, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distance = (prices[window-1:] - sma) / std
+    bb_distance[window-1:] = np.where(std == 0, 0.0, distance)
+    return bb_distance
+
+@traced()
+def calculate_momentum(prices, window=5):
+    """Calculate price momentum"""
+    momentum = np.zeros(len(prices))
+    if len(prices) > window:
+        momentum[window:] = (prices[window:] - prices[:-window]) / prices[:-window] * 100
+    return momentum
+
+@traced()
+def calculate_volatility(prices, window=30):
+    """Calculate rolling volatility"""
+    volatility = np.zeros(len(prices))
+    if len(prices) >= window:
+        volatility[window-1:] = _window_std(prices, window)
+    return volatility
+
+@traced()
+def create_lag_features(prices, lags=(1, 7, 30)):
+    """Create lag features"""
+    lag_features = {}
+    for lag in lags:
+        column = np.zeros(len(prices))
+        if len(prices) > lag:
+            column[lag:] = prices[:-lag]
+        lag_features[f'lag_{lag}'] = column
+    return lag_features
+
+@traced()
+def calculate_lag(prices, lag):
+    """Price `lag` days earlier"""
+    return create_lag_features(prices, (lag,))[f'lag_{lag}']
+
+@traced()
+def create_target(prices):
+    """Create directional target (1=up, 0=down, -1=no next day)"""
+    target = np.full(len(prices), -1, dtype=np.int8)
+    target[:-1] = prices[1:] > prices[:-1]
+    return target
+
+@traced()
+def compute_features(prices):
+    """Compute every feature column of engineer_features() as arrays"""
+    prices = as_array(prices)
+    features = {
+        'price': prices,
+        'return': calculate_returns(prices),
+        'sma_5': calculate_sma(prices, 5),
+        'sma_20': calculate_sma(prices, 20),
+        'sma_50': calculate_sma(prices, 50),
+        'rsi': calculate_rsi(prices, 14),
+        'bb_distance': calculate_bollinger_bands(prices, 20),
+        'momentum': calculate_momentum(prices, 5),
+        'volatility': calculate_volatility(prices, 30),
+    }
+    features.update(create_lag_features(prices, (1, 7, 30)))
+    features['target'] = create_target(prices)
+    return features
@@ -0,0 +1,208 @@
+# Cross-Asset Features
+# Silver Price Forecasting - Time-aligned joins, cross-asset and intraday features
+#
+# Every stage is a generator over date-sorted rows, so memory stays
+# bounded by the rolling window and the read chunk rather than the file:
+#   read_chunks  - CSV rows in blocks of lines (works on minute-bar files)
+#   daily_bars   - minute bars -> daily OHLCV, one day held at a time
+#   merge_join   - inner join of sorted series on date (a trading calendar
+#                  common to all of them) by advancing the lagging side
+#   pair_features - gold/silver ratio, rolling return correlation and beta
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+RAW_DATA = BASE_DIR / "data" / "raw" / "silver_prices_data.csv"
+GOLD_DATA = BASE_DIR / "data" / "raw" / "universe" / "GC=F.csv"
+CROSS_ASSET_STORE = BASE_DIR / "data" / "processed" / "cross_asset"
+DAILY_BARS = BASE_DIR / "data" / "processed" / "daily_bars.csv"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.rolling import RollingCovariance
+
+CHUNK_BYTES = 1 << 20  # Lines read per block (~1 MB)
+WRITE_ROWS = 1 << 16   # Output rows buffered before each store append
+OHLCV = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+def read_chunks(path, columns, time_column='Date', chunk_bytes=CHUNK_BYTES):
+    """Yield lists of (timestamp, *floats) rows, about `chunk_bytes` at a time.
+
+    Rows with a missing or unparseable value are skipped.
+    """
+    with open(path, 'r', newline='') as f:
+        header = next(csv.reader([f.readline()]))
+        indexes = [header.index(time_column)] + [header.index(name) for name in columns]
+        while True:
+            lines = f.readlines(chunk_bytes)
+            if not lines:
+                return
+            chunk = []
+            for row in csv.reader(lines):
+                try:
+                    chunk.append((row[indexes[0]],) + tuple(float(row[i]) for i in indexes[1:]))
+                except (ValueError, IndexError):
+                    pass
+            yield chunk
+
+def read_rows(path, columns, time_column='Date', chunk_bytes=CHUNK_BYTES):
+    """(timestamp, *floats) rows of a CSV, read in chunks"""
+    for chunk in read_chunks(path, columns, time_column, chunk_bytes):
+        yield from chunk
+
+def daily_bars(minute_rows):
+    """Aggregate time-sorted (timestamp, open, high, low, close, volume) rows
+    into daily (date, open, high, low, close, volume) bars.
+
+    Rows with a NaN value are skipped, so a bad tick cannot poison the
+    day's bar (and every rolling window downstream of it).
+    """
+    day = None
+    for timestamp, o, h, l, c, v in minute_rows:
+        if o != o or h != h or l != l or c != c or v != v:
+            continue
+        date = timestamp[:10]
+        if date != day:
+            if day is not None:
+                yield day, open_, high, low, close, volume
+            day, open_, high, low, close, volume = date, o, h, l, c, v
+        else:
+            high = max(high, h)
+            low = min(low, l)
+            close = c
+            volume += v
+    if day is not None:
+        yield day, open_, high, low, close, volume
+
+def closes(path, intraday=False, time_column=None):
+    """(date, close) rows of a daily CSV, or of minute bars aggregated on the fly.
+
+    NaN closes are skipped; the join then treats the day as missing.
+    """
+    if intraday:
+        for bar in daily_bars(read_rows(path, OHLCV, time_column or 'Datetime')):
+            yield bar[0], bar[4]
+    else:
+        for timestamp, close in read_rows(path, ['Close'], time_column or 'Date'):
+            if close == close:
+                yield timestamp[:10], close
+
+def merge_join(*streams):
+    """Inner join of date-sorted (date, *values) streams.
+
+    Yields (date, *values of every stream) for each date present in all
+    of them; only the stream heads are held in memory.
+    """
+    iterators = [iter(stream) for stream in streams]
+    try:
+        heads = [next(it) for it in iterators]
+        while True:
+            latest = max(head[0] for head in heads)
+            for i, it in enumerate(iterators):
+                while heads[i][0] < latest:
+                    heads[i] = next(it)
+            if all(head[0] == latest for head in heads):
+                yield (latest,) + tuple(value for head in heads for value in head[1:])
+                heads = [next(it) for it in iterators]
+    except StopIteration:
+        return
+
+def pair_features(joined, window=30):
+    """Ratio, rolling correlation and beta for joined (date, base, other) rows.
+
+    The ratio is other/base (gold/silver for the defaults). Correlation
+    and beta are of the base's daily % returns on the other's, over the
+    last `window` common days; 0.0 during warm-up as for the other features.
+    """
+    rolling = RollingCovariance(window)
+    previous = None
+    for date, base, other in joined:
+        if previous is not None:
+            rolling.push((base - previous[0]) / previous[0] * 100,
+                         (other - previous[1]) / previous[1] * 100)
+        previous = (base, other)
+
+        ready = rolling.is_full()
+        yield (date, other / base,
+               rolling.correlation() if ready else 0.0,
+               rolling.beta() if ready else 0.0)
+
+def write_pair_features(rows, directory=CROSS_ASSET_STORE, window=30):
+    """Stream pair_features() rows into a feature store in blocks; returns the row count"""
+    # Here, not at module level: the streaming EDA imports this module and needs no NumPy
+    from features.feature_store import save_features, append_features
+    names = ['ratio', f'corr_{window}', f'beta_{window}']
+    count = 0
+    block = []
+
+    def flush():
+        dates = [row[0] for row in block]
+        features = {name: [row[i + 1] for row in block] for i, name in enumerate(names)}
+        if count == len(block):
+            save_features(directory, dates, features)
+        else:
+            append_features(directory, dates, features)
+        block.clear()
+
+    for row in rows:
+        block.append(row)
+        count += 1
+        if len(block) == WRITE_ROWS:
+            flush()
+    if block or not count:
+        flush()
+    return count
+
+def write_daily_csv(bars, path):
+    """Stream daily bars into an OHLCV CSV; returns the day count"""
+    count = 0
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Date'] + OHLCV)
+        for bar in bars:
+            writer.writerow(bar)
+            count += 1
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cross-asset features and intraday aggregation")
+    parser.add_argument('--base', type=Path, default=RAW_DATA, help="base series (default: silver)")
+    parser.add_argument('--other', type=Path, default=GOLD_DATA, help="other series (default: gold)")
+    parser.add_argument('--base-intraday', action='store_true', help="base file holds minute bars")
+    parser.add_argument('--other-intraday', action='store_true', help="other file holds minute bars")
+    parser.add_argument('--time-column', default=None,
+                        help="timestamp column (default: Date, or Datetime for minute bars)")
+    parser.add_argument('--window', type=int, default=30)
+    parser.add_argument('--output', type=Path, default=None,
+                        help=f"feature store directory (default: {CROSS_ASSET_STORE}), "
+                             f"or daily CSV with --aggregate (default: {DAILY_BARS})")
+    parser.add_argument('--aggregate', type=Path, default=None, metavar='MINUTES_CSV',
+                        help="only aggregate minute bars into a daily OHLCV CSV at --output")
+    args = parser.parse_args()
+
+    if args.aggregate:
+        args.output = args.output or DAILY_BARS
+        bars = daily_bars(read_rows(args.aggregate, OHLCV, args.time_column or 'Datetime'))
+        days = write_daily_csv(bars, args.output)
+        print(f"✅ Aggregated {days:,} daily bars to: {args.output}")
+        sys.exit(0)
+
+    print("="*80)
+    print("CROSS-ASSET FEATURES")
+    print("="*80)
+    print(f"Base:  {args.base}{' (minute bars)' if args.base_intraday else ''}")
+    print(f"Other: {args.other}{' (minute bars)' if args.other_intraday else ''}")
+    args.output = args.output or CROSS_ASSET_STORE
+
+    joined = merge_join(closes(args.base, args.base_intraday, args.time_column),
+                        closes(args.other, args.other_intraday, args.time_column))
+    rows = write_pair_features(pair_features(joined, args.window), args.output, args.window)
+    print(f"\n✅ {rows:,} common trading days -> {args.output}")
@@ -0,0 +1,147 @@
+# Feature Registry & Cache
+# Silver Price Forecasting - Parameterized features with a content-addressed cache
+#
+# A feature is a (function, params) spec: 'sma_200' is the 'sma' function
+# with window=200, 'rsi' is 'rsi' with its default period. Each computed
+# column is cached under a hash of its spec and of the raw data it was
+# computed from, so asking for one new setting computes only that column
+# and every other column is read back from the cache. The cache is bounded
+# in bytes and evicts least-recently-used columns first.
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+CACHE_DIR = BASE_DIR / "data" / "cache" / "features"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.feature_store import FLOAT_DTYPE, read_column, write_column
+
+# Bump when an indicator's definition changes so old cache entries miss
+FEATURE_CODE_VERSION = 1
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+class FeatureSpec:
+    """One parameterized feature: a registered kind plus its parameters"""
+
+    def __init__(self, kind, params):
+        self.kind = kind
+        self.params = dict(params)
+
+    def key(self, data_hash):
+        """Content address of this column for the given raw data"""
+        payload = json.dumps({'kind': self.kind, 'params': self.params,
+                              'data': data_hash, 'version': FEATURE_CODE_VERSION},
+                             sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def __repr__(self):
+        return f"FeatureSpec({self.kind!r}, {self.params!r})"
+
+class FeatureCache:
+    """Directory of cached columns with size-bounded LRU eviction.
+
+    Recency is the file mtime, refreshed on every hit, so several processes
+    can share one cache directory without a separate index.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=DEFAULT_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def path(self, key):
+        return self.directory / f"{key}.npy"
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            column = read_column(path)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        return column
+
+    def put(self, key, values, dtype):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / f"{key}.tmp-{os.getpid()}"
+        write_column(tmp, values, dtype)
+        tmp.replace(self.path(key))
+        self.evict()
+
+    def evict(self):
+        """Drop least-recently-used columns until under max_bytes"""
+        entries = []
+        for path in self.directory.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            total -= size
+
+class FeatureRegistry:
+    """Feature kinds by name, each a function of prices plus parameters"""
+
+    def __init__(self):
+        self.kinds = {}
+
+    def register(self, kind, function, dtype=FLOAT_DTYPE, cache=True, **defaults):
+        """Register `function(prices, **params)`; defaults give parameter order"""
+        self.kinds[kind] = (function, dtype, cache, defaults)
+
+    def parse(self, name):
+        """'sma_200' -> FeatureSpec('sma', {'window': 200})"""
+        for kind in sorted(self.kinds, key=len, reverse=True):
+            _, _, _, defaults = self.kinds[kind]
+            if name == kind:
+                params = dict(defaults)
+            elif name.startswith(kind + '_') and name[len(kind) + 1:].isdigit() and defaults:
+                params = dict(defaults)
+                value = int(name[len(kind) + 1:])
+                if value < 1:
+                    raise ValueError(f"Feature '{name}': {next(iter(defaults))} must be at least 1")
+                params[next(iter(defaults))] = value
+            else:
+                continue
+            if any(value is None for value in params.values()):
+                raise ValueError(f"Feature '{name}' needs a parameter, e.g. '{kind}_10'")
+            return FeatureSpec(kind, params)
+        raise ValueError(f"Unknown feature: {name}")
+
+    def compute(self, names, prices, data_hash, cache=None, report=None):
+        """Columns for `names`, computing only those missing from the cache"""
+        columns = {}
+        for name in names:
+            spec = self.parse(name)
+            function, dtype, cacheable, _ = self.kinds[spec.kind]
+            key = spec.key(data_hash)
+
+            column = cache.get(key) if cache is not None and cacheable else None
+            if column is None:
+                column = function(prices, **spec.params)
+                if cache is not None and cacheable:
+                    cache.put(key, column, dtype)
+                status = "computed"
+            else:
+                status = "cached"
+            if report:
+                report(name, spec, status)
+            columns[name] = column
+        return columns
@@ -0,0 +1,354 @@
+# Rolling Statistics Engine
+# Silver Price Forecasting - Single-pass window updates for the indicators
+
+import math
+from collections import deque
+
+# Variances this small relative to the window's mean square are float noise
+ZERO_VARIANCE_TOL = 1e-12
+
+
+class RollingWindow:
+    """Fixed-size window with running sum and sum of squares.
+
+    Values are accumulated relative to a shift so the sum-of-squares
+    variance does not cancel catastrophically, and the sums are rebuilt
+    exactly once per window of evictions so rounding drift stays bounded
+    on very long histories (amortised O(1) per push).
+    """
+
+    def __init__(self, window, values=()):
+        self.window = window
+        self.values = deque()
+        self.shift = 0.0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.nonzero = 0
+        self._evictions = 0
+        for value in values:
+            self.push(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def is_full(self):
+        return len(self.values) == self.window
+
+    def push(self, value):
+        """Add a value, evicting the oldest one once the window is full"""
+        if not self.values:
+            self.shift = value
+
+        if len(self.values) == self.window:
+            old = self.values.popleft()
+            d = old - self.shift
+            self.total -= d
+            self.total_sq -= d * d
+            if old != 0:
+                self.nonzero -= 1
+            self._evictions += 1
+
+        self.values.append(value)
+        d = value - self.shift
+        self.total += d
+        self.total_sq += d * d
+        if value != 0:
+            self.nonzero += 1
+
+        if self._evictions >= self.window:
+            self._resync()
+
+    def _resync(self):
+        """Recompute the sums exactly around the current mean"""
+        n = len(self.values)
+        self.shift = self.shift + self.total / n
+        self.total = math.fsum(v - self.shift for v in self.values)
+        self.total_sq = math.fsum((v - self.shift) ** 2 for v in self.values)
+        self._evictions = 0
+
+    def state(self):
+        """JSON-serialisable snapshot of the window and its running sums"""
+        return {
+            'window': self.window,
+            'values': list(self.values),
+            'shift': self.shift,
+            'total': self.total,
+            'total_sq': self.total_sq,
+            'evictions': self._evictions,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        rolling = cls(state['window'])
+        rolling.values = deque(state['values'])
+        rolling.shift = state['shift']
+        rolling.total = state['total']
+        rolling.total_sq = state['total_sq']
+        rolling.nonzero = sum(1 for v in rolling.values if v != 0)
+        rolling._evictions = state['evictions']
+        return rolling
+
+    def sum(self):
+        return self.shift * len(self.values) + self.total
+
+    def mean(self):
+        return self.shift + self.total / len(self.values)
+
+    def variance(self):
+        """Population variance of the window"""
+        n = len(self.values)
+        variance = (self.total_sq - self.total * self.total / n) / n
+        # Mean square of the values themselves (variance + mean^2), not of the
+        # shifted ones, so the cut-off does not depend on the shift
+        mean = self.mean()
+        if variance <= ZERO_VARIANCE_TOL * (variance + mean * mean):
+            return 0.0
+        return variance
+
+    def std(self):
+        return self.variance() ** 0.5
+
+
+class RollingCovariance:
+    """Fixed-size window over (x, y) pairs with running co-moments.
+
+    Same shifted sums and periodic exact resync as RollingWindow, with a
+    running sum of cross products for covariance, correlation and beta.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.pairs = deque()
+        self.shift_x = 0.0
+        self.shift_y = 0.0
+        self.sx = self.sy = self.sxx = self.syy = self.sxy = 0.0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def is_full(self):
+        return len(self.pairs) == self.window
+
+    def _add(self, x, y, sign):
+        dx = x - self.shift_x
+        dy = y - self.shift_y
+        self.sx += sign * dx
+        self.sy += sign * dy
+        self.sxx += sign * dx * dx
+        self.syy += sign * dy * dy
+        self.sxy += sign * dx * dy
+
+    def push(self, x, y):
+        """Add a pair, evicting the oldest one once the window is full"""
+        if not self.pairs:
+            self.shift_x, self.shift_y = x, y
+
+        if len(self.pairs) == self.window:
+            self._add(*self.pairs.popleft(), -1)
+            self._evictions += 1
+
+        self.pairs.append((x, y))
+        self._add(x, y, 1)
+
+        if self._evictions >= self.window:
+            self._resync()
+
+    def _resync(self):
+        """Recompute the sums exactly around the current means"""
+        n = len(self.pairs)
+        self.shift_x += self.sx / n
+        self.shift_y += self.sy / n
+        dx = [x - self.shift_x for x, _ in self.pairs]
+        dy = [y - self.shift_y for _, y in self.pairs]
+        self.sx = math.fsum(dx)
+        self.sy = math.fsum(dy)
+        self.sxx = math.fsum(d * d for d in dx)
+        self.syy = math.fsum(d * d for d in dy)
+        self.sxy = math.fsum(a * b for a, b in zip(dx, dy))
+        self._evictions = 0
+
+    def _variance(self, total, total_sq):
+        n = len(self.pairs)
+        variance = (total_sq - total * total / n) / n
+        if variance <= ZERO_VARIANCE_TOL * (total_sq / n):
+            return 0.0
+        return variance
+
+    def variance_x(self):
+        return self._variance(self.sx, self.sxx)
+
+    def variance_y(self):
+        return self._variance(self.sy, self.syy)
+
+    def covariance(self):
+        """Population covariance of the window"""
+        n = len(self.pairs)
+        return (self.sxy - self.sx * self.sy / n) / n
+
+    def correlation(self):
+        """Pearson correlation; 0.0 when either side is flat"""
+        vx, vy = self.variance_x(), self.variance_y()
+        if vx == 0 or vy == 0:
+            return 0.0
+        return max(-1.0, min(1.0, self.covariance() / math.sqrt(vx * vy)))
+
+    def beta(self):
+        """Slope of x on y (y is the benchmark); 0.0 when y is flat"""
+        vy = self.variance_y()
+        return self.covariance() / vy if vy else 0.0
+
+
+class RollingRSI:
+    """Simple-average RSI over the last `period` price changes"""
+
+    def __init__(self, period=14):
+        self.period = period
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+        self.last_price = None
+
+    def push(self, price):
+        """Add a price and return the RSI, or None while warming up"""
+        if self.last_price is not None:
+            change = price - self.last_price
+            if change > 0:
+                self.gains.push(change)
+                self.losses.push(0.0)
+            else:
+                self.gains.push(0.0)
+                self.losses.push(abs(change))
+        self.last_price = price
+
+        if not self.gains.is_full():
+            return None
+        return self.value()
+
+    def state(self):
+        return {
+            'period': self.period,
+            'gains': self.gains.state(),
+            'losses': self.losses.state(),
+            'last_price': self.last_price,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        rsi = cls(state['period'])
+        rsi.gains = RollingWindow.from_state(state['gains'])
+        rsi.losses = RollingWindow.from_state(state['losses'])
+        rsi.last_price = state['last_price']
+        return rsi
+
+    def value(self):
+        if self.losses.nonzero == 0:
+            return 100.0
+        avg_gain = self.gains.sum() / self.period if self.gains.nonzero else 0.0
+        avg_loss = self.losses.sum() / self.period
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+class FeatureState:
+    """Per-bar state for every engineer_features() column.
+
+    Holds the rolling windows and a short price history for the lags, so
+    each bar is an O(1) update and the state can be saved between runs.
+    Targets need the next bar, so update() always leaves them at -1.
+    """
+
+    def __init__(self, sma_windows=(5, 20, 50), rsi_period=14, bb_window=20,
+                 momentum_window=5, volatility_window=30, lags=(1, 7, 30)):
+        self.sma = {window: RollingWindow(window) for window in sma_windows}
+        self.rsi = RollingRSI(rsi_period)
+        self.bb = RollingWindow(bb_window)
+        self.volatility = RollingWindow(volatility_window)
+        self.momentum_window = momentum_window
+        self.lags = tuple(lags)
+        self.history = deque(maxlen=max(self.lags + (momentum_window,)) + 1)
+        self.count = 0
+        self.last_date = None
+
+    def warmup_length(self):
+        """Bars of history needed before every feature is past its warm-up"""
+        windows = list(self.sma) + [self.bb.window, self.volatility.window,
+                                    self.rsi.period + 1, self.history.maxlen]
+        return max(windows)
+
+    @classmethod
+    def seeded(cls, dates, prices, **params):
+        """Build the state from the tail of a price history"""
+        state = cls(**params)
+        tail = state.warmup_length()
+        for date, price in zip(dates[-tail:], prices[-tail:]):
+            state.update(date, price)
+        state.count = len(prices)
+        return state
+
+    def update(self, date, price):
+        """Add one bar and return its feature values by column name"""
+        previous = self.history[-1] if self.history else None
+        self.history.append(price)
+        self.count += 1
+        self.last_date = date
+
+        features = {'price': price}
+        features['return'] = 0.0 if previous is None else (price - previous) / previous * 100
+
+        for window, rolling in self.sma.items():
+            rolling.push(price)
+            features[f'sma_{window}'] = rolling.mean() if rolling.is_full() else 0.0
+
+        rsi = self.rsi.push(price)
+        features['rsi'] = 50.0 if rsi is None else rsi
+
+        self.bb.push(price)
+        std_dev = self.bb.std() if self.bb.is_full() else 0.0
+        features['bb_distance'] = 0.0 if std_dev == 0 else (price - self.bb.mean()) / std_dev
+
+        window = self.momentum_window
+        if len(self.history) > window:
+            past = self.history[-1 - window]
+            features['momentum'] = (price - past) / past * 100
+        else:
+            features['momentum'] = 0.0
+
+        self.volatility.push(price)
+        features['volatility'] = self.volatility.std() if self.volatility.is_full() else 0.0
+
+        for lag in self.lags:
+            features[f'lag_{lag}'] = self.history[-1 - lag] if len(self.history) > lag else 0.0
+
+        features['target'] = -1
+        return features
+
+    def state(self):
+        """JSON-serialisable snapshot of every indicator's rolling state"""
+        return {
+            'sma': [rolling.state() for rolling in self.sma.values()],
+            'rsi': self.rsi.state(),
+            'bb': self.bb.state(),
+            'volatility': self.volatility.state(),
+            'momentum_window': self.momentum_window,
+            'lags': list(self.lags),
+            'history': list(self.history),
+            'count': self.count,
+            'last_date': self.last_date,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        features = cls(sma_windows=[s['window'] for s in state['sma']],
+                       rsi_period=state['rsi']['period'],
+                       bb_window=state['bb']['window'],
+                       momentum_window=state['momentum_window'],
+                       volatility_window=state['volatility']['window'],
+                       lags=state['lags'])
+        features.sma = {s['window']: RollingWindow.from_state(s) for s in state['sma']}
+        features.rsi = RollingRSI.from_state(state['rsi'])
+        features.bb = RollingWindow.from_state(state['bb'])
+        features.volatility = RollingWindow.from_state(state['volatility'])
+        features.history.extend(state['history'])
+        features.count = state['count']
+        features.last_date = state['last_date']
+        return features
@@ -0,0 +1,112 @@
+# Multi-Horizon Targets
+# Silver Price Forecasting - Direction labels and forward returns per horizon
+#
+# For each horizon h (trading days) two columns are produced:
+#   target_{h}d       1 if the close h days ahead is higher, 0 if not,
+#                     -1 where that close is not known yet (last h rows)
+#   fwd_return_{h}d   percent change to the close h days ahead (NaN if unknown)
+# target_1d matches the next-day `target` column. All horizons come from
+# one (rows x max_horizon+1) forward-window view of the prices, so adding
+# a horizon costs one column gather rather than another pass over the data.
+
+import math
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    np = None
+
+# The ModelCard's 30-day goal plus the shorter horizons in between
+HORIZONS = (1, 5, 10, 20, 30)
+
+def target_name(horizon):
+    return f"target_{horizon}d"
+
+def return_name(horizon):
+    return f"fwd_return_{horizon}d"
+
+def target_names(horizons=HORIZONS):
+    """Store column names for the given horizons, in build order"""
+    names = []
+    for horizon in horizons:
+        names += [target_name(horizon), return_name(horizon)]
+    return names
+
+def parse_horizon(name):
+    """'target_30d' / 'fwd_return_30d' -> 30; None for any other column"""
+    for prefix in ("target_", "fwd_return_"):
+        if name.startswith(prefix) and name.endswith("d") and name[len(prefix):-1].isdigit():
+            return int(name[len(prefix):-1])
+    return None
+
+def stored_horizons(names):
+    """Horizons with both columns present among `names`, in column order"""
+    horizons = []
+    for name in names:
+        horizon = parse_horizon(name)
+        if (horizon is not None and horizon not in horizons
+                and target_name(horizon) in names and return_name(horizon) in names):
+            horizons.append(horizon)
+    return horizons
+
+def validate_horizons(horizons):
+    horizons = list(dict.fromkeys(horizons))
+    if not horizons or any(h < 1 for h in horizons):
+        raise ValueError(f"Horizons must be positive trading-day counts, got {horizons}")
+    return horizons
+
+def forward_window(prices, width):
+    """(rows x width) view: row i holds prices[i], ..., prices[i+width-1],
+    NaN past the last price"""
+    padded = np.full(len(prices) + width - 1, np.nan)
+    padded[:len(prices)] = prices
+    return sliding_window_view(padded, width)
+
+def compute_targets(prices, horizons=HORIZONS):
+    """Direction label and forward-return columns for every horizon"""
+    horizons = validate_horizons(horizons)
+    if np is None:
+        return _compute_targets_lists(prices, horizons)
+
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    window = forward_window(prices, max(horizons) + 1)
+    ahead = window[:, horizons]  # Column j: the close horizons[j] days ahead
+    known = ~np.isnan(ahead)
+    now = prices[:, None]
+    returns = (ahead - now) / now * 100
+    direction = np.where(known, ahead > now, -1).astype(np.int8)
+
+    columns = {}
+    for j, horizon in enumerate(horizons):
+        columns[target_name(horizon)] = direction[:, j]
+        columns[return_name(horizon)] = np.ascontiguousarray(returns[:, j])
+    return columns
+
+def _compute_targets_lists(prices, horizons):
+    """Pure-Python version: one pass over the rows, every horizon per row"""
+    prices = list(prices)
+    n = len(prices)
+    columns = {name: [] for name in target_names(horizons)}
+    labels = [columns[target_name(h)] for h in horizons]
+    returns = [columns[return_name(h)] for h in horizons]
+    for i, price in enumerate(prices):
+        for horizon, label, change in zip(horizons, labels, returns):
+            if i + horizon < n:
+                ahead = prices[i + horizon]
+                label.append(1 if ahead > price else 0)
+                change.append((ahead - price) / price * 100)
+            else:
+                label.append(-1)
+                change.append(math.nan)
+    return columns
+
+def label_summary(columns, horizons):
+    """(horizon, up, down, unknown) per horizon"""
+    summary = []
+    for horizon in horizons:
+        labels = columns[target_name(horizon)]
+        up = sum(1 for t in labels if t == 1)
+        down = sum(1 for t in labels if t == 0)
+        summary.append((horizon, up, down, len(labels) - up - down))
+    return summary
@@ -0,0 +1,354 @@
+# Model Artifact Store
+# Silver Price Forecasting - Fitted models, scaler parameters and feature specs
+#
+# models/<key>/ holds one fitted model:
+#   manifest.json        model, params, feature spec, fingerprints, versions
+#   scaler_mean.npy      StandardScaler parameters (one value per feature)
+#   scaler_scale.npy
+#   coef.npy, intercept.npy, classes.npy   linear models only
+#   estimator.joblib     the fitted sklearn estimator (uncompressed)
+# The key hashes the model, its params, the feature spec and the training
+# data fingerprint, so refitting the same candidate on the same data finds
+# the existing artifact instead. Arrays are memory-mapped on load; linear
+# models predict from their .npy weights without importing sklearn at all.
+#
+# An artifact is stale when the feature code (src/features, src/data) or
+# the sklearn version it was pickled with has changed, or when the rows it
+# was trained on no longer hash to its data fingerprint. Bars appended
+# after training do not make it stale.
+#
+# models/matrices/<target>-<key>/ caches the feature matrix, labels and
+# dates that backtest.load_dataset() assembles, keyed by the feature store
+# columns' size and mtime plus the code fingerprint.
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+ARTIFACT_DIR = BASE_DIR / "models"
+MATRIX_DIR = ARTIFACT_DIR / "matrices"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.feature_store import FLOAT_DTYPE, write_column
+from features.registry import FEATURE_CODE_VERSION
+
+ARTIFACT_VERSION = 1
+MANIFEST = "manifest.json"
+ESTIMATOR_FILE = "estimator.joblib"
+# Code whose changes alter the feature values a model was trained on
+FEATURE_CODE = [SRC_DIR / "features", SRC_DIR / "data" / "loader.py", SRC_DIR / "data" / "validate.py"]
+
+def sklearn_version():
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version('scikit-learn')
+    except PackageNotFoundError:
+        return None
+
+def code_fingerprint():
+    """Hash of the feature code and FEATURE_CODE_VERSION"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{FEATURE_CODE_VERSION}".encode())
+    for root in FEATURE_CODE:
+        for path in sorted(root.glob("*.py")) if root.is_dir() else [root]:
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def data_fingerprint(X, y):
+    """Hash of a training matrix and its labels (values, shape and dtype)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (np.ascontiguousarray(X, dtype=np.float64), np.ascontiguousarray(y, dtype=np.int8)):
+        digest.update(f"{array.shape}".encode())
+        digest.update(memoryview(array).cast('B'))
+    return digest.hexdigest()
+
+def feature_spec(features, target='target', horizon=1):
+    """Exactly what the model's input columns and labels are"""
+    from models.backtest import WARMUP_ROWS
+    return {'features': list(features), 'target': target, 'horizon': horizon,
+            'warmup_rows': WARMUP_ROWS, 'feature_code_version': FEATURE_CODE_VERSION}
+
+def artifact_key(model, params, spec, data_fp):
+    payload = json.dumps({'model': model, 'params': params, 'spec': spec, 'data': data_fp,
+                          'version': ARTIFACT_VERSION}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+def _split_pipeline(estimator):
+    """(StandardScaler or None, final estimator) of a fitted make_pipeline()"""
+    steps = getattr(estimator, 'steps', None)
+    if not steps:
+        return None, estimator
+    scaler = steps[0][1] if len(steps) == 2 and hasattr(steps[0][1], 'scale_') else None
+    if scaler is None:
+        return None, estimator
+    return scaler, steps[-1][1]
+
+def save_artifact(estimator, model, params, spec, X, y, directory=ARTIFACT_DIR, metrics=None):
+    """Store a fitted estimator trained on (X, y); returns the Artifact"""
+    import joblib
+
+    data_fp = data_fingerprint(X, y)
+    key = artifact_key(model, params, spec, data_fp)
+    directory = Path(directory)
+    target = directory / key
+    tmp = directory / f".{key}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    try:
+        scaler, final = _split_pipeline(estimator)
+        files = []
+        if scaler is not None:
+            write_column(tmp / "scaler_mean.npy", scaler.mean_, FLOAT_DTYPE)
+            write_column(tmp / "scaler_scale.npy", scaler.scale_, FLOAT_DTYPE)
+            files += ["scaler_mean.npy", "scaler_scale.npy"]
+        linear = hasattr(final, 'coef_') and len(getattr(final, 'classes_', ())) == 2
+        if linear:
+            np.save(tmp / "coef.npy", np.ascontiguousarray(final.coef_[0], dtype=np.float64))
+            np.save(tmp / "intercept.npy", np.asarray(final.intercept_, dtype=np.float64))
+            np.save(tmp / "classes.npy", np.asarray(final.classes_))
+            files += ["coef.npy", "intercept.npy", "classes.npy"]
+        joblib.dump(final, tmp / ESTIMATOR_FILE)  # Uncompressed, so arrays can be mapped
+        files.append(ESTIMATOR_FILE)
+
+        manifest = {
+            'version': ARTIFACT_VERSION,
+            'key': key,
+            'model': model,
+            'params': params,
+            'spec': spec,
+            'scaled': scaler is not None,
+            'linear': linear,
+            'rows': len(y),
+            'data_fingerprint': data_fp,
+            'code_fingerprint': code_fingerprint(),
+            'sklearn': sklearn_version(),
+            'numpy': np.__version__,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'metrics': metrics or {},
+            'files': files,
+        }
+        with open(tmp / MANIFEST, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        # Swap the whole directory in; a reader never sees half an artifact
+        if target.exists():
+            shutil.rmtree(target)
+        os.replace(tmp, target)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return Artifact(target)
+
+class Artifact:
+    """A stored model; arrays are mapped and the estimator unpickled on first use"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path / MANIFEST, 'r') as f:
+            self.manifest = json.load(f)
+        self.spec = self.manifest['spec']
+        self.features = self.spec['features']
+        self._arrays = {}
+        self._estimator = None
+
+    def __repr__(self):
+        return f"Artifact({self.manifest['key']}, {self.manifest['model']}, {self.spec['target']})"
+
+    def array(self, name):
+        if name not in self._arrays:
+            self._arrays[name] = np.load(self.path / f"{name}.npy", mmap_mode='r')
+        return self._arrays[name]
+
+    @property
+    def estimator(self):
+        """The final sklearn estimator (without the scaler)"""
+        if self._estimator is None:
+            import joblib
+            self._estimator = joblib.load(self.path / ESTIMATOR_FILE, mmap_mode='r')
+        return self._estimator
+
+    def transform(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if self.manifest['scaled']:
+            X = (X - self.array('scaler_mean')) / self.array('scaler_scale')
+        return X
+
+    def decision_function(self, X):
+        """Linear score of each row (linear models only)"""
+        return self.transform(X) @ self.array('coef') + self.array('intercept')[0]
+
+    def predict(self, X):
+        if self.manifest['linear']:
+            classes = self.array('classes')
+            return classes[(self.decision_function(X) > 0).astype(np.intp)]
+        return self.estimator.predict(self.transform(X))
+
+    def predict_proba(self, X):
+        """P(up) per row"""
+        if self.manifest['linear'] and self.manifest['model'] == 'lr':
+            return 1 / (1 + np.exp(-self.decision_function(X)))
+        estimator = self.estimator
+        proba = estimator.predict_proba(self.transform(X))
+        return proba[:, list(estimator.classes_).index(1)]
+
+    def pipeline(self):
+        """The fitted estimator as a sklearn Pipeline again, scaler included"""
+        if not self.manifest['scaled']:
+            return self.estimator
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import StandardScaler
+        scaler = StandardScaler()
+        scaler.mean_ = np.array(self.array('scaler_mean'))
+        scaler.scale_ = np.array(self.array('scaler_scale'))
+        scaler.var_ = scaler.scale_ ** 2
+        scaler.n_features_in_ = len(scaler.mean_)
+        scaler.n_samples_seen_ = self.manifest['rows']
+        return make_pipeline(scaler, self.estimator)
+
+    def stale_reasons(self, X=None, y=None):
+        """Why this artifact no longer matches the code (and, given the
+        current training rows, the data); empty if it is fresh"""
+        reasons = []
+        if self.manifest['code_fingerprint'] != code_fingerprint():
+            reasons.append("feature code changed")
+        if self.manifest['sklearn'] != sklearn_version():
+            reasons.append(f"scikit-learn {self.manifest['sklearn']} -> {sklearn_version()}")
+        if X is not None:
+            rows = self.manifest['rows']
+            if len(y) < rows or data_fingerprint(X[:rows], y[:rows]) != self.manifest['data_fingerprint']:
+                reasons.append("training data changed")
+        return reasons
+
+def list_artifacts(directory=ARTIFACT_DIR):
+    """Every stored artifact, newest first"""
+    artifacts = []
+    for path in Path(directory).glob(f"*/{MANIFEST}"):
+        try:
+            artifacts.append(Artifact(path.parent))
+        except (OSError, ValueError):
+            continue
+    return sorted(artifacts, key=lambda a: a.manifest['created'], reverse=True)
+
+def find_artifact(model, params, spec, X, y, directory=ARTIFACT_DIR):
+    """The fresh artifact for this exact candidate and training data, or None"""
+    path = Path(directory) / artifact_key(model, params, spec, data_fingerprint(X, y))
+    if not (path / MANIFEST).exists():
+        return None
+    artifact = Artifact(path)
+    return None if artifact.stale_reasons() else artifact
+
+def latest_artifact(target=None, model=None, directory=ARTIFACT_DIR):
+    """Newest artifact whose code fingerprint is current (optionally for one
+    target or model)"""
+    for artifact in list_artifacts(directory):
+        if target is not None and artifact.spec['target'] != target:
+            continue
+        if model is not None and artifact.manifest['model'] != model:
+            continue
+        if not artifact.stale_reasons():
+            return artifact
+    return None
+
+def _matrix_key(target, features):
+    from models.baseline import FEATURE_STORE
+    from features.feature_store import FeatureStore
+    store = FeatureStore(FEATURE_STORE)
+    parts = [target, features, code_fingerprint()]
+    for name in features + [target, 'date']:
+        stat = store.path(name).stat()
+        parts.append([name, stat.st_size, stat.st_mtime_ns])
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()[:16]
+
+def cached_dataset(target='target', directory=MATRIX_DIR):
+    """backtest.load_dataset(target) through an on-disk, memory-mapped cache"""
+    from features.build_features import MODEL_FEATURES
+    from features.feature_store import date_to_days
+    from models.backtest import load_dataset
+
+    try:
+        key = _matrix_key(target, MODEL_FEATURES)
+    except (OSError, KeyError):
+        return load_dataset(target)  # No typed store (CSV fallback): nothing to key on
+    # One entry per target, so alternating targets (--horizon runs) keep theirs
+    directory = Path(directory)
+    path = directory / f"{target}-{key}"
+    if (path / "X.npy").exists():
+        return _load_matrix(path)
+
+    X, y, dates = load_dataset(target)
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f".{path.name}.tmp-", dir=directory))
+    try:
+        np.save(tmp / "X.npy", X)
+        np.save(tmp / "y.npy", y)
+        np.save(tmp / "days.npy", np.array([date_to_days(d) for d in dates], dtype=np.int64))
+        # This target's older matrices are dead once the store changed
+        for old in directory.glob(f"{target}-*"):
+            if old.is_dir() and old != path:
+                shutil.rmtree(old, ignore_errors=True)
+        try:
+            os.replace(tmp, path)
+        except OSError:
+            if not (path / "X.npy").exists():
+                raise
+            # Another process cached the same matrix first; theirs is identical
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return X, y, dates
+
+def _load_matrix(path):
+    from features.feature_store import days_to_date
+    days = np.load(path / "days.npy", mmap_mode='r')
+    return (np.load(path / "X.npy", mmap_mode='r'), np.load(path / "y.npy", mmap_mode='r'),
+            [days_to_date(d) for d in days.tolist()])
+
+if __name__ == "__main__":
+    from features.build_features import MODEL_FEATURES
+
+    parser = argparse.ArgumentParser(description="List stored model artifacts and their freshness")
+    parser.add_argument('--dir', type=Path, default=ARTIFACT_DIR)
+    parser.add_argument('--prune', action='store_true', help="delete stale artifacts")
+    args = parser.parse_args()
+
+    artifacts = list_artifacts(args.dir)
+    print("="*80)
+    print(f"MODEL ARTIFACTS ({args.dir})")
+    print("="*80)
+    if not artifacts:
+        print("No artifacts yet (run src/models/train.py)")
+
+    datasets = {}
+    for artifact in artifacts:
+        target = artifact.spec['target']
+        if target not in datasets:
+            try:
+                datasets[target] = cached_dataset(target)[:2]
+            except KeyError:
+                datasets[target] = (None, None)  # Target column no longer built
+        X, y = datasets[target]
+        if X is None:
+            reasons = [f"no {target} column"]
+        else:
+            columns = [MODEL_FEATURES.index(f) for f in artifact.features]
+            reasons = artifact.stale_reasons(np.asarray(X)[:, columns], y)
+        manifest = artifact.manifest
+        status = "✅ fresh" if not reasons else f"⚠️ stale: {', '.join(reasons)}"
+        print(f"{manifest['key']}  {manifest['model']:<4} {target:<11}{manifest['rows']:>6} rows  "
+              f"{manifest['created']}  {status}")
+        if reasons and args.prune:
+            shutil.rmtree(artifact.path)
+            print(f"   🗑️ Removed {artifact.path}")
@@ -0,0 +1,224 @@
+# Walk-Forward Backtest
+# Silver Price Forecasting - Expanding/sliding-window evaluation over many folds
+#
+# The single 70/15/15 split gives one test window. Here the model is refit
+# on a training window, scored on the following test window, and the
+# windows move forward by `step` until the data runs out. Folds run in a
+# process pool; the feature matrix lives in shared memory so workers map
+# it instead of receiving a pickled copy per fold.
+
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+# Make src/ importable when run as a script
+SRC_DIR = Path(__file__).parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.build_features import MODEL_FEATURES
+from pipeline.trace import traced
+
+# Rows at the start of the series still inside the longest (SMA-50) warm-up
+WARMUP_ROWS = 50
+
+def walk_forward_folds(n, train_size, test_size, step=None, embargo=1, expanding=True):
+    """(train_start, train_end, test_start, test_end) for every fold.
+
+    `embargo` rows are dropped between training and test windows; the
+    default of 1 covers the next-day target, whose label uses the first
+    test row's price.
+    """
+    step = step or test_size
+    folds = []
+    train_end = train_size
+    while train_end + embargo + test_size <= n:
+        train_start = 0 if expanding else train_end - train_size
+        test_start = train_end + embargo
+        folds.append((train_start, train_end, test_start, test_start + test_size))
+        train_end += step
+    return folds
+
+class CrossoverRule:
+    """Baseline 2 as an estimator: up if feature[fast] > feature[slow]"""
+
+    def __init__(self, fast=MODEL_FEATURES.index('sma_5'), slow=MODEL_FEATURES.index('sma_20')):
+        self.fast = fast
+        self.slow = slow
+
+    def fit(self, X, y):
+        return self
+
+    def predict(self, X):
+        return (X[:, self.fast] > X[:, self.slow]).astype(np.int8)
+
+# Worker-side views of arrays shared by the parent process
+SHARED = {}
+
+def attach_shared(spec):
+    """Pool initializer: map the shared arrays without copying them"""
+    for key, (name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=name)
+        SHARED[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+def share_array(array):
+    """Copy an array into a new shared-memory block; returns (block, spec)"""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+def _run_fold(task):
+    """Fit on one training window and score the following test window"""
+    fold, (train_start, train_end, test_start, test_end), model = task
+    X = SHARED['X'][1]
+    y = SHARED['y'][1]
+
+    start = time.perf_counter()
+    model.fit(X[train_start:train_end], y[train_start:train_end])
+    predictions = np.asarray(model.predict(X[test_start:test_end]))
+    correct = int((predictions == y[test_start:test_end]).sum())
+    total = test_end - test_start
+
+    return {
+        'fold': fold,
+        'train': (train_start, train_end),
+        'test': (test_start, test_end),
+        'correct': correct,
+        'total': total,
+        'accuracy': correct / total * 100 if total else 0,
+        'seconds': time.perf_counter() - start,
+    }
+
+@traced()
+def run_backtest(X, y, folds, model, workers=None):
+    """Score `model` on every fold; returns per-fold result rows in order"""
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.int8)
+    tasks = [(i, fold, model) for i, fold in enumerate(folds)]
+    workers = min(workers or os.cpu_count() or 1, len(tasks)) or 1
+
+    if workers == 1:
+        SHARED.update(X=(None, X), y=(None, y))
+        try:
+            return [_run_fold(task) for task in tasks]
+        finally:
+            SHARED.clear()
+
+    x_block, x_spec = share_array(X)
+    y_block, y_spec = share_array(y)
+    try:
+        with ProcessPoolExecutor(workers, initializer=attach_shared,
+                                 initargs=({'X': x_spec, 'y': y_spec},)) as pool:
+            return list(pool.map(_run_fold, tasks))
+    finally:
+        for block in (x_block, y_block):
+            block.close()
+            block.unlink()
+
+def summarize(results):
+    """Pooled and per-fold aggregate accuracy"""
+    correct = sum(r['correct'] for r in results)
+    total = sum(r['total'] for r in results)
+    accuracies = [r['accuracy'] for r in results]
+    pooled = correct / total if total else 0
+    mean = sum(accuracies) / len(accuracies) if accuracies else 0
+    spread = (sum((a - mean) ** 2 for a in accuracies) / (len(accuracies) - 1)) ** 0.5 \
+        if len(accuracies) > 1 else 0
+    return {
+        'folds': len(results),
+        'correct': correct,
+        'total': total,
+        'pooled_acc': pooled * 100,
+        'pooled_se': math.sqrt(pooled * (1 - pooled) / total) * 100 if total else 0,
+        'mean_fold_acc': mean,
+        'std_fold_acc': spread,
+    }
+
+def make_model(name):
+    """Estimator by name; scikit-learn models are imported on demand"""
+    if name == 'crossover':
+        return CrossoverRule()
+    if name == 'lr':
+        from sklearn.linear_model import LogisticRegression
+        return LogisticRegression(random_state=42, max_iter=1000)
+    if name == 'rf':
+        from sklearn.ensemble import RandomForestClassifier
+        return RandomForestClassifier(n_estimators=100, random_state=42, max_depth=10, n_jobs=1)
+    if name == 'gb':
+        from sklearn.ensemble import GradientBoostingClassifier
+        return GradientBoostingClassifier(n_estimators=100, learning_rate=0.1, max_depth=5,
+                                          random_state=42)
+    raise ValueError(f"Unknown model: {name}")
+
+@traced(rows=lambda result, *args, **kwargs: len(result[1]))
+def load_dataset(target_name='target'):
+    """Feature matrix, targets and dates for rows past warm-up with a label"""
+    from models.baseline import load_feature_columns
+    from features.feature_store import days_to_date
+
+    columns = load_feature_columns(MODEL_FEATURES + [target_name, 'date'])
+    target = np.asarray(columns[target_name])
+    rows = np.flatnonzero(target != -1)
+    rows = rows[rows >= WARMUP_ROWS]
+    X = np.column_stack([np.asarray(columns[name])[rows] for name in MODEL_FEATURES])
+    dates = [days_to_date(d) for d in np.asarray(columns['date'])[rows]]
+    return X, target[rows], dates
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Walk-forward backtest of a direction model")
+    parser.add_argument('--model', default='crossover', choices=['crossover', 'lr', 'rf', 'gb'])
+    parser.add_argument('--train-size', type=int, default=750, help="initial training rows")
+    parser.add_argument('--test-size', type=int, default=63, help="rows per test window")
+    parser.add_argument('--step', type=int, default=None, help="rows between folds (default: test size)")
+    parser.add_argument('--embargo', type=int, default=None,
+                        help="rows dropped between train and test (default: the horizon)")
+    parser.add_argument('--horizon', type=int, default=1,
+                        help="predict h-day direction (needs build_features.py --horizons)")
+    parser.add_argument('--sliding', action='store_true', help="fixed-size instead of expanding training window")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    from models.evaluate import target_column
+    try:
+        X, y, dates = load_dataset(target_column(args.horizon))
+    except KeyError:
+        parser.error(f"no {target_column(args.horizon)} column - rebuild with "
+                     f"build_features.py --horizons {args.horizon}")
+    # An h-day label overlaps the next h-1 rows, so keep h rows between windows
+    embargo = args.horizon if args.embargo is None else args.embargo
+    folds = walk_forward_folds(len(y), args.train_size, args.test_size, args.step,
+                               embargo, expanding=not args.sliding)
+    if not folds:
+        parser.error(f"no folds: {len(y)} rows cannot hold --train-size {args.train_size} "
+                     f"+ embargo {embargo} + --test-size {args.test_size}")
+
+    print("="*80)
+    print(f"WALK-FORWARD BACKTEST: {args.model}, {args.horizon}-day direction "
+          f"({'sliding' if args.sliding else 'expanding'} window, {len(folds)} folds)")
+    print("="*80)
+
+    start = time.perf_counter()
+    results = run_backtest(X, y, folds, make_model(args.model), args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'fold':>4}  {'train':<23}  {'test':<23}{'acc':>9}{'n':>6}")
+    print("-" * 80)
+    for r in results:
+        (a, b), (c, d) = r['train'], r['test']
+        print(f"{r['fold']:>4}  {dates[a]}..{dates[b-1]}  {dates[c]}..{dates[d-1]}"
+              f"{r['accuracy']:>8.2f}%{r['total']:>6}")
+
+    summary = summarize(results)
+    print("-" * 80)
+    print(f"Pooled accuracy: {summary['pooled_acc']:.2f}% ± {summary['pooled_se']:.2f} "
+          f"({summary['correct']}/{summary['total']})")
+    print(f"Per-fold mean:   {summary['mean_fold_acc']:.2f}% (std {summary['std_fold_acc']:.2f})")
+    print(f"Wall time: {elapsed:.2f}s")
@@ -1,21 +1,77 @@
 # Phase 4: Baseline Model & Data Split
 # Silver Price Forecasting - Establish Performance Threshold
 
-import csv
+import argparse
+import sys
 from pathlib import Path
 
 # File paths
 BASE_DIR = Path(__file__).parent.parent.parent
 FEATURES_FILE = BASE_DIR / "data" / "processed" / "silver_features.csv"
+FEATURE_STORE = BASE_DIR / "data" / "processed" / "silver_features"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.feature_store import FeatureStore, FeatureTable
+from data.loader import load_table
+from pipeline.trace import entry_point, traced
+
+try:
+    from models import evaluate, significance  # NumPy rule engine, resampling
+except ImportError:
+    evaluate = significance = None
 
 def load_features():
-    """Load processed features"""
-    data = []
-    with open(FEATURES_FILE, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append(row)
-    return data
+    """Load processed features as a compact table (typed store, else the CSV export)"""
+    if FeatureStore.exists(FEATURE_STORE):
+        return FeatureStore(FEATURE_STORE).table()
+    
+    table = load_table(FEATURES_FILE, date_column='date')
+    return FeatureTable.compact(dict(date=table.days, **table.columns))
+
+def load_feature_columns(names=None):
+    """Load typed feature columns by name (default: all)"""
+    if FeatureStore.exists(FEATURE_STORE):
+        return FeatureStore(FEATURE_STORE).columns(names)
+    
+    table = load_table(FEATURES_FILE, date_column='date')
+    columns = dict(table.columns, date=table.days)
+    return {name: columns[name] for name in (names or columns)}
+
+@traced(rows=lambda result, *splits: sum(len(split) for split in splits))
+def score_baselines(train, val, test):
+    """(accuracy, correct, total) per split for both baselines"""
+    if evaluate is None:
+        splits = (train, val, test)
+        return ([baseline_naive_persistence(split) for split in splits],
+                [baseline_moving_average_crossover(split) for split in splits])
+    
+    # One vectorized pass over typed columns instead of six row loops
+    target, bounds, blocks = baseline_rules()
+    naive, crossover = evaluate.evaluate_rules(target, blocks, bounds)
+    return tuple([(row[f'{s}_acc'], row[f'{s}_correct'], row[f'{s}_total'])
+                  for s in evaluate.SPLITS] for row in (naive, crossover))
+
+def baseline_rules():
+    """(target, split bounds, rule blocks) for both baselines"""
+    columns = load_feature_columns(['target', 'sma_5', 'sma_20'])
+    bounds = evaluate.split_bounds(len(columns['target']))
+    blocks = [evaluate.persistence_rule(columns['target'], bounds)]
+    blocks += evaluate.sma_crossover_rules({5: columns['sma_5'], 20: columns['sma_20']})
+    return columns['target'], bounds, blocks
+
+def baseline_significance():
+    """Block-bootstrap interval and permutation p-value of each baseline's
+    test accuracy (None without NumPy)"""
+    if significance is None:
+        return None
+    target, bounds, blocks = baseline_rules()
+    start, end = bounds[-1]
+    return [significance.resample_accuracy(*evaluate.rule_outcomes(target, block, start, end))[0]
+            for block in blocks]
 
 def split_data(data, train_pct=0.70, val_pct=0.15):
     """Time series split (no shuffling!)"""
@@ -30,6 +86,7 @@ def split_data(data, train_pct=0.70, val_pct=0.15):
     
     return train, val, test
 
+@traced()
 def baseline_naive_persistence(data):
     """Naive forecast: tomorrow = today"""
     correct = 0
@@ -57,6 +114,7 @@ def baseline_naive_persistence(data):
     accuracy = (correct / total * 100) if total > 0 else 0
     return accuracy, correct, total
 
+@traced()
 def baseline_moving_average_crossover(data):
     """MA Crossover: if SMA5 > SMA20, predict up"""
     correct = 0
@@ -84,6 +142,7 @@ def baseline_moving_average_crossover(data):
     accuracy = (correct / total * 100) if total > 0 else 0
     return accuracy, correct, total
 
+@entry_point('baseline')
 def analyze_baselines():
     """Main baseline analysis"""
     
@@ -115,25 +174,29 @@ def analyze_baselines():
     print(f"\n📈 BASELINE 1: Naive Persistence (Tomorrow = Today)")
     print("-" * 80)
     
-    train_acc, train_correct, train_total = baseline_naive_persistence(train)
-    val_acc, val_correct, val_total = baseline_naive_persistence(val)
-    test_acc, test_correct, test_total = baseline_naive_persistence(test)
+    naive_scores, crossover_scores = score_baselines(train, val, test)
+    intervals = baseline_significance() or [None, None]
+    (train_acc, train_correct, train_total), (val_acc, val_correct, val_total), \
+        (test_acc, test_correct, test_total) = naive_scores
     
     print(f"Train: {train_acc:.2f}% ({train_correct}/{train_total})")
     print(f"Val:   {val_acc:.2f}% ({val_correct}/{val_total})")
     print(f"Test:  {test_acc:.2f}% ({test_correct}/{test_total})")
+    if intervals[0]:
+        print(f"       {significance.format_result(intervals[0])}")
     
     # Baseline 2: Moving Average Crossover
     print(f"\n📈 BASELINE 2: Moving Average Crossover (SMA5 vs SMA20)")
     print("-" * 80)
     
-    train_acc2, train_correct2, train_total2 = baseline_moving_average_crossover(train)
-    val_acc2, val_correct2, val_total2 = baseline_moving_average_crossover(val)
-    test_acc2, test_correct2, test_total2 = baseline_moving_average_crossover(test)
+    (train_acc2, train_correct2, train_total2), (val_acc2, val_correct2, val_total2), \
+        (test_acc2, test_correct2, test_total2) = crossover_scores
     
     print(f"Train: {train_acc2:.2f}% ({train_correct2}/{train_total2})")
     print(f"Val:   {val_acc2:.2f}% ({val_correct2}/{val_total2})")
     print(f"Test:  {test_acc2:.2f}% ({test_correct2}/{test_total2})")
+    if intervals[1]:
+        print(f"       {significance.format_result(intervals[1])}")
     
     # Summary
     print("\n" + "="*80)
@@ -143,6 +206,12 @@ def analyze_baselines():
     best_baseline = max(test_acc, test_acc2)
     print(f"\nBest Baseline (Test Set): {best_baseline:.2f}%")
     print(f"Random Chance: 50.00%")
+    best = intervals[0 if test_acc >= test_acc2 else 1]
+    if best:
+        verdict = "distinguishable from" if best['p_value'] < 0.05 else "within noise of"
+        print(f"   95% CI {best['ci_low']:.2f}% to {best['ci_high']:.2f}% "
+              f"({best['replicates']:,} block-bootstrap replicates): {verdict} chance "
+              f"(p = {best['p_value']:.4f})")
     print(f"Our Target: >60.00%")
     print(f"\n✅ Threshold to beat: {best_baseline:.2f}%")
     
@@ -162,4 +231,5 @@ def analyze_baselines():
     print(f"🎯 Goal: Beat {best_baseline:.2f}% and reach >60%")
 
 if __name__ == "__main__":
+    argparse.ArgumentParser(description="Phase 4: score the naive and SMA-crossover baselines").parse_args()
     analyze_baselines()
@@ -0,0 +1,200 @@
+# Vectorized Rule Evaluation
+# Silver Price Forecasting - Score many rule-based baselines in one pass
+#
+# Every rule is a (prediction, valid) pair of boolean rows over the whole
+# series. Rules are scored in blocks: one comparison against the target
+# and one cumulative sum per block give correct/total counts for every
+# split at once, so sweeping thousands of parameterisations costs a few
+# array operations instead of a Python loop per rule, row and split.
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Make src/ importable when run as a script
+SRC_DIR = Path(__file__).parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features import columnar
+from features.targets import target_name
+from pipeline.trace import traced
+
+SPLITS = ('train', 'val', 'test')
+BLOCK_ROWS = 256  # Rules per block; bounds memory at BLOCK_ROWS x n
+
+def split_bounds(n, train_pct=0.70, val_pct=0.15):
+    """(start, end) of each split, matching baseline.split_data"""
+    train_end = int(n * train_pct)
+    val_end = int(n * (train_pct + val_pct))
+    return [(0, train_end), (train_end, val_end), (val_end, n)]
+
+class RuleBlock:
+    """A batch of rules: names plus (rules x n) prediction and valid masks"""
+
+    def __init__(self, family, names, predictions, valid):
+        self.family = family
+        self.names = list(names)
+        self.predictions = predictions
+        self.valid = valid
+
+def target_column(horizon=1):
+    """Store column holding the direction label for a horizon"""
+    return 'target' if horizon == 1 else target_name(horizon)
+
+def persistence_rule(target, bounds, lag=1):
+    """Naive persistence: predict the latest direction already known.
+
+    An h-day label is only known h rows later, so pass lag=h for
+    multi-horizon targets.
+    """
+    n = len(target)
+    prediction = np.zeros((1, n), dtype=bool)
+    valid = np.zeros((1, n), dtype=bool)
+    prediction[0, lag:] = target[:-lag] == 1
+    valid[0, lag:] = target[:-lag] != -1
+    # Each split starts without a previous row, as in baseline.py
+    for start, _ in bounds:
+        valid[0, start:min(start + lag, n)] = False
+    return RuleBlock('persistence', ['persistence'], prediction, valid)
+
+def sma_crossover_rules(smas):
+    """Up if SMA(a) > SMA(b), for every pair of the given SMA columns.
+
+    `smas` maps window -> SMA column; zero entries are warm-up rows.
+    """
+    windows = sorted(smas)
+    matrix = np.stack([np.asarray(smas[w], dtype=np.float64) for w in windows])
+    ready = matrix != 0
+    first, second = np.triu_indices(len(windows), k=1)
+
+    for start in range(0, len(first), BLOCK_ROWS):
+        a = first[start:start + BLOCK_ROWS]
+        b = second[start:start + BLOCK_ROWS]
+        names = [f"sma_{windows[i]}>sma_{windows[j]}" for i, j in zip(a, b)]
+        yield RuleBlock('sma_crossover', names, matrix[a] > matrix[b], ready[a] & ready[b])
+
+def rsi_threshold_rules(rsi, lows, highs, warmup=14):
+    """Up below `low`, down above `high`, abstain in between"""
+    rsi = np.asarray(rsi, dtype=np.float64)
+    ready = np.arange(len(rsi)) >= warmup
+    pairs = [(lo, hi) for lo in lows for hi in highs if lo <= hi]
+
+    for start in range(0, len(pairs), BLOCK_ROWS):
+        block = np.array(pairs[start:start + BLOCK_ROWS], dtype=np.float64)
+        below = rsi[None, :] < block[:, :1]
+        above = rsi[None, :] > block[:, 1:]
+        names = [f"rsi<{lo:g}|>{hi:g}" for lo, hi in pairs[start:start + BLOCK_ROWS]]
+        yield RuleBlock('rsi_threshold', names, below, (below | above) & ready)
+
+def momentum_rules(momentum, warmup=5):
+    """Momentum sign: trend-following and contrarian"""
+    momentum = np.asarray(momentum, dtype=np.float64)
+    ready = np.arange(len(momentum)) >= warmup
+    up = momentum > 0
+    return RuleBlock('momentum', ['momentum>0', 'momentum<=0'],
+                     np.stack([up, ~up]), np.stack([ready, ready]))
+
+@traced()
+def evaluate_rules(target, blocks, bounds):
+    """Score every rule on every split.
+
+    Returns a list of result rows (dicts) with correct/total/accuracy per
+    split, in rule order.
+    """
+    target = np.asarray(target)
+    labeled = target != -1
+    actual = target == 1
+    starts = np.array([s for s, _ in bounds])
+    ends = np.array([e for _, e in bounds])
+
+    results = []
+    for block in blocks:
+        valid = block.valid & labeled
+        hits = (block.predictions == actual) & valid
+        # Prefix sums along time give every split's count in one pass
+        hit_sums = np.zeros((len(block.names), len(target) + 1), dtype=np.int64)
+        valid_sums = np.zeros_like(hit_sums)
+        np.cumsum(hits, axis=1, out=hit_sums[:, 1:])
+        np.cumsum(valid, axis=1, out=valid_sums[:, 1:])
+        correct = hit_sums[:, ends] - hit_sums[:, starts]
+        total = valid_sums[:, ends] - valid_sums[:, starts]
+
+        for i, name in enumerate(block.names):
+            row = {'rule': name, 'family': block.family}
+            for j, split in enumerate(SPLITS[:len(bounds)]):
+                row[f'{split}_correct'] = int(correct[i, j])
+                row[f'{split}_total'] = int(total[i, j])
+                row[f'{split}_acc'] = correct[i, j] / total[i, j] * 100 if total[i, j] else 0
+            results.append(row)
+    return results
+
+def rule_outcomes(target, block, start, end):
+    """(predictions, actual) of every rule in `block` on the bars of
+    [start, end) that all of its rules score, as 0/1 rows"""
+    target = np.asarray(target)[start:end]
+    scored = (block.valid[:, start:end] & (target != -1)).all(axis=0)
+    return block.predictions[:, start:end][:, scored].astype(np.int8), (target[scored] == 1).astype(np.int8)
+
+def standard_rules(columns, bounds, sma_windows=None, rsi_lows=range(5, 51, 1),
+                   rsi_highs=range(50, 96, 1), horizon=1):
+    """Rule blocks for a full sweep over the feature columns.
+
+    With `sma_windows`, SMAs for every window are computed from the price
+    column and every pair is tested; otherwise the stored sma_* columns
+    are used.
+    """
+    target = columns[target_column(horizon)]
+    yield persistence_rule(target, bounds, lag=horizon)
+
+    if sma_windows:
+        prices = columnar.as_array(columns['price'])
+        smas = {w: columnar.calculate_sma(prices, w) for w in sma_windows}
+    else:
+        smas = {int(name[4:]): columns[name] for name in columns if name.startswith('sma_')}
+    yield from sma_crossover_rules(smas)
+
+    yield from rsi_threshold_rules(columns['rsi'], rsi_lows, rsi_highs)
+    yield momentum_rules(columns['momentum'])
+
+def print_results(results, sort_by='val_acc', top=10, min_total=100):
+    """Print the best rules with at least `min_total` scored rows in the ranking split"""
+    split = sort_by.rsplit('_', 1)[0]
+    eligible = [r for r in results if r[f'{split}_total'] >= min_total]
+    ranked = sorted(eligible, key=lambda r: r[sort_by], reverse=True)[:top]
+    print(f"{'rule':<22}{'family':<16}{'train':>9}{'val':>9}{'test':>9}{'n(test)':>9}")
+    print("-" * 74)
+    for row in ranked:
+        print(f"{row['rule']:<22}{row['family']:<16}{row['train_acc']:>8.2f}%"
+              f"{row['val_acc']:>8.2f}%{row['test_acc']:>8.2f}%{row['test_total']:>9}")
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from models.baseline import load_feature_columns
+
+    parser = argparse.ArgumentParser(description="Sweep rule-based baselines")
+    parser.add_argument('--horizon', type=int, default=1,
+                        help="score h-day direction (needs build_features.py --horizons)")
+    args = parser.parse_args()
+
+    columns = load_feature_columns()
+    if target_column(args.horizon) not in columns:
+        parser.error(f"no {target_column(args.horizon)} column - rebuild with "
+                     f"build_features.py --horizons {args.horizon}")
+    target = columns[target_column(args.horizon)]
+    bounds = split_bounds(len(target))
+
+    start = time.perf_counter()
+    results = evaluate_rules(target,
+                             standard_rules(columns, bounds, sma_windows=range(2, 101),
+                                            horizon=args.horizon),
+                             bounds)
+    elapsed = time.perf_counter() - start
+
+    print("="*80)
+    print(f"RULE SWEEP: {args.horizon}-day direction (ranked by validation accuracy, >= 100 val predictions)")
+    print("="*80)
+    print(f"Scored {len(results):,} rules x {len(SPLITS)} splits in {elapsed:.2f}s\n")
+    print_results(results)
@@ -0,0 +1,60 @@
+# Online Inference
+# Silver Price Forecasting - Single-bar feature update and direction prediction
+
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+# Make src/ importable when run as a script
+SRC_DIR = Path(__file__).parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.build_features import MODEL_FEATURES, load_prices, load_state
+from features.rolling import FeatureState
+
+Prediction = namedtuple('Prediction', ['date', 'features', 'direction'])
+
+def moving_average_crossover(features):
+    """Baseline 2 rule: up if SMA5 > SMA20"""
+    return 1 if features['sma_5'] > features['sma_20'] else 0
+
+def naive_persistence(features):
+    """Baseline 1 rule: tomorrow moves the same way as today"""
+    return 1 if features['return'] > 0 else 0
+
+class StreamingPredictor:
+    """Online predictor holding only O(window) feature state.
+
+    `model` is either a rule taking the feature dict (the baselines above)
+    or a fitted estimator with a scikit-learn style predict(); the latter
+    gets the MODEL_FEATURES vector as a single-row batch.
+    """
+
+    def __init__(self, state=None, model=moving_average_crossover):
+        self.state = state if state is not None else FeatureState()
+        self.model = model
+
+    @classmethod
+    def from_history(cls, dates, prices, model=moving_average_crossover):
+        """Seed the feature state from the tail of a price history"""
+        return cls(FeatureState.seeded(dates, prices), model)
+
+    @classmethod
+    def from_saved_state(cls, model=moving_average_crossover):
+        """Seed from the state saved by build_features, else from raw prices"""
+        saved = load_state()
+        if saved is not None:
+            return cls(FeatureState.from_state(saved['features']), model)
+        dates, prices = load_prices()
+        return cls.from_history(dates, prices, model)
+
+    def update(self, date, close):
+        """Add one bar; return its feature vector and predicted direction"""
+        features = self.state.update(date, close)
+        vector = tuple(features[name] for name in MODEL_FEATURES)
+        if callable(self.model):
+            direction = self.model(features)
+        else:
+            direction = int(self.model.predict([vector])[0])
+        return Prediction(date, vector, direction)
@@ -0,0 +1,451 @@
+# Scoring Service
+# Silver Price Forecasting - Long-running prediction daemon with micro-batching
+#
+# Loads the model artifact, the typed feature store and the rolling
+# feature state once, then answers JSON requests over local HTTP (TCP on
+# 127.0.0.1 or a Unix socket). Request threads only resolve their feature
+# vector; one scoring thread drains the queue into batches of up to
+# `max_batch` rows, waiting at most `max_wait` for a batch to fill, and
+# makes a single vectorized predict() call per batch.
+#
+#   POST /predict  {}                              latest stored bar
+#                  {"date": "2025-09-03"}          a stored bar
+#                  {"features": {"rsi": ..., ...}} an explicit feature vector
+#                  {"price": 38.2, "date": ...}    what-if: the next bar closes at price
+#   GET  /metrics  queue depth, batch size and latency histograms
+#   GET  /health   model and data the service is serving
+#   POST /reload   {}                              re-read store and state (after a pipeline run)
+#                  {"latest": true}                ... and switch to the newest artifact
+
+import argparse
+import copy
+import http.client
+import json
+import math
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+# Make src/ importable when run as a script
+SRC_DIR = Path(__file__).parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.build_features import MODEL_FEATURES, load_state
+from features.feature_store import FeatureStore, date_to_days, days_to_date
+from features.rolling import FeatureState
+from models.artifacts import latest_artifact
+from models.backtest import CrossoverRule
+from models.baseline import FEATURE_STORE
+
+DEFAULT_PORT = 8765
+MAX_BATCH = 64
+MAX_WAIT = 0.002  # Seconds a batch may wait for more requests
+REQUEST_TIMEOUT = 1.0  # The ModelCard's latency budget
+
+LATENCY_BUCKETS_MS = (0.25, 0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+class Histogram:
+    """Fixed-bucket histogram; quantiles are bucket upper bounds"""
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        index = 0
+        while index < len(self.bounds) and value > self.bounds[index]:
+            index += 1
+        self.counts[index] += 1
+        self.total += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        if not self.total:
+            return None
+        seen = 0
+        for bound, count in zip(self.bounds + [self.max], self.counts):
+            seen += count
+            if seen >= q * self.total:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        labels = [f"<={b}" for b in self.bounds] + [f">{self.bounds[-1]}"]
+        def rounded(value):
+            return None if value is None else round(value, 3)
+        return {
+            'count': self.total,
+            'mean': rounded(self.sum / self.total) if self.total else None,
+            'p50': rounded(self.quantile(0.5)),
+            'p90': rounded(self.quantile(0.9)),
+            'p99': rounded(self.quantile(0.99)),
+            'max': rounded(self.max),
+            'buckets': {label: count for label, count in zip(labels, self.counts) if count},
+        }
+
+class ScoringService:
+    """Model, features and state loaded once; requests scored in micro-batches.
+
+    `score()` is the in-process client: it blocks until the request's batch
+    has been scored. The HTTP server below calls the same method.
+    """
+
+    def __init__(self, artifact=None, max_batch=MAX_BATCH, max_wait=MAX_WAIT, timeout=REQUEST_TIMEOUT):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.timeout = timeout
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.batch_sizes = Histogram(BATCH_BUCKETS)
+        self.queue_depths = Histogram(BATCH_BUCKETS)
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.predict_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.errors = 0
+        self.cancelled = 0
+        self.started = time.time()
+        self.artifact = artifact or latest_artifact()
+        self.load()
+        self._worker = threading.Thread(target=self._run, name="scoring-batcher", daemon=True)
+        self._worker.start()
+
+    def load(self, latest=False):
+        """(Re)load the model, the stored feature rows and the rolling state.
+
+        Keeps the configured artifact unless `latest` asks for the newest
+        one. Everything is read before the swap, so if any step raises the
+        current model keeps serving.
+        """
+        artifact = (latest_artifact() if latest else None) or self.artifact
+        if artifact is not None:
+            model, features, name = artifact, artifact.features, repr(artifact)
+            stale = artifact.stale_reasons()
+            if stale:
+                print(f"⚠️ Serving a stale artifact: {', '.join(stale)}")
+        else:
+            model, features, name = CrossoverRule(), MODEL_FEATURES, "baseline sma_5 > sma_20"
+            print("⚠️ No model artifact (run src/models/train.py) - serving the crossover baseline")
+
+        store = FeatureStore(FEATURE_STORE)
+        columns = store.columns(features + ['date'])
+        matrix = np.column_stack([np.asarray(columns[f], dtype=np.float64) for f in features])
+        days = np.asarray(columns['date'])
+        saved = load_state()
+        state = FeatureState.from_state(saved['features']) if saved else None
+        # Unpickle and import everything now, not inside the first request's deadline
+        model.predict(matrix[-1:])
+        if hasattr(model, 'predict_proba'):
+            model.predict_proba(matrix[-1:])
+
+        with self.lock:
+            self.artifact = artifact
+            self.model = model
+            self.model_name = name
+            self.features = list(features)
+            self.matrix = matrix
+            self.rows_by_day = {int(day): i for i, day in enumerate(days.tolist())}
+            self.last_day = int(days[-1])
+            self.state = state
+            self.probabilities = hasattr(model, 'predict_proba')
+
+    def vector(self, request):
+        """(date, feature vector) a request asks about; ValueError if invalid"""
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        if 'features' in request:
+            values = request['features']
+            missing = [name for name in self.features if name not in values]
+            if missing:
+                raise ValueError(f"missing features: {', '.join(missing)}")
+            date, vector = request.get('date'), [float(values[name]) for name in self.features]
+        elif 'price' in request:
+            if self.state is None:
+                raise ValueError("no saved feature state (run build_features.py)")
+            price = float(request['price'])
+            if not math.isfinite(price) or price <= 0:
+                raise ValueError(f"price must be a positive finite number, got {price}")
+            state = copy.deepcopy(self.state)  # What-if: the served state stays unchanged
+            date = request.get('date') or days_to_date(date_to_days(state.last_date) + 1)
+            features = state.update(date, price)
+            vector = [features[name] for name in self.features]
+        else:
+            day = date_to_days(request['date']) if request.get('date') else self.last_day
+            if day not in self.rows_by_day:
+                raise ValueError(f"no stored features for {days_to_date(day)}")
+            date, vector = days_to_date(day), self.matrix[self.rows_by_day[day]]
+        # Caught here as a 400 instead of failing the whole batch in predict()
+        bad = [name for name, value in zip(self.features, vector) if not math.isfinite(value)]
+        if bad:
+            raise ValueError(f"non-finite features: {', '.join(bad)}")
+        return date, vector
+
+    def submit(self, request):
+        """Queue a request for the next batch; returns a Future of its result"""
+        date, vector = self.vector(request)
+        future = Future()
+        self.queue.put((future, date, vector, time.perf_counter()))
+        return future
+
+    def score(self, request):
+        future = self.submit(request)
+        try:
+            return future.result(self.timeout)
+        except FutureTimeoutError:  # Not the builtin TimeoutError before Python 3.11
+            future.cancel()  # Still queued: the batcher drops it
+            raise
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            depth = self.queue.qsize() + 1
+            batch = [item]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self.queue.get(timeout=remaining) if remaining > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.queue.put(None)  # Finish this batch, then stop
+                    break
+                batch.append(item)
+            self._score_batch(batch, depth)
+
+    def _predict(self, X):
+        """(directions, P(up) or None) per row of X"""
+        directions = np.asarray(self.model.predict(X)).tolist()
+        if not self.probabilities:
+            return directions, [None] * len(X)
+        # NaN is not JSON; report an unusable probability as null
+        p_up = [p if math.isfinite(p) else None for p in np.asarray(self.model.predict_proba(X)).tolist()]
+        return directions, p_up
+
+    def _score_batch(self, batch, depth):
+        # Requests whose caller gave up (score() timed out) are not scored
+        live = [item for item in batch if item[0].set_running_or_notify_cancel()]
+        with self.lock:
+            self.cancelled += len(batch) - len(live)
+        if not live:
+            return
+        batch = live
+
+        start = time.perf_counter()
+        X = np.array([vector for _, _, vector, _ in batch], dtype=np.float64)
+        try:
+            outcomes = list(zip(*self._predict(X)))
+        except Exception:
+            # One bad row fails the whole call: score the rows alone so only its request fails
+            outcomes = []
+            for row in X:
+                try:
+                    outcomes.append(next(zip(*self._predict(row[None, :]))))
+                except Exception as error:
+                    outcomes.append(error)
+        done = time.perf_counter()
+
+        failed = sum(isinstance(outcome, Exception) for outcome in outcomes)
+        with self.lock:
+            self.errors += failed
+            self.batch_sizes.observe(len(batch))
+            self.queue_depths.observe(depth)
+            self.predict_ms.observe((done - start) * 1000)
+            for (_, _, _, queued), outcome in zip(batch, outcomes):
+                if not isinstance(outcome, Exception):
+                    self.latency_ms.observe((done - queued) * 1000)
+        for (future, date, _, queued), outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+                continue
+            direction, probability = outcome
+            future.set_result({
+                'date': date,
+                'direction': int(direction),
+                'p_up': probability,
+                'model': self.model_name,
+                'batch_size': len(batch),
+                'latency_ms': round((done - queued) * 1000, 3),
+            })
+
+    def metrics(self):
+        with self.lock:
+            return {
+                'uptime_s': round(time.time() - self.started, 1),
+                'queue_depth': self.queue.qsize(),
+                'errors': self.errors,
+                'cancelled': self.cancelled,
+                'batch_size': self.batch_sizes.snapshot(),
+                'queue_depth_at_batch': self.queue_depths.snapshot(),
+                'latency_ms': self.latency_ms.snapshot(),
+                'predict_ms': self.predict_ms.snapshot(),
+            }
+
+    def health(self):
+        return {'model': self.model_name, 'features': self.features,
+                'last_date': days_to_date(self.last_day), 'rows': len(self.matrix),
+                'max_batch': self.max_batch, 'max_wait_ms': self.max_wait * 1000}
+
+    def close(self):
+        self.queue.put(None)
+        self._worker.join()
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive: one connection per client
+    service = None
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/metrics':
+            return self._reply(200, self.service.metrics())
+        if self.path == '/health':
+            return self._reply(200, self.service.health())
+        self._reply(404, {'error': f"unknown path {self.path}"})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b'{}'
+        if self.path == '/reload':
+            try:
+                latest = bool(json.loads(body or b'{}').get('latest'))
+            except (ValueError, AttributeError) as error:
+                return self._reply(400, {'error': f"bad reload request: {error}"})
+            try:
+                self.service.load(latest)
+            except Exception as error:
+                return self._reply(500, {'error': f"reload failed, still serving "
+                                                  f"{self.service.model_name}: {type(error).__name__}: {error}"})
+            return self._reply(200, self.service.health())
+        if self.path != '/predict':
+            return self._reply(404, {'error': f"unknown path {self.path}"})
+        try:
+            result = self.service.score(json.loads(body or b'{}'))
+        except (ValueError, KeyError, TypeError) as error:
+            return self._reply(400, {'error': str(error)})
+        except FutureTimeoutError:
+            return self._reply(503, {'error': f"not scored within {self.service.timeout}s"})
+        except Exception as error:
+            return self._reply(500, {'error': f"{type(error).__name__}: {error}"})
+        self._reply(200, result)
+
+LISTEN_BACKLOG = 128  # socketserver's default of 5 resets bursts of new clients
+
+class TCPHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ('unix', 0)  # BaseHTTPRequestHandler expects (host, port)
+
+def make_server(service, port=DEFAULT_PORT, unix_socket=None):
+    """HTTP server for `service` on 127.0.0.1:port (0 = any free port) or a Unix socket"""
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        return UnixHTTPServer(str(unix_socket), type('ScoringHandler', (Handler,), {'service': service}))
+    # Headers and body go out in separate writes; with Nagle on, each reply
+    # waits for the client's delayed ACK (~40 ms)
+    handler = type('ScoringHandler', (Handler,), {'service': service, 'disable_nagle_algorithm': True})
+    return TCPHTTPServer(('127.0.0.1', port), handler)
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+class ScoringClient:
+    """Keep-alive client for a running service: 'host:port' or a socket path"""
+
+    def __init__(self, address):
+        if ':' in str(address):
+            host, port = str(address).rsplit(':', 1)
+            self.connection = http.client.HTTPConnection(host, int(port))
+        else:
+            self.connection = UnixHTTPConnection(str(address))
+
+    def _call(self, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        result = json.loads(response.read())
+        if response.status != 200:
+            raise ValueError(result.get('error', response.reason))
+        return result
+
+    def predict(self, request=None):
+        return self._call('POST', '/predict', request or {})
+
+    def metrics(self):
+        return self._call('GET', '/metrics')
+
+    def health(self):
+        return self._call('GET', '/health')
+
+    def reload(self, latest=False):
+        return self._call('POST', '/reload', {'latest': latest})
+
+    def close(self):
+        self.connection.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve direction predictions with micro-batching")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', metavar='PATH', help="listen on a Unix socket instead of TCP")
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    parser.add_argument('--max-wait-ms', type=float, default=MAX_WAIT * 1000)
+    parser.add_argument('--timeout', type=float, default=REQUEST_TIMEOUT,
+                        help="seconds before a queued request is answered with 503")
+    args = parser.parse_args()
+
+    service = ScoringService(max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000,
+                             timeout=args.timeout)
+    server = make_server(service, args.port, args.unix)
+    health = service.health()
+    print(f"🚀 Serving {health['model']} on {args.unix or f'http://127.0.0.1:{args.port}'}")
+    print(f"   {health['rows']} stored bars up to {health['last_date']}, "
+          f"batches of <= {args.max_batch} within {args.max_wait_ms:g} ms")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down")
+    finally:
+        server.server_close()
+        service.close()
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
@@ -0,0 +1,219 @@
+# Resampling Significance
+# Silver Price Forecasting - Confidence intervals and p-values for directional accuracy
+#
+# A test accuracy such as 53.60% on a few hundred bars says little on its
+# own. Two resampling distributions are built here, both in blocks of
+# consecutive bars so the autocorrelation of prices, labels and rule
+# signals survives the resampling:
+#   block bootstrap     circular blocks of (prediction == actual) outcomes
+#                       drawn with replacement -> percentile interval.
+#                       Every model is resampled with the same blocks, so
+#                       differences between models are paired.
+#   block permutation   the predictions, rotated by up to one block and cut
+#                       into blocks, shuffled against the fixed actuals ->
+#                       accuracy under "no skill beyond the base rates",
+#                       one-sided p-value of the observed accuracy
+# Replicates are index matrices (replicates x blocks) applied to prefix
+# sums or to a table of block-vs-slot matches, one NumPy gather per chunk
+# of CHUNK replicates. Chunks run in a process pool and each has its own
+# seed, so results do not depend on the number of workers.
+
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Make src/ importable when run as a script
+SRC_DIR = Path(__file__).parent.parent
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from pipeline.trace import traced
+
+REPLICATES = 10_000
+CHUNK = 1_000  # Replicates per task; bounds the gathers at models x CHUNK x blocks
+SEED = 42
+
+def default_block_length(n):
+    """n^(1/3), the usual rate for block bootstrap of a mean"""
+    return max(1, round(n ** (1 / 3)))
+
+def block_starts(rng, replicates, n, block):
+    """(replicates x ceil(n/block)) random block start rows"""
+    return rng.integers(0, n, size=(replicates, math.ceil(n / block)))
+
+def _bootstrap_chunk(hits, replicates, block, seed):
+    """Circular block bootstrap of every row of `hits`: (models x replicates) correct counts"""
+    m, n = hits.shape
+    # Prefix sums over the series plus one wrapped block: a block's count is two lookups
+    wrapped = np.concatenate([hits, hits[:, :block]], axis=1)
+    prefix = np.zeros((m, n + block + 1), dtype=np.int64)
+    np.cumsum(wrapped, axis=1, out=prefix[:, 1:])
+
+    starts = block_starts(np.random.default_rng(seed), replicates, n, block)
+    lengths = np.full(starts.shape[1], block)
+    lengths[-1] = n - block * (starts.shape[1] - 1)  # Last block trimmed to n rows
+    return (prefix[:, starts + lengths] - prefix[:, starts]).sum(axis=2)
+
+def _permutation_chunk(predictions, actual, replicates, block, seed):
+    """Block permutation null: (models x replicates) correct counts"""
+    m, n = predictions.shape
+    blocks = math.ceil(n / block)
+    # Destination slots hold the actuals; the last one is trimmed to n rows
+    slots = np.arange(blocks * block).reshape(blocks, block)
+    used = (slots < n).astype(np.float64)
+    up = actual[np.minimum(slots, n - 1)] * used
+    down = used - up
+    # matches[:, o, i, j]: hits of source block i, rotated by o rows, placed in slot j
+    source = predictions[:, (np.arange(block)[:, None, None] + slots) % n].astype(np.float64)
+    matches = source @ up.T + (1 - source) @ down.T
+
+    rng = np.random.default_rng(seed)
+    rotation = rng.integers(0, block, size=(replicates, 1))
+    order = np.argsort(rng.random((replicates, blocks)), axis=1)
+    return np.rint(matches[:, rotation, order, np.arange(blocks)].sum(axis=2)).astype(np.int64)
+
+def _run_chunk(task):
+    kind, arrays, replicates, block, seed = task
+    chunk = _bootstrap_chunk if kind == 'bootstrap' else _permutation_chunk
+    return chunk(*arrays, replicates, block, seed)
+
+def _replicate(kind, arrays, replicates, block, seed, workers):
+    """Correct counts for `replicates` replicates, CHUNK at a time"""
+    sizes = [min(CHUNK, replicates - start) for start in range(0, replicates, CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(kind, arrays, size, block, s) for size, s in zip(sizes, seeds)]
+    workers = min(workers or os.cpu_count() or 1, len(tasks)) or 1
+
+    if workers == 1:
+        counts = [_run_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            counts = list(pool.map(_run_chunk, tasks))
+    return np.concatenate(counts, axis=1)
+
+def _as_rows(values, dtype):
+    values = np.asarray(values, dtype=dtype)
+    return np.ascontiguousarray(values[None, :] if values.ndim == 1 else values)
+
+@traced(rows=lambda result, predictions, *args, **kwargs: np.shape(predictions)[-1])
+def resample_accuracy(predictions, actual, replicates=REPLICATES, block=None,
+                      level=0.95, seed=SEED, workers=None):
+    """Accuracy, block-bootstrap interval and permutation p-value per model.
+
+    `predictions` is one 0/1 row per model (or a single row) over the same
+    scored bars as `actual`, in time order. Returns one dict per model;
+    'bootstrap' holds the replicate accuracies (%), paired across models.
+    """
+    predictions = _as_rows(predictions, np.int8)
+    actual = np.ascontiguousarray(actual, dtype=np.int8)
+    n = len(actual)
+    if predictions.shape[1] != n or n == 0:
+        raise ValueError(f"Need predictions for the {n} scored bars, got {predictions.shape[1]}")
+    block = block or default_block_length(n)
+
+    hits = (predictions == actual).astype(np.int8)
+    boot = _replicate('bootstrap', (hits,), replicates, block, seed, workers) / n * 100
+    null = _replicate('permutation', (predictions, actual), replicates, block, seed + 1, workers)
+
+    results = []
+    tail = (1 - level) / 2 * 100
+    for i, correct in enumerate(hits.sum(axis=1)):
+        low, high = np.percentile(boot[i], [tail, 100 - tail])
+        results.append({
+            'accuracy': correct / n * 100,
+            'correct': int(correct),
+            'total': n,
+            'ci_low': float(low),
+            'ci_high': float(high),
+            'null_mean': float(null[i].mean() / n * 100),
+            # One-sided, with the observed accuracy counted among the replicates
+            'p_value': float((1 + (null[i] >= correct).sum()) / (replicates + 1)),
+            'block': block,
+            'replicates': replicates,
+            'bootstrap': boot[i],
+        })
+    return results
+
+def difference_interval(first, second, level=0.95):
+    """Interval for accuracy(first) - accuracy(second) from paired replicates,
+    and the share of replicates where `second` is at least as accurate"""
+    difference = first['bootstrap'] - second['bootstrap']
+    tail = (1 - level) / 2 * 100
+    low, high = np.percentile(difference, [tail, 100 - tail])
+    return float(low), float(high), float((difference <= 0).mean())
+
+def format_result(result, level=0.95):
+    """One-line accuracy, interval and p-value"""
+    return (f"{result['accuracy']:.2f}% [{result['ci_low']:.2f}, {result['ci_high']:.2f}] "
+            f"{level:.0%} CI, p = {result['p_value']:.4f} vs no skill "
+            f"({result['null_mean']:.2f}% by chance)")
+
+if __name__ == "__main__":
+    from features.build_features import MODEL_FEATURES
+    from models.artifacts import cached_dataset, latest_artifact
+    from models.backtest import CrossoverRule
+    from models.evaluate import target_column
+    from models.train import MODELS
+
+    parser = argparse.ArgumentParser(
+        description="Bootstrap intervals and permutation p-values for test-split accuracy")
+    parser.add_argument('--replicates', type=int, default=REPLICATES)
+    parser.add_argument('--block', type=int, default=None, help="bars per block (default: n^(1/3))")
+    parser.add_argument('--horizon', type=int, default=1,
+                        help="score h-day direction (needs build_features.py --horizons)")
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    target = target_column(args.horizon)
+    try:
+        X, y, dates = cached_dataset(target)
+    except KeyError:
+        parser.error(f"no {target} column - rebuild with build_features.py --horizons {args.horizon}")
+    X, y = np.asarray(X), np.asarray(y)
+
+    # Stored models were fit on train+val; score everything on the bars after it, as train.py does
+    artifacts = {model: latest_artifact(target, model) for model in MODELS}
+    search_end = next((a.manifest['rows'] for a in artifacts.values() if a), int(len(y) * 0.85))
+    test = slice(search_end + args.horizon, len(y))
+    names = ['persistence', 'sma_5>sma_20']
+    predictions = [y[test.start - args.horizon:len(y) - args.horizon],
+                   CrossoverRule().predict(X[test])]
+    for model, artifact in artifacts.items():
+        if artifact is None:
+            print(f"⚠️ No fresh {model} artifact for {target} (run src/models/train.py --models {model})")
+            continue
+        columns = [MODEL_FEATURES.index(f) for f in artifact.features]
+        names.append(model)
+        predictions.append(artifact.predict(X[test][:, columns]))
+
+    start = time.perf_counter()
+    results = resample_accuracy(np.stack(predictions), y[test], args.replicates,
+                                args.block, seed=args.seed, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print("="*80)
+    print(f"ACCURACY SIGNIFICANCE: {args.horizon}-day direction, test {dates[test.start]} to {dates[-1]}")
+    print("="*80)
+    print(f"{len(y[test])} bars, blocks of {results[0]['block']}, {args.replicates:,} bootstrap "
+          f"and {args.replicates:,} permutation replicates per model in {elapsed:.2f}s\n")
+    print(f"{'model':<14}{'acc':>8}{'95% CI':>18}{'chance':>9}{'p':>9}")
+    print("-" * 58)
+    for name, result in zip(names, results):
+        print(f"{name:<14}{result['accuracy']:>7.2f}%  [{result['ci_low']:>6.2f}, {result['ci_high']:>6.2f}]"
+              f"{result['null_mean']:>8.2f}%{result['p_value']:>9.4f}")
+
+    # Every model against the best baseline, paired on the same bootstrap blocks
+    best = max(range(2), key=lambda i: results[i]['accuracy'])
+    if len(results) > 2:
+        print(f"\nVersus the best baseline ({names[best]}):")
+        for name, result in zip(names[2:], results[2:]):
+            low, high, no_better = difference_interval(result, results[best])
+            print(f"  {name:<12}{result['accuracy'] - results[best]['accuracy']:>+7.2f} pts "
+                  f"[{low:+.2f}, {high:+.2f}], not better in {no_better:.1%} of replicates")
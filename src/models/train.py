@@ -0,0 +1,285 @@
+# Phase 5: Model Training & Search
+# Silver Price Forecasting - Parallel hyper-parameter and feature-set search
+#
+# Moves the notebook's four sklearn models into a search over their
+# hyper-parameters and over subsets of the 11 model features. Candidates
+# are scored on walk-forward validation folds inside the train+val part
+# of the series (the test split is never searched on) using successive
+# halving: every candidate gets the first few folds, only the best 1/eta
+# advance to more folds. Each finished (candidate, fold) is appended to a
+# JSONL log, so an interrupted search resumes without refitting anything.
+
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+SEARCH_LOG = BASE_DIR / "data" / "search" / "search_log.jsonl"
+
+# Make src/ importable when run as a script
+SRC_DIR = BASE_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from features.build_features import MODEL_FEATURES
+from models.backtest import SHARED, attach_shared, share_array, walk_forward_folds
+from models.artifacts import (
+    cached_dataset, data_fingerprint, feature_spec, find_artifact, save_artifact
+)
+from pipeline.trace import traced
+
+# Notebook settings are the fixed base; grids vary around them
+MODELS = {
+    'lr': ({'random_state': 42, 'max_iter': 1000},
+           {'C': [0.01, 0.1, 1.0, 10.0]}),
+    'rf': ({'random_state': 42, 'n_jobs': 1},
+           {'n_estimators': [100, 300], 'max_depth': [5, 10, None], 'min_samples_leaf': [1, 10]}),
+    'gb': ({'random_state': 42},
+           {'n_estimators': [100, 200], 'learning_rate': [0.05, 0.1], 'max_depth': [3, 5]}),
+    'mlp': ({'activation': 'relu', 'max_iter': 500, 'random_state': 42, 'early_stopping': True},
+            {'hidden_layer_sizes': [[64, 32], [32]], 'alpha': [1e-4, 1e-2]}),
+}
+
+# Feature groups; the 'groups' search tries every non-empty union of them
+FEATURE_GROUPS = {
+    'returns': ['return', 'momentum'],
+    'trend': ['sma_5', 'sma_20', 'sma_50'],
+    'oscillators': ['rsi', 'bb_distance'],
+    'volatility': ['volatility'],
+    'lags': ['lag_1', 'lag_7', 'lag_30'],
+}
+
+def build_estimator(model, params):
+    """Unfitted estimator; LR and MLP are scaled as in the notebook's MLP"""
+    base, _ = MODELS[model]
+    params = dict(base, **params)
+    if model == 'lr':
+        from sklearn.linear_model import LogisticRegression
+        estimator = LogisticRegression(**params)
+    elif model == 'rf':
+        from sklearn.ensemble import RandomForestClassifier
+        return RandomForestClassifier(**params)
+    elif model == 'gb':
+        from sklearn.ensemble import GradientBoostingClassifier
+        return GradientBoostingClassifier(**params)
+    elif model == 'mlp':
+        from sklearn.neural_network import MLPClassifier
+        params['hidden_layer_sizes'] = tuple(params['hidden_layer_sizes'])
+        estimator = MLPClassifier(**params)
+    else:
+        raise ValueError(f"Unknown model: {model}")
+
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    return make_pipeline(StandardScaler(), estimator)
+
+def fit_or_load(model, params, features, X, y, target='target', horizon=1, metrics=None):
+    """Fitted artifact for this candidate and training data, fitting only
+    if no fresh one is stored. Returns (artifact, loaded_from_store)"""
+    spec = feature_spec(features, target, horizon)
+    artifact = find_artifact(model, params, spec, X, y)
+    if artifact is not None:
+        return artifact, True
+    estimator = build_estimator(model, params)
+    estimator.fit(X, y)
+    return save_artifact(estimator, model, params, spec, X, y, metrics=metrics), False
+
+def feature_sets(mode):
+    """Feature subsets to search: 'all', 'drop-one' or 'groups'"""
+    if mode == 'all':
+        return [list(MODEL_FEATURES)]
+    if mode == 'drop-one':
+        return [list(MODEL_FEATURES)] + [[f for f in MODEL_FEATURES if f != drop]
+                                         for drop in MODEL_FEATURES]
+    if mode == 'groups':
+        names = list(FEATURE_GROUPS)
+        subsets = []
+        for k in range(1, len(names) + 1):
+            for combo in itertools.combinations(names, k):
+                chosen = {f for name in combo for f in FEATURE_GROUPS[name]}
+                subsets.append([f for f in MODEL_FEATURES if f in chosen])
+        return subsets
+    raise ValueError(f"Unknown feature set mode: {mode}")
+
+def candidates(models, feature_mode, folds, target='target', data_fp=None):
+    """Every (model, params, features) combination with a stable id.
+
+    The id also covers the folds, the target column and a fingerprint of
+    the search rows, so logged scores are only reused for the same labels
+    and data.
+    """
+    result = []
+    for model in models:
+        _, grid = MODELS[model]
+        keys = sorted(grid)
+        for values in itertools.product(*(grid[k] for k in keys)):
+            params = dict(zip(keys, values))
+            for features in feature_sets(feature_mode):
+                spec = {'model': model, 'params': params, 'features': features}
+                # Other folds, labels or rows mean other scores
+                key = json.dumps(dict(spec, folds=folds, target=target, data=data_fp), sort_keys=True)
+                spec['id'] = hashlib.sha1(key.encode()).hexdigest()[:16]
+                result.append(spec)
+    return result
+
+def _score_folds(task):
+    """Fit and score one candidate on the given folds (runs in a worker)"""
+    spec, folds = task
+    X = SHARED['X'][1]
+    y = SHARED['y'][1]
+    columns = [MODEL_FEATURES.index(f) for f in spec['features']]
+
+    scores = []
+    for index, (train_start, train_end, test_start, test_end) in folds:
+        start = time.perf_counter()
+        estimator = build_estimator(spec['model'], spec['params'])
+        estimator.fit(X[train_start:train_end][:, columns], y[train_start:train_end])
+        predictions = estimator.predict(X[test_start:test_end][:, columns])
+        scores.append({
+            'candidate': spec['id'],
+            'fold': index,
+            'correct': int((predictions == y[test_start:test_end]).sum()),
+            'total': test_end - test_start,
+            'seconds': round(time.perf_counter() - start, 4),
+        })
+    return scores
+
+def load_log(path):
+    """Finished fold scores from a previous run, keyed by (candidate, fold)"""
+    done = {}
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from an interrupted run
+                if 'fold' in entry:
+                    done[(entry['candidate'], entry['fold'])] = entry
+    except FileNotFoundError:
+        pass
+    return done
+
+def rung_budgets(n_folds, eta, rungs):
+    """Number of folds each successive-halving rung evaluates"""
+    return sorted({max(1, math.ceil(n_folds / eta ** (rungs - 1 - r))) for r in range(rungs)})
+
+@traced(rows=lambda result, X, *args, **kwargs: len(X))
+def search(X, y, folds, specs, log_path=SEARCH_LOG, workers=None, eta=3, rungs=3):
+    """Successive-halving search; returns [(accuracy, spec)] best first"""
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    done = load_log(log_path)
+    indexed_folds = list(enumerate(folds))
+    workers = workers or os.cpu_count() or 1
+
+    def accuracy(spec, budget):
+        entries = [done[(spec['id'], k)] for k in range(budget)]
+        return sum(e['correct'] for e in entries) / sum(e['total'] for e in entries) * 100
+
+    x_block, x_spec = share_array(np.ascontiguousarray(X, dtype=np.float64))
+    y_block, y_spec = share_array(np.ascontiguousarray(y, dtype=np.int8))
+    alive = list(specs)
+    try:
+        with ProcessPoolExecutor(workers, initializer=attach_shared,
+                                 initargs=({'X': x_spec, 'y': y_spec},)) as pool, \
+                open(log_path, 'a') as log:
+            for rung, budget in enumerate(rung_budgets(len(folds), eta, rungs)):
+                # Only folds not already in the log are fitted
+                tasks = []
+                for spec in alive:
+                    todo = [f for f in indexed_folds[:budget] if (spec['id'], f[0]) not in done]
+                    if todo:
+                        tasks.append((spec, todo))
+                        if all((spec['id'], k) not in done for k in range(len(folds))):
+                            log.write(json.dumps({'candidate': spec['id'], 'spec': spec}) + "\n")
+
+                start = time.perf_counter()
+                for future in as_completed([pool.submit(_score_folds, t) for t in tasks]):
+                    for entry in future.result():
+                        done[(entry['candidate'], entry['fold'])] = entry
+                        log.write(json.dumps(entry) + "\n")
+                    log.flush()
+
+                ranked = sorted(alive, key=lambda s: accuracy(s, budget), reverse=True)
+                print(f"  Rung {rung + 1}: {len(alive)} candidates x {budget} folds "
+                      f"({len(tasks)} fitted, {time.perf_counter() - start:.1f}s) "
+                      f"best {accuracy(ranked[0], budget):.2f}%")
+                if budget < len(folds):
+                    alive = ranked[:max(1, math.ceil(len(ranked) / eta))]
+                else:
+                    alive = ranked
+    finally:
+        for block in (x_block, y_block):
+            block.close()
+            block.unlink()
+
+    budget = len(folds)
+    return [(accuracy(spec, budget), spec) for spec in alive]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel model and feature-set search")
+    parser.add_argument('--models', nargs='+', default=['lr', 'rf', 'gb', 'mlp'], choices=list(MODELS))
+    parser.add_argument('--feature-sets', default='groups', choices=['all', 'drop-one', 'groups'])
+    parser.add_argument('--train-size', type=int, default=750)
+    parser.add_argument('--test-size', type=int, default=126)
+    parser.add_argument('--eta', type=int, default=3, help="keep the best 1/eta at each rung")
+    parser.add_argument('--rungs', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--log', type=Path, default=SEARCH_LOG)
+    parser.add_argument('--horizon', type=int, default=1,
+                        help="predict h-day direction (needs build_features.py --horizons)")
+    args = parser.parse_args()
+
+    print("="*80)
+    print("PHASE 5: MODEL & FEATURE SEARCH")
+    print("="*80)
+
+    from models.evaluate import target_column
+    try:
+        X, y, dates = cached_dataset(target_column(args.horizon))
+    except KeyError:
+        parser.error(f"no {target_column(args.horizon)} column - rebuild with "
+                     f"build_features.py --horizons {args.horizon}")
+    # Search only inside train+val; the last 15% stays untouched for testing
+    search_end = int(len(y) * 0.85)
+    # h-day labels overlap the next h-1 rows: embargo h rows between windows
+    embargo = args.horizon
+    folds = walk_forward_folds(search_end, args.train_size, args.test_size, embargo=embargo)
+    if not folds:
+        parser.error(f"no validation folds: {search_end} search rows cannot hold --train-size "
+                     f"{args.train_size} + embargo {embargo} + --test-size {args.test_size}")
+    specs = candidates(args.models, args.feature_sets, folds, target_column(args.horizon),
+                       data_fingerprint(X[:search_end], y[:search_end]))
+    print(f"\n🔍 {len(specs)} candidates, {len(folds)} validation folds, log: {args.log}")
+
+    results = search(X, y, folds, specs, args.log, args.workers, args.eta, args.rungs)
+
+    print(f"\n🏆 TOP CANDIDATES (walk-forward validation accuracy)")
+    print("-" * 80)
+    for acc, spec in results[:10]:
+        print(f"{acc:6.2f}%  {spec['model']:<4} {json.dumps(spec['params'])}")
+        print(f"         features: {', '.join(spec['features'])}")
+
+    # Refit the winner on train+val (or load it if already stored) and score the test split once
+    acc, best = results[0]
+    columns = [MODEL_FEATURES.index(f) for f in best['features']]
+    artifact, loaded = fit_or_load(best['model'], best['params'], best['features'],
+                                   X[:search_end][:, columns], y[:search_end],
+                                   target_column(args.horizon), args.horizon, {'val_acc': acc})
+    test_start = search_end + embargo
+    from models.significance import format_result, resample_accuracy
+    result, = resample_accuracy(artifact.predict(X[test_start:][:, columns]), y[test_start:],
+                                workers=args.workers)
+    print(f"\n📈 Best candidate on test ({dates[test_start]} to {dates[-1]}): {format_result(result)}")
+    print(f"💾 {'Loaded stored' if loaded else 'Saved'} model artifact: {artifact.path}")
@@ -0,0 +1,265 @@
+# Pipeline Orchestrator
+# Silver Price Forecasting - Run the phase scripts as a DAG, skipping fresh stages
+#
+# Each stage declares the artifacts it reads and writes under data/. A
+# stage's key is a hash of its command and the fingerprints of its inputs
+# (including the code it runs); a stage is skipped when its key matches
+# the last successful run and its outputs are unchanged since. Stages
+# whose dependencies are done run concurrently (EDA next to features).
+# Fingerprints are content hashes cached against size and mtime, so a
+# no-op run only stats files. Only the standard library is imported here.
+# --trace / --profile pass SILVER_TRACE / SILVER_PROFILE to every stage
+# under one run id, so `python src/pipeline/trace.py` shows the whole run.
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+SRC_DIR = BASE_DIR / "src"
+SCRIPTS_DIR = BASE_DIR / "scripts"
+RAW_DATA = BASE_DIR / "data" / "raw" / "silver_prices_data.csv"
+FORECAST_DATA = BASE_DIR / "data" / "raw" / "silver_price_forecast_2026.csv"
+QUALITY_REPORT = BASE_DIR / "data" / "raw" / "silver_prices_data.csv.quality.json"
+FEATURE_STORE = BASE_DIR / "data" / "processed" / "silver_features"
+FEATURES_CSV = BASE_DIR / "data" / "processed" / "silver_features.csv"
+STATE_FILE = BASE_DIR / "data" / "processed" / "silver_features_state.json"
+PIPELINE_DIR = BASE_DIR / "data" / "pipeline"
+PIPELINE_STATE = PIPELINE_DIR / "state.json"
+LOG_DIR = PIPELINE_DIR / "logs"
+
+class Stage:
+    """One pipeline step: a Python script plus its declared artifacts.
+
+    A `source` stage has no inputs and is only run when an output is
+    missing (the download cannot tell whether upstream data changed).
+    """
+
+    def __init__(self, name, script, args=(), inputs=(), outputs=(), deps=(), source=False,
+                 cwd=BASE_DIR):
+        self.name = name
+        self.script = Path(script)
+        self.args = list(args)
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs] + [LOG_DIR / f"{name}.log"]
+        self.deps = list(deps)
+        self.source = source
+        self.cwd = cwd
+
+    def command(self):
+        return [sys.executable, str(self.script)] + self.args
+
+    def code(self):
+        """Code the stage runs: its script, plus src/ for non-source stages"""
+        return [self.script] if self.source else [self.script, SRC_DIR]
+
+STAGES = [
+    Stage('download', SCRIPTS_DIR / "download_data.py", outputs=[RAW_DATA], source=True,
+          cwd=SCRIPTS_DIR),
+    Stage('inspect', SCRIPTS_DIR / "inspect_data.py", inputs=[RAW_DATA, FORECAST_DATA],
+          outputs=[QUALITY_REPORT], deps=['download']),
+    Stage('eda', SCRIPTS_DIR / "eda_analysis.py", inputs=[RAW_DATA], deps=['inspect']),
+    Stage('features', SRC_DIR / "features" / "build_features.py", args=['--csv', '--horizons'],
+          inputs=[RAW_DATA, QUALITY_REPORT], outputs=[FEATURE_STORE, FEATURES_CSV, STATE_FILE],
+          deps=['inspect']),
+    Stage('baseline', SRC_DIR / "models" / "baseline.py", inputs=[FEATURE_STORE],
+          deps=['features']),
+]
+
+def _relative(path):
+    try:
+        return str(Path(path).relative_to(BASE_DIR))
+    except ValueError:
+        return str(path)
+
+class Fingerprints:
+    """Content hashes of files and directories, cached by size and mtime"""
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else {}
+
+    def file(self, path):
+        stat = os.stat(path)
+        key = _relative(path)
+        cached = self.cache.get(key)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['hash']
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self.cache[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                           'hash': digest.hexdigest()}
+        return digest.hexdigest()
+
+    def __call__(self, path):
+        """Hash of a file or of every file under a directory; None if missing"""
+        path = Path(path)
+        if path.is_file():
+            return self.file(path)
+        if not path.is_dir():
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__' and not d.endswith('.cache'))
+            for name in sorted(files):
+                if name.endswith('.pyc'):
+                    continue
+                child = Path(root) / name
+                digest.update(f"{child.relative_to(path)}:{self.file(child)}\n".encode())
+        return digest.hexdigest()
+
+def load_pipeline_state():
+    try:
+        with open(PIPELINE_STATE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'files': {}, 'stages': {}}
+
+def save_pipeline_state(state):
+    PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = PIPELINE_STATE.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=1)
+    tmp.replace(PIPELINE_STATE)
+
+def stage_key(stage, fingerprint):
+    """Hash of the command and every input's fingerprint"""
+    inputs = {_relative(p): fingerprint(p) for p in stage.inputs + stage.code()}
+    payload = json.dumps({'command': stage.command()[1:], 'inputs': inputs}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def is_fresh(stage, key, record, fingerprint):
+    """True if the last successful run had this key and left these outputs"""
+    if stage.source:
+        return all(p.exists() for p in stage.outputs[:-1])
+    if not record or record['key'] != key:
+        return False
+    return all(fingerprint(p) is not None and fingerprint(p) == record['outputs'].get(_relative(p))
+               for p in stage.outputs)
+
+def run_stage(stage, env=None):
+    """Run one stage's script, teeing its output to the stage log"""
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    with open(LOG_DIR / f"{stage.name}.log", 'w') as log:
+        result = subprocess.run(stage.command(), cwd=stage.cwd, stdout=log,
+                                stderr=subprocess.STDOUT, env=env)
+    return result.returncode, time.perf_counter() - start
+
+def select(stages, targets):
+    """Targets plus everything upstream of them, in declaration order"""
+    by_name = {s.name: s for s in stages}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown stage: {', '.join(unknown)}")
+    needed = set()
+    todo = list(targets or by_name)
+    while todo:
+        name = todo.pop()
+        if name not in needed:
+            needed.add(name)
+            todo.extend(by_name[name].deps)
+    return [s for s in stages if s.name in needed]
+
+def run_pipeline(stages=STAGES, targets=(), force=(), workers=None, dry_run=False, env=None):
+    """Run stale stages, dependencies first; returns {stage: (status, seconds)}"""
+    stages = select(stages, targets)
+    state = load_pipeline_state()
+    fingerprint = Fingerprints(state['files'])
+    force = set(force)
+    results = {}
+    pending = list(stages)
+    running = {}
+
+    with ThreadPoolExecutor(workers or os.cpu_count() or 1) as pool:
+        while pending or running:
+            for stage in list(pending):
+                deps = [results[d][0] if d in results else None
+                        for d in stage.deps if any(s.name == d for s in stages)]
+                if None in deps:
+                    continue  # A dependency has not finished yet
+                pending.remove(stage)
+                if any(status in ('failed', 'blocked') for status in deps):
+                    results[stage.name] = ('blocked', 0.0)
+                    print(f"⏭️  {stage.name}: blocked by a failed dependency")
+                    continue
+
+                key = stage_key(stage, fingerprint)
+                record = state['stages'].get(stage.name)
+                upstream_stale = 'stale' in deps
+                if (stage.name not in force and not upstream_stale
+                        and is_fresh(stage, key, record, fingerprint)):
+                    results[stage.name] = ('fresh', 0.0)
+                    print(f"✅ {stage.name}: up to date")
+                elif dry_run:
+                    results[stage.name] = ('stale', 0.0)
+                    print(f"🔄 {stage.name}: would run")
+                else:
+                    print(f"▶️  {stage.name}: running {_relative(stage.script)}")
+                    running[pool.submit(run_stage, stage, env)] = (stage, key)
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, key = running.pop(future)
+                code, seconds = future.result()
+                if code == 0:
+                    state['stages'][stage.name] = {
+                        'key': key,
+                        'outputs': {_relative(p): fingerprint(p) for p in stage.outputs},
+                        'finished': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                        'seconds': round(seconds, 3),
+                    }
+                    results[stage.name] = ('ran', seconds)
+                    print(f"✅ {stage.name}: done in {seconds:.2f}s")
+                else:
+                    state['stages'].pop(stage.name, None)
+                    results[stage.name] = ('failed', seconds)
+                    print(f"❌ {stage.name}: exit code {code} (see {_relative(LOG_DIR / stage.name)}.log)")
+                save_pipeline_state(state)
+
+    if not dry_run:
+        save_pipeline_state(state)
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the pipeline stages that are out of date")
+    parser.add_argument('stages', nargs='*', help="target stages (default: all); upstream stages are included")
+    parser.add_argument('--force', nargs='+', default=[], metavar='STAGE', help="run these even if fresh")
+    parser.add_argument('--dry-run', action='store_true', help="only report which stages would run")
+    parser.add_argument('--workers', type=int, default=None, help="stages run at the same time")
+    parser.add_argument('--trace', action='store_true', help="record stage timings to data/pipeline/trace.jsonl")
+    parser.add_argument('--profile', choices=['cprofile', 'tracemalloc'], default=None,
+                        help="also profile each stage (implies --trace)")
+    args = parser.parse_args()
+
+    env = None
+    if args.trace or args.profile:
+        env = dict(os.environ, SILVER_TRACE='1',
+                   SILVER_TRACE_RUN=time.strftime('%Y%m%dT%H%M%S') + f"-{os.getpid()}")
+        if args.profile:
+            env['SILVER_PROFILE'] = args.profile
+
+    start = time.perf_counter()
+    try:
+        results = run_pipeline(STAGES, args.stages, args.force, args.workers, args.dry_run, env)
+    except ValueError as error:
+        parser.error(str(error))
+    elapsed = time.perf_counter() - start
+
+    counts = {}
+    for status, _ in results.values():
+        counts[status] = counts.get(status, 0) + 1
+    print(f"\nPipeline: {', '.join(f'{n} {s}' for s, n in counts.items())} "
+          f"in {elapsed * 1000:.0f} ms")
+    sys.exit(1 if 'failed' in counts or 'blocked' in counts else 0)
@@ -0,0 +1,282 @@
+# Profiling & Timing Trace
+# Silver Price Forecasting - Per-stage wall/CPU time, memory and throughput
+#
+# Loaders, indicator functions, evaluators and script entry points are
+# wrapped in spans. With tracing on, every span appends one JSON line to
+# data/pipeline/trace.jsonl: wall and CPU seconds, process RSS and peak
+# RSS, rows and rows/s, and the enclosing span. Off (the default), a
+# wrapped call costs one flag check.
+#
+#   SILVER_TRACE=1                 record spans
+#   SILVER_PROFILE=cprofile        also profile each entry point with cProfile
+#   SILVER_PROFILE=tracemalloc     also record peak Python allocations per span
+#   SILVER_TRACE_RUN=<id>          group spans from several processes into one run
+#
+# `python src/pipeline/trace.py` prints a summary of the latest run next to
+# the median of earlier runs, so hot-path regressions stand out.
+
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent.parent
+TRACE_FILE = BASE_DIR / "data" / "pipeline" / "trace.jsonl"
+PROFILE_DIR = BASE_DIR / "data" / "pipeline" / "profiles"
+
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+
+_STATE = {
+    'enabled': False,
+    'profile': None,
+    'run': None,
+    'path': TRACE_FILE,
+    'stack': [],
+}
+
+def configure(enabled=None, profile=None, run=None, path=None):
+    """Turn tracing on or off; defaults come from the SILVER_* variables"""
+    if profile is not None and profile not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode: {profile} (use {', '.join(PROFILE_MODES)})")
+    if enabled is not None:
+        _STATE['enabled'] = enabled
+    if profile is not None:
+        _STATE['profile'] = profile
+        _STATE['enabled'] = True
+    if run is not None:
+        _STATE['run'] = run
+    if path is not None:
+        _STATE['path'] = Path(path)
+
+def _configure_from_env():
+    profile = os.environ.get('SILVER_PROFILE') or None
+    configure(enabled=os.environ.get('SILVER_TRACE', '') not in ('', '0'),
+              profile=profile if profile in PROFILE_MODES else None,
+              run=os.environ.get('SILVER_TRACE_RUN') or None)
+
+def enabled():
+    return _STATE['enabled']
+
+def _run_id():
+    if _STATE['run'] is None:
+        _STATE['run'] = time.strftime('%Y%m%dT%H%M%S') + f"-{os.getpid()}"
+    return _STATE['run']
+
+def _rss_mb():
+    """(current, peak) resident set size in MB; None where unavailable"""
+    current = peak = None
+    try:
+        with open('/proc/self/statm') as f:
+            current = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = peak / 1e6 if sys.platform == 'darwin' else peak * 1024 / 1e6  # bytes vs KiB
+    return current, peak
+
+def _write(record):
+    path = _STATE['path']
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(record) + "\n")
+
+@contextmanager
+def span(name, rows=None):
+    """Time a block; set `info['rows']` inside it to record throughput"""
+    info = {'rows': rows}
+    if not _STATE['enabled']:
+        yield info
+        return
+
+    tracing_memory = _STATE['profile'] == 'tracemalloc'
+    if tracing_memory:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        py_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    stack = _STATE['stack']
+    parent = stack[-1]['name'] if stack else None
+    frame = {'name': name, 'child_peak': 0}
+    stack.append(frame)
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield info
+    finally:
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+        stack.pop()
+        rss, rss_peak = _rss_mb()
+        record = {
+            'run': _run_id(),
+            'ts': round(time.time(), 3),
+            'pid': os.getpid(),
+            'span': name,
+            'parent': parent,
+            'wall_s': round(wall, 6),
+            'cpu_s': round(cpu, 6),
+            'rss_mb': round(rss, 1) if rss is not None else None,
+            'rss_peak_mb': round(rss_peak, 1) if rss_peak is not None else None,
+            'rows': info['rows'],
+            'rows_per_s': round(info['rows'] / wall, 1) if info['rows'] and wall > 0 else None,
+        }
+        if tracing_memory:
+            # Nested spans reset the peak, so fold theirs back into ours
+            peak = max(tracemalloc.get_traced_memory()[1], frame['child_peak'])
+            record['py_peak_mb'] = round((peak - py_start) / 1e6, 3)
+            if stack:
+                stack[-1]['child_peak'] = max(stack[-1]['child_peak'], peak)
+            else:
+                tracemalloc.reset_peak()
+        _write(record)
+
+def traced(name=None, rows=None):
+    """Decorator: record each call as a span.
+
+    `rows` is a callable `rows(result, *args, **kwargs)`; by default the
+    length of the first argument (the price series) is used when it has one.
+    """
+    def decorate(function):
+        # Module file stem, not __module__, so scripts are not all "__main__"
+        label = name or f"{Path(function.__code__.co_filename).stem}.{function.__name__}"
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _STATE['enabled']:
+                return function(*args, **kwargs)
+            with span(label) as info:
+                result = function(*args, **kwargs)
+                if rows is not None:
+                    info['rows'] = rows(result, *args, **kwargs)
+                elif args and hasattr(args[0], '__len__'):
+                    info['rows'] = len(args[0])
+                return result
+        return wrapper
+    return decorate
+
+@contextmanager
+def entry_point(name):
+    """Span for a whole script run, with the opt-in profiler around it"""
+    profiler = None
+    if _STATE['profile'] == 'cprofile':
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        with span(name) as info:
+            yield info
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _report_profile(name, profiler)
+        elif _STATE['profile'] == 'tracemalloc':
+            _report_allocations(name)
+
+def _report_profile(name, profiler):
+    import pstats
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    path = PROFILE_DIR / f"{name}-{_run_id()}.prof"
+    profiler.dump_stats(path)
+    print(f"\n🔬 cProfile: {path}", file=sys.stderr)
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(15)
+
+def _report_allocations(name, top=10):
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        return
+    print(f"\n🔬 Top allocations ({name}):", file=sys.stderr)
+    for stat in tracemalloc.take_snapshot().statistics('lineno')[:top]:
+        print(f"  {stat}", file=sys.stderr)
+
+def read_trace(path=TRACE_FILE):
+    records = []
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # Torn line from a killed process
+    except FileNotFoundError:
+        pass
+    return records
+
+def _median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+def summarize(records, run=None):
+    """Per-span totals for one run (default: the latest) plus the median
+    total wall time of the same span over earlier runs"""
+    runs = []
+    for record in records:
+        if record['run'] not in runs:
+            runs.append(record['run'])
+    if not runs:
+        return None, []
+    run = run or runs[-1]
+    earlier = runs[:runs.index(run)] if run in runs else []
+
+    totals = {}
+    for record in records:
+        entry = totals.setdefault((record['run'], record['span']), {
+            'span': record['span'], 'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0,
+            'rows': 0, 'rss_peak_mb': 0.0, 'py_peak_mb': None})
+        entry['calls'] += 1
+        entry['wall_s'] += record['wall_s']
+        entry['cpu_s'] += record['cpu_s']
+        entry['rows'] += record.get('rows') or 0
+        entry['rss_peak_mb'] = max(entry['rss_peak_mb'], record.get('rss_peak_mb') or 0.0)
+        if record.get('py_peak_mb') is not None:
+            entry['py_peak_mb'] = max(entry['py_peak_mb'] or 0.0, record['py_peak_mb'])
+
+    rows = []
+    for (record_run, name), entry in totals.items():
+        if record_run != run:
+            continue
+        history = [totals[(r, name)]['wall_s'] for r in earlier if (r, name) in totals]
+        entry['baseline_s'] = _median(history) if history else None
+        entry['rows_per_s'] = entry['rows'] / entry['wall_s'] if entry['rows'] and entry['wall_s'] else None
+        rows.append(entry)
+    rows.sort(key=lambda e: e['wall_s'], reverse=True)
+    return run, rows
+
+def print_summary(run, rows, top=30):
+    print(f"Trace run {run}")
+    print(f"{'span':<38}{'calls':>6}{'wall s':>10}{'cpu s':>9}{'rows/s':>13}{'peak MB':>9}{'vs prev':>9}")
+    print("-" * 94)
+    for entry in rows[:top]:
+        rate = f"{entry['rows_per_s']:,.0f}" if entry['rows_per_s'] else "-"
+        change = "-"
+        if entry['baseline_s']:
+            change = f"{(entry['wall_s'] / entry['baseline_s'] - 1) * 100:+.0f}%"
+        print(f"{entry['span'][:37]:<38}{entry['calls']:>6}{entry['wall_s']:>10.4f}"
+              f"{entry['cpu_s']:>9.3f}{rate:>13}{entry['rss_peak_mb']:>9.1f}{change:>9}")
+
+_configure_from_env()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize the JSONL timing trace")
+    parser.add_argument('--file', type=Path, default=TRACE_FILE)
+    parser.add_argument('--run', default=None, help="run id (default: the latest)")
+    parser.add_argument('--top', type=int, default=30)
+    args = parser.parse_args()
+
+    run, rows = summarize(read_trace(args.file), args.run)
+    if run is None:
+        print(f"No trace records in {args.file} (run a stage with SILVER_TRACE=1)")
+    else:
+        print_summary(run, rows, args.top)
@@ -0,0 +1,60 @@
+# Silver Forecast CLI
+# Silver Price Forecasting - One entry point for every pipeline phase
+#
+#   python src/silverforecast.py <command> [options]
+#   PYTHONPATH=src python -m silverforecast <command> [options]
+#
+# Each command runs its phase script as if it were started directly, with
+# the remaining arguments (`silverforecast features --help` shows the
+# feature options). Only the standard library is imported until a command
+# has been chosen; NumPy, pandas and sklearn are then imported by the
+# command that needs them and by no other, so cron/CI runs of the light
+# commands (eda, download, pipeline, trace) never pay for them.
+
+import argparse
+import runpy
+import sys
+from pathlib import Path
+
+# File paths
+SRC_DIR = Path(__file__).parent
+BASE_DIR = SRC_DIR.parent
+SCRIPTS_DIR = BASE_DIR / "scripts"
+
+# command -> (script, summary)
+COMMANDS = {
+    'download': (SCRIPTS_DIR / "download_data.py", "fetch raw data (Kaggle, a mirror or OHLCV endpoints)"),
+    'inspect': (SCRIPTS_DIR / "inspect_data.py", "phase 1: inspect the raw CSVs, data quality report"),
+    'eda': (SCRIPTS_DIR / "eda_analysis.py", "phase 2: streaming exploratory analysis"),
+    'features': (SRC_DIR / "features" / "build_features.py", "phase 3: build the feature store"),
+    'baseline': (SRC_DIR / "models" / "baseline.py", "phase 4: naive and SMA-crossover baselines"),
+    'train': (SRC_DIR / "models" / "train.py", "phase 5: model and feature-set search"),
+    'evaluate': (SRC_DIR / "models" / "evaluate.py", "sweep rule-based baselines"),
+    'backtest': (SRC_DIR / "models" / "backtest.py", "walk-forward backtest of one model"),
+    'significance': (SRC_DIR / "models" / "significance.py", "bootstrap intervals and p-values for test accuracy"),
+    'artifacts': (SRC_DIR / "models" / "artifacts.py", "list or prune stored model artifacts"),
+    'serve': (SRC_DIR / "models" / "serve.py", "micro-batching scoring daemon"),
+    'pipeline': (SRC_DIR / "pipeline" / "orchestrator.py", "run the phases as a DAG, skipping fresh ones"),
+    'trace': (SRC_DIR / "pipeline" / "trace.py", "summarize the timing trace"),
+}
+
+def run_command(command, args=()):
+    """Run a command's script as __main__ with `args` as its argv"""
+    script, _ = COMMANDS[command]
+    sys.argv = [str(script)] + list(args)
+    sys.path.insert(0, str(script.parent))  # As `python script.py` would
+    runpy.run_path(str(script), run_name='__main__')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="silverforecast", description="Silver price forecasting pipeline",
+        epilog="Run 'silverforecast <command> --help' for a command's options.")
+    commands = parser.add_subparsers(dest='command', metavar='command', required=True)
+    for name, (_, summary) in COMMANDS.items():
+        commands.add_parser(name, help=summary, add_help=False)
+    # Everything after the command belongs to the command's own parser
+    args, rest = parser.parse_known_args(argv)
+    run_command(args.command, rest)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# Test Configuration
+# Make src/ and scripts/ importable, as the phase scripts do when run
+# directly. Timing regression tests are marked `benchmark` and only run
+# with --benchmarks
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# File paths
+BASE_DIR = Path(__file__).parent.parent
+SRC_DIR = BASE_DIR / "src"
+SCRIPTS_DIR = BASE_DIR / "scripts"
+for path in (SRC_DIR, SCRIPTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+def pytest_addoption(parser):
+    parser.addoption('--benchmarks', action='store_true',
+                     help="also run the timing regression tests against data/benchmarks/baseline.json")
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', "benchmark: timing regression test, skipped unless --benchmarks")
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmarks'):
+        return
+    skip = pytest.mark.skip(reason="timing benchmark (run with --benchmarks)")
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
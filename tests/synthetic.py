@@ -0,0 +1,14 @@
+# Synthetic Prices
+# Seeded price series shared by the tests
+
+import math
+import random
+
+def random_walk(n, seed=42, start=15.0, sigma=0.015):
+    """Geometric random walk shaped like daily silver closes"""
+    rng = random.Random(seed)
+    prices, price = [], start
+    for _ in range(n):
+        price *= math.exp(rng.gauss(0, sigma))
+        prices.append(price)
+    return prices
@@ -0,0 +1,223 @@
+# Data Acquisition
+# The acquisition layer against a local HTTP stub: resume, If-Range,
+# checksums, retry policy and append-only OHLCV refreshes
+
+import hashlib
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from data.acquire import HttpFile, acquire, last_csv_date, mirror_sources, ohlcv_sources
+
+class Stub:
+    """State of the fake mirror / OHLCV server"""
+
+    def __init__(self):
+        self.files = {}           # name -> bytes
+        self.fail_first = {}      # name -> remaining 503 responses
+        self.truncate_first = {}  # name -> remaining responses cut off half-way
+        self.bars = {}            # symbol -> {date: close}
+        self.requests = []        # (path, headers)
+        self.latency = 0.0        # Seconds per response
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def etag(self, name):
+        return '"' + hashlib.sha256(self.files[name]).hexdigest()[:16] + '"'
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        stub = self.server.stub
+        with stub.lock:
+            stub.requests.append((self.path, dict(self.headers)))
+            stub.in_flight += 1
+            stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+        try:
+            time.sleep(stub.latency)
+            url = urlparse(self.path)
+            if url.path.startswith('/ohlcv/'):
+                self._ohlcv(stub, url.path.split('/')[-1], parse_qs(url.query))
+            else:
+                self._file(stub, url.path.lstrip('/'))
+        finally:
+            with stub.lock:
+                stub.in_flight -= 1
+
+    def _send(self, status, body=b'', headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _file(self, stub, name):
+        if name.endswith('.sha256') and name[:-7] in stub.files:
+            return self._send(200, hashlib.sha256(stub.files[name[:-7]]).hexdigest().encode() + b"  x\n")
+        if name not in stub.files:
+            return self._send(404)
+        if stub.fail_first.get(name):
+            stub.fail_first[name] -= 1
+            return self._send(503, headers=[('Retry-After', '0.01')])
+        body, start = stub.files[name], 0
+        requested = self.headers.get('Range')
+        # If-Range: the range only applies while the validator still matches
+        if requested and self.headers.get('If-Range') not in (None, stub.etag(name)):
+            requested = None
+        if requested:
+            start = int(requested.split('=')[1].rstrip('-'))
+            if start >= len(body):
+                return self._send(416)
+        chunk = body[start:]
+        self.send_response(206 if requested else 200)
+        self.send_header('ETag', stub.etag(name))
+        if requested:
+            self.send_header('Content-Range', f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.send_header('Content-Length', str(len(chunk)))
+        self.end_headers()
+        if stub.truncate_first.get(name):
+            stub.truncate_first[name] -= 1
+            self.wfile.write(chunk[:len(chunk) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(chunk)
+
+    def _ohlcv(self, stub, symbol, query):
+        first = date(1970, 1, 1) + timedelta(days=int(query['period1'][0]) // 86400)
+        lines = ["Date,Open,High,Low,Close,Adj Close,Volume"]
+        for day, close in sorted(stub.bars.get(symbol, {}).items()):
+            if day >= first - timedelta(days=3):  # Yahoo also sends a few earlier bars
+                lines.append(f"{day},{close},{close + 1},{close - 1},{close},{close},100")
+        lines.append(f"{first},null,null,null,null,null,null")
+        self._send(200, ("\n".join(lines) + "\n").encode())
+
+@pytest.fixture
+def server():
+    """(stub, base URL) of a stub server on a free local port"""
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.stub = Stub()
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield httpd.stub, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def file_requests(stub, name):
+    return [headers for path, headers in stub.requests if path == f"/{name}"]
+
+def test_truncated_download_resumes_with_range(server, tmp_path):
+    stub, base = server
+    stub.files = {"a.csv": b"row," * 50_000}
+    stub.truncate_first = {"a.csv": 1}
+    results = acquire(mirror_sources(base, tmp_path, names=["a.csv"]), retries=2, backoff=0.01)
+
+    assert results[0][1] == 'ok'
+    assert (tmp_path / "a.csv").read_bytes() == stub.files["a.csv"]
+    resumed = file_requests(stub, "a.csv")[-1]
+    assert resumed['Range'] == f"bytes={len(stub.files['a.csv']) // 2}-"
+    assert resumed['If-Range'] == stub.etag("a.csv")
+    assert not list(tmp_path.glob("*.part*"))
+
+def test_changed_file_is_not_spliced_onto_old_part(server, tmp_path):
+    stub, base = server
+    old, new = b"old," * 1_000, b"new," * 1_500
+    (tmp_path / "a.csv.part").write_bytes(old[:1_000])
+    (tmp_path / "a.csv.part.validator").write_text('"old-version"')
+    stub.files = {"a.csv": new}
+    results = acquire([HttpFile(f"{base}/a.csv", tmp_path / "a.csv")], retries=0)
+
+    assert results[0][1] == 'ok'
+    assert (tmp_path / "a.csv").read_bytes() == new
+
+def test_part_without_validator_or_checksum_restarts(server, tmp_path):
+    stub, base = server
+    stub.files = {"a.csv": b"new," * 1_500}
+    (tmp_path / "a.csv.part").write_bytes(b"old," * 100)
+    results = acquire([HttpFile(f"{base}/a.csv", tmp_path / "a.csv")], retries=0)
+
+    assert results[0][1] == 'ok'
+    assert 'Range' not in file_requests(stub, "a.csv")[0]
+    assert (tmp_path / "a.csv").read_bytes() == stub.files["a.csv"]
+
+def test_second_run_is_a_no_op(server, tmp_path):
+    stub, base = server
+    stub.files = {"a.csv": b"x" * 1_000}
+    sources = mirror_sources(base, tmp_path, names=["a.csv"])
+    acquire(sources, retries=0)
+    stub.requests = []
+    results = acquire(sources, retries=0)
+
+    assert 'up to date' in results[0][2]
+    assert not file_requests(stub, "a.csv")
+
+def test_checksum_mismatch_fails_and_leaves_nothing(server, tmp_path):
+    stub, base = server
+    stub.files = {"a.csv": b"x" * 1_000}
+    results = acquire([HttpFile(f"{base}/a.csv", tmp_path / "a.csv", sha256="0" * 64)],
+                      retries=1, backoff=0.01)
+
+    assert results[0][1] == 'failed' and 'ChecksumError' in results[0][2]
+    assert not list(tmp_path.iterdir())
+
+def test_404_fails_without_retries(server, tmp_path):
+    stub, base = server
+    results = acquire([HttpFile(f"{base}/missing.csv", tmp_path / "missing.csv")],
+                      retries=3, backoff=0.01)
+
+    assert results[0][1] == 'failed'
+    assert len(file_requests(stub, "missing.csv")) == 1
+
+def test_503_is_retried(server, tmp_path):
+    stub, base = server
+    stub.files = {"a.csv": b"x" * 1_000}
+    stub.fail_first = {"a.csv": 2}
+    results = acquire([HttpFile(f"{base}/a.csv", tmp_path / "a.csv")], retries=3, backoff=0.01)
+
+    assert results[0][1] == 'ok'
+    assert len(file_requests(stub, "a.csv")) == 3
+
+def test_concurrency_bound_is_respected(server, tmp_path):
+    stub, base = server
+    stub.files = {f"f{i}.csv": b"x" * 1_000 for i in range(8)}
+    stub.latency = 0.05
+    results = acquire(mirror_sources(base, tmp_path, names=list(stub.files), checksums=False),
+                      concurrency=3, retries=0)
+
+    assert all(status == 'ok' for _, status, _, _ in results)
+    assert 1 < stub.max_in_flight <= 3
+
+def weekdays(start, end):
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            yield day
+        day += timedelta(days=1)
+
+def test_ohlcv_refresh_appends_only_new_dates(server, tmp_path):
+    stub, base = server
+    today = date.today()
+    days = list(weekdays(today - timedelta(days=60), today))
+    stub.bars = {"SLV": {day: 20.0 + i for i, day in enumerate(days[:-10])}}
+    sources = ohlcv_sources(["SLV"], tmp_path, f"{base}/ohlcv/{{symbol}}"
+                            "?period1={period1}&period2={period2}", start=str(days[0]))
+    path = tmp_path / "SLV.csv"
+
+    acquire(sources, retries=0)
+    first = path.read_text().splitlines()
+    assert len(first) == len(days) - 10 + 1
+
+    stub.bars["SLV"].update({day: 20.0 + len(days) + i for i, day in enumerate(days[-10:])})
+    acquire(sources, retries=0)
+    second = path.read_text().splitlines()
+    assert second[:len(first)] == first
+    assert len(second) == len(days) + 1
+    assert last_csv_date(path) == str(days[-1])
+    assert len({line.split(',')[0] for line in second}) == len(second)
@@ -0,0 +1,78 @@
+# Model Artifacts
+# The memory-mapped feature-matrix cache behind cached_dataset()
+
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from features import columnar
+from features.feature_store import save_features
+from features.targets import compute_targets
+from models import artifacts, baseline
+from synthetic import random_walk
+
+ROWS = 300
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A synthetic feature store with 1-day and 5-day targets"""
+    def build(seed=42):
+        prices = random_walk(ROWS, seed=seed)
+        dates = [str(date(2020, 1, 1) + timedelta(days=i)) for i in range(ROWS)]
+        features = columnar.compute_features(prices)
+        features.update(compute_targets(prices, (5,)))
+        save_features(tmp_path / "store", dates, features)
+    build()
+    monkeypatch.setattr(baseline, 'FEATURE_STORE', tmp_path / "store")
+    return build
+
+def entries(directory):
+    return sorted(path.name.split('-')[0] for path in directory.iterdir())
+
+def test_matrices_are_cached_per_target(store, tmp_path):
+    cache = tmp_path / "matrices"
+    X, y, dates = artifacts.cached_dataset('target', cache)
+    artifacts.cached_dataset('target_5d', cache)
+    assert entries(cache) == ['target', 'target_5d']
+
+    # A second run for either target maps the cached arrays instead of rebuilding
+    X2, y2, dates2 = artifacts.cached_dataset('target', cache)
+    assert isinstance(X2, np.memmap)
+    assert np.array_equal(X, X2) and np.array_equal(y, y2) and dates == dates2
+    assert entries(cache) == ['target', 'target_5d']
+
+def test_changed_store_replaces_only_that_targets_matrix(store, tmp_path):
+    cache = tmp_path / "matrices"
+    artifacts.cached_dataset('target', cache)
+    artifacts.cached_dataset('target_5d', cache)
+    old = {path.name for path in cache.iterdir()}
+
+    store(seed=7)
+    X, _, _ = artifacts.cached_dataset('target', cache)
+    names = {path.name for path in cache.iterdir()}
+    assert entries(cache) == ['target', 'target_5d']
+    assert len(names - old) == 1 and next(iter(names - old)).startswith('target-')
+    assert not isinstance(X, np.memmap)  # Rebuilt from the new store
+
+def test_no_temp_directories_left_behind(store, tmp_path):
+    cache = tmp_path / "matrices"
+    artifacts.cached_dataset('target', cache)
+    assert not [path for path in cache.iterdir() if path.name.startswith('.')]
+
+@pytest.mark.parametrize('model', ['lr', 'rf'])
+def test_stored_model_predicts_like_the_fitted_one(model, tmp_path):
+    pytest.importorskip("sklearn")
+    from models.train import build_estimator
+
+    rng = np.random.default_rng(5)
+    X = rng.standard_normal((400, 4)) * [1.0, 10.0, 0.1, 50.0] + [0.0, 50.0, 0.0, 15.0]
+    y = (X[:, 0] + 0.1 * X[:, 1] + rng.standard_normal(400) > 5).astype(np.int8)
+    estimator = build_estimator(model, {}).fit(X[:300], y[:300])
+    spec = artifacts.feature_spec(['a', 'b', 'c', 'd'])
+    stored = artifacts.save_artifact(estimator, model, {}, spec, X[:300], y[:300], tmp_path)
+
+    loaded = artifacts.Artifact(stored.path)
+    assert np.array_equal(loaded.predict(X[300:]), estimator.predict(X[300:]))
+    assert np.allclose(loaded.predict_proba(X[300:]), estimator.predict_proba(X[300:])[:, 1])
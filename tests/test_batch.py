@@ -0,0 +1,51 @@
+# Batch Feature Generation
+# A ragged universe built across workers: every symbol's partition holds
+# the same features as computing that series on its own, and a subset
+# rebuild leaves the other symbols in the manifest
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from features import columnar
+from features.batch import build_universe, matrix_sources
+from features.build_features import FEATURE_NAMES
+from features.feature_store import PartitionedStore, days_to_date
+from synthetic import random_walk
+
+ROWS = 400
+
+def test_ragged_universe_matches_single_series(tmp_path):
+    dates = [days_to_date(d) for d in range(10_000, 10_000 + ROWS)]
+    matrix = [[float('nan')] * (i * 50) + random_walk(ROWS - i * 50, seed=i) for i in range(4)]
+    matrix[1][200] = float('nan')  # A day one symbol did not trade
+    symbols = [f"SYM{i}" for i in range(4)]
+    sources = matrix_sources(symbols, dates, matrix)
+    build_universe(sources, tmp_path, workers=2)
+
+    store = PartitionedStore(tmp_path)
+    assert store.symbols == symbols
+    assert len(store) == sum(len(prices) for _, prices in sources.values())
+    for symbol, (days, prices) in sources.items():
+        expected = columnar.compute_features(prices)
+        partition = store.columns(FEATURE_NAMES, [symbol])[symbol]
+        for name in FEATURE_NAMES:
+            assert np.allclose(partition[name], expected[name], rtol=0, atol=1e-8), (symbol, name)
+
+def test_subset_rebuild_keeps_the_other_symbols(tmp_path):
+    dates = [days_to_date(d) for d in range(10_000, 10_000 + ROWS)]
+    symbols = [f"SYM{i}" for i in range(3)]
+    build_universe(matrix_sources(symbols, dates, [random_walk(ROWS, seed=i) for i in range(3)]),
+                   tmp_path, workers=1)
+    before = PartitionedStore(tmp_path).columns(['price'])
+
+    # As batch.py --symbols SYM1 with a shorter history for it
+    build_universe(matrix_sources(['SYM1'], dates[:100], [random_walk(100, seed=9)]), tmp_path, workers=1)
+
+    store = PartitionedStore(tmp_path)
+    assert store.symbols == symbols
+    assert {s: e['rows'] for s, e in store.manifest['symbols'].items()} == {'SYM0': ROWS, 'SYM1': 100, 'SYM2': ROWS}
+    after = store.columns(['price'])
+    for symbol in ['SYM0', 'SYM2']:
+        assert np.array_equal(after[symbol]['price'], before[symbol]['price'])
+    assert np.allclose(after['SYM1']['price'], random_walk(100, seed=9))
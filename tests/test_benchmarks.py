@@ -0,0 +1,50 @@
+# Benchmark Regression Suite
+# Every hot-path case of scripts/benchmark_regression.py, timed against the
+# saved baseline. Skipped unless pytest runs with --benchmarks; record the
+# baseline first with `python scripts/benchmark_regression.py --save`
+
+import contextlib
+import io
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from benchmark_regression import BASELINE_FILE, THRESHOLD, best_time, cases, compare
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = [1_000, 100_000]
+REPEAT = 5
+
+@pytest.fixture(scope='module')
+def baseline():
+    if not BASELINE_FILE.exists():
+        pytest.skip(f"no baseline at {BASELINE_FILE} (run scripts/benchmark_regression.py --save)")
+    with open(BASELINE_FILE, 'r') as f:
+        return json.load(f)['timings']
+
+def time_cases(n, workdir, keys=None):
+    timings = {}
+    for name, function in cases(n, workdir):
+        if keys is not None and f"{name}@{n}" not in keys:
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            timings[f"{name}@{n}"] = best_time(function, REPEAT)
+    return timings
+
+@pytest.mark.parametrize('n', SIZES)
+def test_no_case_slower_than_baseline(n, baseline, tmp_path):
+    timings = time_cases(n, tmp_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        regressions = compare(timings, baseline)
+    if regressions:
+        # Re-time slow cases once so a noisy neighbour does not fail the run
+        retimed = time_cases(n, tmp_path, set(regressions))
+        retimed = {key: min(seconds, timings[key]) for key, seconds in retimed.items()}
+        with contextlib.redirect_stdout(io.StringIO()):
+            regressions = compare(retimed, baseline)
+        timings.update(retimed)
+    assert not regressions, (f"more than {THRESHOLD:.0%} slower than the baseline: " + ", ".join(
+        f"{key} {baseline[key]:.4f}s -> {timings[key]:.4f}s" for key in regressions))
@@ -0,0 +1,81 @@
+# Incremental Feature Updates
+# Building N bars and appending M more with --incremental must give the
+# same store and exports as a full rebuild over all N+M bars
+
+import csv
+import functools
+import gzip
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmark_regression import gbm_ohlcv, write_ohlcv_csv
+from features import build_features
+from features.feature_store import FeatureStore
+from features.registry import FeatureCache
+
+N, M = 300, 25
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    """Point the phase-3 paths at a temp dir; returns the raw file's lines"""
+    write_ohlcv_csv(tmp_path / "all.csv", gbm_ohlcv(N + M))
+    lines = (tmp_path / "all.csv").read_text().splitlines(keepends=True)
+    (tmp_path / "raw.csv").write_text("".join(lines[:N + 1]))
+
+    monkeypatch.setattr(build_features, 'RAW_DATA', tmp_path / "raw.csv")
+    monkeypatch.setattr(build_features, 'PROCESSED_DATA', tmp_path / "features.csv")
+    monkeypatch.setattr(build_features, 'FEATURE_STORE', tmp_path / "store")
+    monkeypatch.setattr(build_features, 'STATE_FILE', tmp_path / "state.json")
+    monkeypatch.setattr(build_features, 'FeatureCache', functools.partial(FeatureCache, tmp_path / "cache"))
+    return tmp_path, lines[N + 1:]
+
+def read_csv(path):
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    return rows[0], [row[0] for row in rows[1:]], np.array([row[1:] for row in rows[1:]], dtype=float)
+
+@pytest.mark.parametrize('horizons', [(), (5,)])
+def test_incremental_matches_full_rebuild(paths, monkeypatch, capsys, horizons):
+    tmp_path, new_lines = paths
+    build_features.engineer_features(csv_export=True, horizons=horizons)
+    FeatureStore(tmp_path / "store").to_csv(tmp_path / "features.csv.gz")
+
+    # Two appends: the second starts from the state the first saved
+    with open(tmp_path / "raw.csv", 'a') as f:
+        f.write("".join(new_lines[:10]))
+    build_features.update_features()
+    with open(tmp_path / "raw.csv", 'a') as f:
+        f.write("".join(new_lines[10:]))
+    build_features.update_features()
+    output = capsys.readouterr().out
+    assert "full rebuild" not in output and output.count("Appended") == 2
+
+    monkeypatch.setattr(build_features, 'FEATURE_STORE', tmp_path / "full")
+    monkeypatch.setattr(build_features, 'PROCESSED_DATA', tmp_path / "full.csv")
+    build_features.engineer_features(csv_export=True, horizons=horizons)
+
+    incremental, full = FeatureStore(tmp_path / "store"), FeatureStore(tmp_path / "full")
+    assert incremental.names == full.names and len(incremental) == len(full) == N + M
+    for name in full.names:
+        expected, actual = np.asarray(full.column(name)), np.asarray(incremental.column(name))
+        if name == 'date' or name.startswith('target'):
+            assert np.array_equal(actual, expected), name
+        else:
+            assert np.allclose(actual, expected, rtol=1e-12, atol=1e-9, equal_nan=True), name
+
+    header, dates, values = read_csv(tmp_path / "features.csv")
+    full_header, full_dates, full_values = read_csv(tmp_path / "full.csv")
+    assert header == full_header and dates == full_dates
+    assert np.allclose(values, full_values, rtol=1e-12, atol=1e-9, equal_nan=True)
+    assert gzip.decompress((tmp_path / "features.csv.gz").read_bytes()) == \
+        (tmp_path / "features.csv").read_bytes()
+
+def test_no_new_bars_is_a_no_op(paths):
+    tmp_path, _ = paths
+    build_features.engineer_features(csv_export=True)
+    before = (tmp_path / "features.csv").read_bytes()
+    build_features.update_features()
+    assert (tmp_path / "features.csv").read_bytes() == before
+    assert len(FeatureStore(tmp_path / "store")) == N
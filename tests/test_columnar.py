@@ -0,0 +1,61 @@
+# Columnar Backend Parity
+# The NumPy indicators must match the pure-Python list indicators
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from features import columnar
+from features.build_features import FEATURE_NAMES, compute_features
+from synthetic import random_walk
+
+TOLERANCE = 1e-8
+
+SERIES = {
+    'random_walk': random_walk(500),
+    'flat': [25.0] * 80,
+    # 0.1 + 0.2 != 0.3: windows that are flat up to one ulp
+    'near_flat': [0.1 + 0.2] * 30 + [0.3] * 30,
+    'flat_then_walk': [20.0] * 40 + random_walk(60, seed=7, start=20.0),
+    'steady_rise': [10.0 + 0.5 * i for i in range(60)],  # No losses: RSI 100
+    'single': [18.0],
+    'shorter_than_rsi': random_walk(14),
+    'shorter_than_bands': random_walk(19),
+    'exactly_bands': random_walk(20),
+    'shorter_than_sma_50': random_walk(49),
+}
+
+@pytest.mark.parametrize('name', SERIES)
+def test_backends_agree(name):
+    prices = SERIES[name]
+    expected = compute_features(prices)
+    actual = columnar.compute_features(prices)
+    for column in FEATURE_NAMES:
+        got = actual[column].tolist()
+        assert len(got) == len(expected[column]), column
+        if column == 'target':
+            assert got == list(expected[column])
+        else:
+            assert got == pytest.approx(expected[column], rel=0, abs=TOLERANCE), column
+
+def test_near_flat_windows_have_no_spread():
+    prices = columnar.as_array(SERIES['near_flat'])
+    assert not columnar.calculate_bollinger_bands(prices, 20).any()
+    assert not columnar.calculate_volatility(prices, 30).any()
+
+@pytest.mark.parametrize('window', [1, 5, 14, 50, 200])
+def test_window_sums_match_direct_sums(window):
+    values = np.array(random_walk(1_000, seed=window))
+    sums = columnar._window_sums(values, window)
+    direct = [math.fsum(values[k:k + window]) for k in range(len(values) - window + 1)]
+    assert sums.tolist() == pytest.approx(direct, rel=1e-12)
+
+def test_window_sums_of_zeros_are_exact():
+    values = np.array([0.0] * 30 + [0.3, 0.1] + [0.0] * 30)
+    sums = columnar._window_sums(values, 14)
+    assert sums[0] == 0.0 and sums[-1] == 0.0
+
+def test_window_sums_shorter_than_window():
+    assert len(columnar._window_sums(np.ones(3), 5)) == 0
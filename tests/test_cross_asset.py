@@ -0,0 +1,120 @@
+# Cross-Asset Features
+# Date joins across calendars, NaN handling in the intraday aggregation,
+# and the pair features against a direct computation
+
+import csv
+import math
+import statistics
+from datetime import date, timedelta
+
+import pytest
+
+from features import cross_asset
+from features.cross_asset import closes, daily_bars, merge_join, pair_features
+from synthetic import random_walk
+
+NAN = float('nan')
+
+def trading_days(n, start=date(2024, 1, 1), skip=()):
+    """n ISO weekdays from `start`, leaving out the dates in `skip`"""
+    days, day = [], start
+    while len(days) < n:
+        if day.weekday() < 5 and day.isoformat() not in skip:
+            days.append(day.isoformat())
+        day += timedelta(days=1)
+    return days
+
+def write_closes(path, dates, prices):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Date', 'Close'])
+        writer.writerows(zip(dates, prices))
+
+def test_merge_join_keeps_only_common_dates():
+    a = [('2024-01-01', 1.0), ('2024-01-02', 2.0), ('2024-01-04', 4.0), ('2024-01-05', 5.0)]
+    b = [('2024-01-02', 20.0), ('2024-01-03', 30.0), ('2024-01-05', 50.0), ('2024-01-08', 80.0)]
+    c = [('2024-01-01', 100.0), ('2024-01-02', 200.0), ('2024-01-05', 500.0)]
+
+    assert list(merge_join(a, b)) == [('2024-01-02', 2.0, 20.0), ('2024-01-05', 5.0, 50.0)]
+    assert list(merge_join(a, b, c)) == [('2024-01-02', 2.0, 20.0, 200.0),
+                                         ('2024-01-05', 5.0, 50.0, 500.0)]
+    assert list(merge_join(a, [])) == []
+
+def test_merge_join_is_lazy():
+    def endless():
+        day = date(2024, 1, 1)
+        while True:
+            yield day.isoformat(), 1.0
+            day += timedelta(days=1)
+
+    short = [('2024-01-03', 3.0), ('2024-01-04', 4.0)]
+    assert list(merge_join(short, endless())) == [('2024-01-03', 3.0, 1.0), ('2024-01-04', 4.0, 1.0)]
+
+def test_daily_bars_skip_nan_rows():
+    rows = [
+        ('2024-01-02 09:30', 10.0, 11.0, 9.5, 10.5, 100.0),
+        ('2024-01-02 09:31', 10.5, NAN, 10.0, 10.2, 50.0),
+        ('2024-01-02 09:32', 10.2, 10.8, 9.0, 10.4, 70.0),
+        ('2024-01-02 15:59', 10.4, 10.6, 10.1, NAN, 10.0),
+        ('2024-01-03 09:30', NAN, 12.0, 11.0, 11.5, 1.0),
+        ('2024-01-03 09:31', 11.5, 12.5, 11.2, 12.0, 30.0),
+    ]
+    assert list(daily_bars(rows)) == [
+        ('2024-01-02', 10.0, 11.0, 9.0, 10.4, 170.0),
+        ('2024-01-03', 11.5, 12.5, 11.2, 12.0, 30.0),
+    ]
+    assert list(daily_bars([('2024-01-02 09:30', NAN, NAN, NAN, NAN, NAN)])) == []
+
+def test_closes_skip_nan(tmp_path):
+    path = tmp_path / 'prices.csv'
+    write_closes(path, ['2024-01-01', '2024-01-02', '2024-01-03'], [1.0, 'nan', 3.0])
+    assert list(closes(path)) == [('2024-01-01', 1.0), ('2024-01-03', 3.0)]
+
+def test_pair_features_match_direct_computation():
+    window = 10
+    dates = trading_days(40)
+    base, other = random_walk(40, seed=1), random_walk(40, seed=2, start=1800.0)
+    rows = list(pair_features(zip(dates, base, other), window))
+
+    assert [row[0] for row in rows] == dates
+    assert [row[1] for row in rows] == pytest.approx([o / b for b, o in zip(base, other)])
+    # Warm-up: `window` returns need window + 1 prices
+    assert all(row[2:] == (0.0, 0.0) for row in rows[:window])
+
+    base_returns = [(b1 - b0) / b0 * 100 for b0, b1 in zip(base, base[1:])]
+    other_returns = [(o1 - o0) / o0 * 100 for o0, o1 in zip(other, other[1:])]
+    for i in range(window, len(rows)):
+        x, y = base_returns[i - window:i], other_returns[i - window:i]
+        beta = statistics.covariance(x, y) / statistics.variance(y)
+        assert rows[i][2] == pytest.approx(statistics.correlation(x, y), abs=1e-9)
+        assert rows[i][3] == pytest.approx(beta, abs=1e-9)
+
+def test_two_symbol_join_into_store(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    from features.feature_store import FeatureStore
+
+    # Different holiday calendars and a bad close on one side
+    silver_dates = trading_days(60, skip={'2024-01-15', '2024-02-19'})
+    gold_dates = trading_days(60, skip={'2024-01-01', '2024-02-19'})
+    silver, gold = random_walk(60, seed=3), random_walk(60, seed=4, start=2000.0)
+    gold_written = list(gold)
+    gold_written[20] = 'nan'
+    write_closes(tmp_path / 'silver.csv', silver_dates, silver)
+    write_closes(tmp_path / 'gold.csv', gold_dates, gold_written)
+
+    gold_closes = {d: p for i, (d, p) in enumerate(zip(gold_dates, gold)) if i != 20}
+    common = [(d, s, gold_closes[d]) for d, s in zip(silver_dates, silver) if d in gold_closes]
+    expected = list(pair_features(common, window=5))
+
+    # Small blocks so the store is written with both save and append
+    monkeypatch.setattr(cross_asset, 'WRITE_ROWS', 16)
+    store_dir = tmp_path / 'cross_asset'
+    joined = merge_join(closes(tmp_path / 'silver.csv'), closes(tmp_path / 'gold.csv'))
+    count = cross_asset.write_pair_features(pair_features(joined, window=5), store_dir, window=5)
+
+    store = FeatureStore(store_dir)
+    assert count == len(store) == len(common)
+    assert store.dates() == [d for d, _, _ in common]
+    for i, name in enumerate(['ratio', 'corr_5', 'beta_5']):
+        assert store.column(name).tolist() == pytest.approx([row[i + 1] for row in expected])
+    assert not any(math.isnan(v) for v in store.column('corr_5').tolist())
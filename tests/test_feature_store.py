@@ -0,0 +1,72 @@
+# Feature Store Appends
+# An append that fails part-way must leave every column at the manifest's
+# row count, with backfilled labels restored
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from features import feature_store
+from features.feature_store import FeatureStore, append_features, days_to_date, save_features
+
+ROWS = 50
+
+@pytest.fixture
+def store(tmp_path):
+    dates = [days_to_date(d) for d in range(ROWS)]
+    save_features(tmp_path, dates, {
+        'price': np.linspace(10, 20, ROWS),
+        'sma_5': np.linspace(9, 19, ROWS),
+        'target': np.r_[np.ones(ROWS - 1), -1].astype(np.int8),
+    })
+    return tmp_path
+
+def new_rows(count=3, start=ROWS):
+    dates = [days_to_date(d) for d in range(start, start + count)]
+    return dates, {'price': [21.0] * count, 'sma_5': [20.0] * count, 'target': [1] * (count - 1) + [-1]}
+
+def snapshot(directory):
+    store = FeatureStore(directory)
+    return len(store), {name: np.load(store.path(name)).tolist() for name in store.names}
+
+def test_failed_append_rolls_back_every_column(store, monkeypatch):
+    before = snapshot(store)
+    written = []
+    real = feature_store.append_column
+
+    def failing(path, values, length=None):
+        if values and len(written) == 2:
+            raise OSError("disk full")
+        written.append(path)
+        return real(path, values, length)
+
+    monkeypatch.setattr(feature_store, 'append_column', failing)
+    with pytest.raises(OSError, match="disk full"):
+        append_features(store, *new_rows(), backfill_target=0)
+    assert snapshot(store) == before  # Lengths, values and the old -1 target
+
+    monkeypatch.setattr(feature_store, 'append_column', real)
+    append_features(store, *new_rows(), backfill_target=0)
+    rows, columns = snapshot(store)
+    assert rows == ROWS + 3 and all(len(values) == ROWS + 3 for values in columns.values())
+    assert columns['target'][ROWS - 1:] == [0, 1, 1, -1]
+
+def test_mismatched_lengths_are_rejected_before_writing(store):
+    before = snapshot(store)
+    dates, features = new_rows()
+    features['sma_5'] = features['sma_5'][:2]
+    with pytest.raises(ValueError, match="sma_5"):
+        append_features(store, dates, features)
+    with pytest.raises(KeyError):
+        append_features(store, dates, {'price': features['price']})
+    assert snapshot(store) == before
+
+def test_rows_past_the_manifest_are_ignored_and_overwritten(store):
+    # An append killed before the manifest moved: one column is already longer
+    feature_store.append_column(FeatureStore(store).path('price'), [99.0, 99.0])
+    view = FeatureStore(store)
+    assert len(view.column('price')) == ROWS and view.column('price')[-1] == 20.0
+
+    append_features(store, *new_rows())
+    rows, columns = snapshot(store)
+    assert rows == ROWS + 3 and columns['price'][ROWS:] == [21.0] * 3
@@ -0,0 +1,25 @@
+# Feature Registry
+# Parsing of parameterised feature names
+
+import pytest
+
+from features.build_features import feature_registry
+
+@pytest.mark.parametrize('name, kind, params', [
+    ('sma_200', 'sma', {'window': 200}),
+    ('rsi', 'rsi', {'period': 14}),
+    ('bb_distance_10', 'bb_distance', {'window': 10}),
+])
+def test_parse_parameterised_names(name, kind, params):
+    spec = feature_registry().parse(name)
+    assert (spec.kind, spec.params) == (kind, params)
+
+@pytest.mark.parametrize('name', ['rsi_0', 'lag_0', 'sma_0', 'momentum_0', 'volatility_00'])
+def test_parse_rejects_zero_parameters(name):
+    with pytest.raises(ValueError, match="at least 1"):
+        feature_registry().parse(name)
+
+@pytest.mark.parametrize('name', ['sma', 'lag', 'macd_12'])
+def test_parse_rejects_missing_or_unknown(name):
+    with pytest.raises(ValueError):
+        feature_registry().parse(name)
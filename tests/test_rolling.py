@@ -0,0 +1,63 @@
+# Rolling Indicator Engine
+# The O(n) rolling indicators must match the original implementations
+# that recompute every window from scratch
+
+import pytest
+
+from features.build_features import (
+    calculate_sma, calculate_rsi, calculate_bollinger_bands, calculate_volatility
+)
+from synthetic import random_walk
+
+TOLERANCE = 1e-8
+
+# Reference implementations: O(n*window), one window recomputed per row
+
+def reference_sma(prices, window):
+    return [0.0 if i < window - 1 else sum(prices[i-window+1:i+1]) / window
+            for i in range(len(prices))]
+
+def reference_rsi(prices, period=14):
+    rsi = []
+    for i in range(len(prices)):
+        if i < period:
+            rsi.append(50.0)
+            continue
+        changes = [prices[j] - prices[j-1] for j in range(i-period+1, i+1)]
+        avg_gain = sum(c for c in changes if c > 0) / period
+        avg_loss = sum(-c for c in changes if c <= 0) / period
+        rsi.append(100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss))
+    return rsi
+
+def reference_std(prices, window):
+    out = []
+    for i in range(len(prices)):
+        if i < window - 1:
+            out.append(0.0)
+            continue
+        w = prices[i-window+1:i+1]
+        mean = sum(w) / window
+        out.append((sum((p - mean) ** 2 for p in w) / window) ** 0.5)
+    return out
+
+def reference_bollinger(prices, window=20):
+    std = reference_std(prices, window)
+    sma = reference_sma(prices, window)
+    return [0.0 if i < window - 1 or std[i] == 0 else (prices[i] - sma[i]) / std[i]
+            for i in range(len(prices))]
+
+CASES = {
+    'sma_50': (lambda p: calculate_sma(p, 50), lambda p: reference_sma(p, 50)),
+    'rsi_14': (lambda p: calculate_rsi(p, 14), lambda p: reference_rsi(p, 14)),
+    'bollinger_20': (lambda p: calculate_bollinger_bands(p, 20), lambda p: reference_bollinger(p, 20)),
+    'volatility_30': (lambda p: calculate_volatility(p, 30), lambda p: reference_std(p, 30)),
+}
+
+@pytest.mark.parametrize('n', [1, 14, 15, 49, 50, 5_000])
+@pytest.mark.parametrize('case', CASES)
+def test_rolling_matches_window_recompute(case, n):
+    fast, reference = CASES[case]
+    prices = random_walk(n)
+    result, expected = fast(prices), reference(prices)
+    assert len(result) == len(expected)
+    assert max((abs(x - y) for x, y in zip(result, expected)), default=0.0) <= TOLERANCE
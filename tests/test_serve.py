@@ -0,0 +1,205 @@
+# Scoring Service
+# ScoringService.score() as the in-process client: answers, request
+# validation, per-request failure isolation and timeouts; concurrent
+# clients over every transport get the same answers as a direct predict();
+# /reload keeps the configured model and survives a failed load
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from features import columnar
+from features.build_features import MODEL_FEATURES
+from features.feature_store import save_features
+from models import serve
+from synthetic import random_walk
+
+ROWS = 120
+
+class SignModel:
+    """Up if momentum > 0, like an estimator that rejects huge inputs as sklearn rejects inf"""
+
+    features = ['momentum', 'rsi']
+
+    def __init__(self):
+        self.rows = 0
+        self.gate = None  # Event the next predict() waits for
+
+    def __repr__(self):
+        return "SignModel"
+
+    def stale_reasons(self):
+        return []
+
+    def predict(self, X):
+        if self.gate is not None:
+            self.gate.wait()
+        if (np.abs(X) > 1e9).any():
+            raise ValueError("Input X contains a value too large")
+        self.rows += len(X)
+        return (X[:, 0] > 0).astype(np.int8)
+
+    def predict_proba(self, X):
+        # NaN for one sentinel input, as a degenerate model might produce
+        return np.where(X[:, 1] == 12345.0, np.nan, 0.75)
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A feature store of ROWS synthetic bars; returns its dates"""
+    dates = [str(date(2024, 1, 1) + timedelta(days=i)) for i in range(ROWS)]
+    features = columnar.compute_features(random_walk(ROWS))
+    save_features(tmp_path / "store", dates, {name: features[name] for name in MODEL_FEATURES})
+    monkeypatch.setattr(serve, 'FEATURE_STORE', tmp_path / "store")
+    monkeypatch.setattr(serve, 'load_state', lambda: None)
+    return dates
+
+@pytest.fixture
+def service(store):
+    model = SignModel()
+    service = serve.ScoringService(model, max_batch=16, max_wait=0.01, timeout=None)
+    yield service, model
+    service.close()
+
+def start_server(service, unix=None):
+    """A server for `service` on a free port (or `unix`) running in the background"""
+    server = serve.make_server(service, port=0, unix_socket=unix)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    return server, unix or f"127.0.0.1:{server.server_address[1]}"
+
+def features(**values):
+    return {'features': dict({'momentum': 1.0, 'rsi': 50.0}, **values)}
+
+def test_scores_stored_and_explicit_rows(service, store):
+    service, model = service
+    latest = service.score({})
+    assert latest['date'] == store[-1]
+    row = service.score({'date': store[60]})
+    momentum = service.matrix[service.rows_by_day[serve.date_to_days(store[60])], 0]
+    assert row['direction'] == int(momentum > 0)
+    assert service.score(features(momentum=-2.0))['direction'] == 0
+    assert service.score(features())['p_up'] == 0.75
+
+@pytest.mark.parametrize('request_body, message', [
+    (features(momentum=float('inf')), "non-finite"),
+    (features(rsi=float('nan')), "non-finite"),
+    ({'features': {'momentum': 1.0}}, "missing features"),
+    ({'date': '1999-01-01'}, "no stored features"),
+    ([1, 2], "JSON object"),
+])
+def test_invalid_requests_are_rejected_before_batching(service, request_body, message):
+    service, _ = service
+    with pytest.raises(ValueError, match=message):
+        service.score(request_body)
+
+def test_one_failing_row_does_not_fail_its_batch(service):
+    service, model = service
+    model.gate = threading.Event()
+    service.max_wait = 0.2  # All six requests land in one batch
+    futures = [service.submit(features(momentum=1e12))]  # Finite, but the model rejects it
+    futures += [service.submit({}) for _ in range(5)]
+    model.gate.set()
+
+    with pytest.raises(ValueError, match="too large"):
+        futures[0].result(5)
+    assert all(future.result(5)['batch_size'] == 6 for future in futures[1:])
+    assert service.metrics()['errors'] == 1
+
+def test_nan_probability_is_reported_as_null_json(service):
+    service, _ = service
+    result = service.score(features(rsi=12345.0))
+    assert result['p_up'] is None
+    json.loads(json.dumps(result), parse_constant=lambda name: pytest.fail(f"{name} in JSON"))
+
+def test_timed_out_request_is_not_scored(service):
+    service, model = service
+    model.gate = threading.Event()
+    service.max_batch = 1
+    first = service.submit({})  # Holds the batcher inside predict()
+    service.timeout = 0.05
+    with pytest.raises(FutureTimeoutError):
+        service.score(features())
+    scored = model.rows
+    model.gate.set()
+    first.result(5)
+
+    service.timeout = 5
+    service.score({})
+    assert model.rows == scored + 2  # The first and last requests, not the timed-out one
+    assert service.metrics()['cancelled'] == 1
+
+@pytest.mark.parametrize('transport', ['in-process', 'tcp', 'unix'])
+def test_batched_answers_match_direct_predict(service, store, tmp_path, transport):
+    service, model = service
+    server = address = None
+    if transport != 'in-process':
+        unix = str(tmp_path / "scoring.sock") if transport == 'unix' else None
+        server, address = start_server(service, unix)
+
+    def client(index):
+        connection = serve.ScoringClient(address) if server is not None else None
+        try:
+            requests = [{'date': store[(index * 7 + k) % ROWS]} for k in range(20)]
+            score = service.score if connection is None else connection.predict
+            return [(request['date'], score(request)['direction']) for request in requests]
+        finally:
+            if connection is not None:
+                connection.close()
+
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            answers = [a for per_client in pool.map(client, range(8)) for a in per_client]
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    rows = [service.rows_by_day[serve.date_to_days(date)] for date, _ in answers]
+    assert [direction for _, direction in answers] == model.predict(service.matrix[rows]).tolist()
+    assert service.metrics()['batch_size']['mean'] > 1
+
+@pytest.fixture
+def client(service):
+    service, _ = service
+    server, address = start_server(service)
+    client = serve.ScoringClient(address)
+    yield client
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+def test_failed_reload_keeps_serving_the_current_model(service, client, monkeypatch):
+    service, model = service
+    before = client.health()
+
+    def unreadable(directory):
+        raise OSError("store is being rewritten")
+    monkeypatch.setattr(serve, 'FeatureStore', unreadable)
+    with pytest.raises(ValueError, match="reload failed, still serving SignModel: OSError"):
+        client.reload()
+
+    assert service.model is model
+    assert client.health() == before
+    assert client.predict({})['model'] == "SignModel"
+
+def test_reload_keeps_the_configured_artifact_unless_latest_is_asked(service, client, monkeypatch):
+    service, model = service
+    newer = SignModel()
+    monkeypatch.setattr(serve, 'latest_artifact', lambda: newer)
+
+    client.reload()
+    assert service.model is model
+    client.reload(latest=True)
+    assert service.model is newer
+    client.reload()
+    assert service.model is newer  # The switch sticks for later plain reloads
+
+def test_reload_rejects_a_malformed_request(client):
+    client.connection.request('POST', '/reload', body=b'[1]')
+    response = client.connection.getresponse()
+    assert response.status == 400
+    assert "bad reload request" in json.loads(response.read())['error']
@@ -0,0 +1,44 @@
+# Resampling Significance
+# Block bootstrap and block permutation results: reproducible, independent
+# of the worker count, and sensible for skilled and no-skill signals
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from models.significance import difference_interval, resample_accuracy
+
+BARS = 600
+
+@pytest.fixture
+def signals():
+    """(predictions, actual): one copy of the labels, one 70% right, one random"""
+    rng = np.random.default_rng(3)
+    actual = (rng.standard_normal(BARS) > 0).astype(np.int8)
+    noisy = np.where(rng.random(BARS) < 0.7, actual, 1 - actual)
+    random = (rng.standard_normal(BARS) > 0).astype(np.int8)
+    return np.stack([actual, noisy, random]), actual
+
+def test_results_do_not_depend_on_worker_count(signals):
+    single = resample_accuracy(*signals, replicates=2_500, workers=1)
+    pooled = resample_accuracy(*signals, replicates=2_500, workers=2)
+    for a, b in zip(single, pooled):
+        assert np.array_equal(a['bootstrap'], b['bootstrap'])
+        assert a['p_value'] == b['p_value']
+
+def test_skill_is_significant_and_chance_is_not(signals):
+    perfect, skilled, random = resample_accuracy(*signals, replicates=2_000, workers=1)
+    assert perfect['accuracy'] == 100.0 and perfect['ci_low'] == 100.0
+    assert skilled['ci_low'] < skilled['accuracy'] < skilled['ci_high']
+    assert skilled['p_value'] < 0.01
+    assert abs(random['null_mean'] - 50) < 2 and random['p_value'] > 0.01
+    # Paired replicates: the copy of the labels beats the noisy signal in every one
+    low, high, no_better = difference_interval(perfect, skilled)
+    assert 0 < low <= high and no_better == 0
+
+def test_single_row_and_length_mismatch(signals):
+    predictions, actual = signals
+    (result,) = resample_accuracy(predictions[1], actual, replicates=500, workers=1)
+    assert result['total'] == BARS and result['block'] == round(BARS ** (1 / 3))
+    with pytest.raises(ValueError, match="scored bars"):
+        resample_accuracy(predictions[:, 1:], actual, replicates=500, workers=1)
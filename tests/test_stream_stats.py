@@ -0,0 +1,81 @@
+# Streaming Statistics
+# Welford moments against the statistics module, and quantile-sketch
+# answers within the sketch's stated relative error
+
+import math
+import statistics
+
+import pytest
+
+from data.stream_stats import QuantileSketch, RunningStats, analyze
+from synthetic import random_walk
+
+PRICES = random_walk(20_000)
+QUANTILES = [0.0, 0.01, 0.25, 0.5, 0.75, 0.99, 1.0]
+
+def true_quantile(values, p):
+    """Rank int(n * p) of the sorted sample, as QuantileSketch.quantile() defines it"""
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+@pytest.mark.parametrize('offset', [0.0, 1e9])  # A large offset breaks the naive sum-of-squares formula
+def test_running_stats_match_statistics(offset):
+    values = [price + offset for price in PRICES]
+    stats = RunningStats()
+    for value in values:
+        stats.push(value)
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.fmean(values), rel=1e-12)
+    assert stats.variance() == pytest.approx(statistics.pvariance(values), rel=1e-6)
+    assert (stats.min, stats.max) == (min(values), max(values))
+
+def test_empty_running_stats():
+    assert RunningStats().variance() == 0.0
+
+@pytest.mark.parametrize('accuracy', [1e-2, 1e-4])
+def test_quantiles_within_relative_error(accuracy):
+    sketch = QuantileSketch(accuracy)
+    for price in PRICES:
+        sketch.push(price)
+    for p in QUANTILES:
+        expected = true_quantile(PRICES, p)
+        assert abs(sketch.quantile(p) - expected) <= accuracy * expected * (1 + 1e-9), p
+
+def test_collapsed_sketch_keeps_the_widened_bound():
+    accuracy = 1e-4
+    sketch = QuantileSketch(accuracy, max_buckets=64)
+    for price in PRICES:
+        sketch.push(price)
+    assert len(sketch.buckets) <= 64
+    # Each collapse squares gamma; the bound follows from the final gamma
+    bound = (sketch.gamma - 1) / (sketch.gamma + 1)
+    assert bound > accuracy
+    for p in QUANTILES:
+        expected = true_quantile(PRICES, p)
+        assert abs(sketch.quantile(p) - expected) <= bound * expected * (1 + 1e-9), p
+
+def test_nonpositive_values_and_outside_counts():
+    values = [-2.0, 0.0, 0.0] + [float(v) for v in range(1, 98)]
+    sketch = QuantileSketch(1e-3)
+    for value in values:
+        sketch.push(value)
+    assert sketch.quantile(0.0) == -2.0 and sketch.quantile(0.02) == -2.0  # Shared bucket: the minimum
+    assert sketch.quantile(0.5) == pytest.approx(true_quantile(values, 0.5), rel=1e-3)
+    count, lowest, highest = sketch.outside(0.5, 90.5)
+    assert count == 3 + 7 and lowest == -2.0 and highest == pytest.approx(97.0, rel=1e-3)
+    assert math.isnan(QuantileSketch().quantile(0.5))
+
+def test_analyze_matches_direct_computation():
+    rows = [(f"day-{i}", price) for i, price in enumerate(PRICES[:2_000])]
+    prices = PRICES[:2_000]
+    report = analyze(rows)
+    returns = [(b - a) / a * 100 for a, b in zip(prices, prices[1:])]
+    assert report['count'] == len(prices) and report['returns'] == len(returns)
+    assert report['mean'] == pytest.approx(statistics.fmean(prices), rel=1e-12)
+    assert report['std'] == pytest.approx(statistics.pstdev(prices), rel=1e-9)
+    assert report['return_std'] == pytest.approx(statistics.pstdev(returns), rel=1e-9)
+    assert report['median'] == pytest.approx(true_quantile(prices, 0.5), rel=1e-4)
+    assert report['positive_days'] == sum(b > a for a, b in zip(prices, prices[1:]))
+    ups = [b > a for a, b in zip(prices, prices[1:])]
+    same = sum(x == y for x, y in zip(ups, ups[1:]))
+    assert report['persistence_accuracy'] == pytest.approx(same / (len(prices) - 2) * 100)
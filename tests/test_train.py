@@ -0,0 +1,26 @@
+# Model Search
+# Candidate ids key the resumable search log: logged scores may only be
+# reused for the same folds, labels and training rows
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from models.artifacts import data_fingerprint
+from models.train import candidates
+
+FOLDS = [(0, 500, 501, 627)]
+
+def ids(*args, **kwargs):
+    return [spec['id'] for spec in candidates(['lr'], 'all', *args, **kwargs)]
+
+def test_ids_are_stable():
+    assert ids(FOLDS, 'target', 'abc') == ids(FOLDS, 'target', 'abc')
+    assert len(set(ids(FOLDS, 'target', 'abc'))) == len(ids(FOLDS, 'target', 'abc'))
+
+def test_ids_depend_on_folds_target_and_data():
+    X, y = np.arange(20.0).reshape(10, 2), np.arange(10) % 2
+    base = ids(FOLDS, 'target', data_fingerprint(X, y))
+    assert set(base).isdisjoint(ids([(0, 400, 401, 527)], 'target', data_fingerprint(X, y)))
+    assert set(base).isdisjoint(ids(FOLDS, 'target_5d', data_fingerprint(X, y)))
+    assert set(base).isdisjoint(ids(FOLDS, 'target', data_fingerprint(X + 1e-9, y)))
@@ -0,0 +1,90 @@
+# Data Quality Validation
+# Row checks, calendar gaps and the mapping of skipped rows onto the
+# loader's table, which has already dropped rows with unparseable dates
+
+import math
+
+import pytest
+
+from data.loader import load_table
+from data.validate import RowValidator, missing_weekdays, skipped_table_rows, validate
+from features.build_features import load_prices
+from features.feature_store import date_to_days
+
+ROWS = [
+    ("2024-01-01", "10"),      # 0  Monday
+    ("2024-01-02", "10.1"),    # 1
+    ("not-a-date", "10.2"),    # 2  bad_date
+    ("2024-01-03", "nan"),     # 3  missing_price
+    ("2024-01-03", "10.3"),    # 4
+    ("2024-01-03", "10.4"),    # 5  duplicate
+    ("2024-01-02", "10.5"),    # 6  out_of_order
+    ("2024-01-04", "0"),       # 7  nonpositive_price
+    ("2024-01-04", "-1"),      # 8  nonpositive_price
+    ("", "10.6"),              # 9  bad_date
+    ("2024-01-04", "14.0"),    # 10 spike, kept
+    ("2024-01-05", ""),        # 11 missing_price
+    ("2024-01-15", "14.1"),    # 12 after a 6-weekday gap
+    ("2024-01-16", "14.2"),    # 13
+    ("2024-01-17", "inf"),     # 14 nonpositive_price
+]
+GOOD = [0, 1, 4, 10, 12, 13]
+
+@pytest.fixture
+def raw(tmp_path):
+    path = tmp_path / "prices.csv"
+    path.write_text("Date,Close\n" + "".join(f"{d},{p}\n" for d, p in ROWS))
+    return path
+
+def test_report_flags_each_problem(raw):
+    report = validate(raw)
+    assert report['issues'] == {
+        'bad_date': [2, 9], 'out_of_order': [6], 'duplicate': [5],
+        'missing_price': [3, 11], 'nonpositive_price': [7, 8, 14], 'spike': [10],
+    }
+    assert report['rows'] == len(ROWS) and report['valid_rows'] == len(GOOD)
+    assert report['skip'] == sorted(set(range(len(ROWS))) - set(GOOD))
+    assert report['spikes'] == [{'row': 10, 'date': "2024-01-04", 'return': pytest.approx(14.0 / 10.3 - 1)}]
+    assert report['gaps'] == [{'row': 12, 'after': "2024-01-04", 'before': "2024-01-15", 'missing_weekdays': 6}]
+    assert (report['first_date'], report['last_date']) == ("2024-01-01", "2024-01-16")
+
+def test_skipped_rows_map_onto_the_loader_table(raw):
+    report = validate(raw)
+    table = load_table(raw, use_cache=False)
+    assert table.skipped == len(report['issues']['bad_date'])
+
+    # Table positions of the non-date errors point at exactly those raw rows
+    with_dates = [i for i in range(len(ROWS)) if i not in report['issues']['bad_date']]
+    positions = skipped_table_rows(report)
+    assert [with_dates[p] for p in positions] == [i for i in report['skip'] if i in with_dates]
+    dates, closes = table.dates(), list(table.column('Close'))
+    for p in positions:
+        raw_date, raw_price = ROWS[with_dates[p]]
+        assert dates[p] == raw_date
+        assert closes[p] == float(raw_price or 'nan') or math.isnan(closes[p])
+
+def test_load_prices_keeps_only_good_rows(raw):
+    dates, prices = load_prices(raw)
+    assert dates == [ROWS[i][0] for i in GOOD]
+    assert prices == [float(ROWS[i][1]) for i in GOOD]
+
+def test_skip_mapping_with_leading_and_adjacent_bad_dates():
+    report = {'skip': [0, 1, 3, 4, 7], 'issues': {'bad_date': [0, 1, 4]}}
+    # Rows 0, 1 and 4 never reach the table; 3 and 7 sit at positions 1 and 4
+    assert skipped_table_rows(report) == [1, 4]
+
+def test_validator_continues_from_saved_state():
+    validator = RowValidator(last_day=date_to_days("2024-01-05"), last_price=10.0)
+    assert validator.check(0, "2024-01-05", "10.1") == 'duplicate'
+    assert validator.check(1, "2024-01-08", "20.0") is None  # Weekend only: no gap
+    assert validator.issues['spike'] == [1] and validator.gaps == []
+
+@pytest.mark.parametrize('start, end, expected', [
+    ("2024-01-05", "2024-01-08", 0),   # Friday -> Monday
+    ("2024-01-01", "2024-01-02", 0),
+    ("2024-01-01", "2024-01-05", 3),
+    ("2024-01-04", "2024-01-15", 6),
+    ("2024-01-01", "2024-03-01", 43),
+])
+def test_missing_weekdays(start, end, expected):
+    assert missing_weekdays(date_to_days(start), date_to_days(end)) == expected